@@ -0,0 +1,222 @@
+# ==========================================
+# 🚨 ENVOI DES ALERTES GRAAL EN ARRIÈRE-PLAN
+# ==========================================
+# Le formulaire "ALERTE-MOI" ne parle plus au serveur SMTP pendant l'exécution de la page :
+# l'alerte est écrite dans un fichier d'attente (une ligne JSON par événement), puis confiée
+# à un fil d'envoi unique par processus (st.cache_resource).
+#  - la connexion SMTP est gardée ouverte entre deux envois, puis fermée après inactivité ;
+#  - un échec d'envoi est reprogrammé avec un délai croissant (2 s, 4 s, 8 s...) : le fil ne dort
+#    pas, les alertes suivantes partent en attendant (une panne SMTP ne bloque pas toute la file) ;
+#  - une alerte n'est retirée du fichier qu'une fois envoyée : au redémarrage, celles restées
+#    en attente sont renvoyées ;
+#  - le fichier est compacté (alertes envoyées retirées) au démarrage et chaque fois que la file se vide.
+# Essai en local : `python -m aiosmtpd -n -l localhost:8025` puis ConfigSMTP(hote="localhost",
+# port=8025, ssl=False) sans identifiant.
+import heapq
+import itertools
+import json
+import os
+import smtplib
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from email.mime.text import MIMEText
+
+CHEMIN_ATTENTE = os.path.join(".alertes", "attente.jsonl")
+
+TENTATIVES_MAX = 5
+DELAI_INITIAL = 2.0
+DELAI_MAX = 300.0
+# Délai au-delà duquel une connexion inutilisée est fermée (secondes)
+INACTIVITE_MAX = 60.0
+DELAI_CONNEXION = 20.0
+
+
+@dataclass(frozen=True)
+class ConfigSMTP:
+    hote: str
+    port: int
+    expediteur: str
+    destinataire: str
+    utilisateur: str = ""
+    mot_de_passe: str = ""
+    ssl: bool = True
+
+
+def config_depuis_secrets(secrets):
+    # Clés existantes de secrets.toml ; serveur et port restent ceux de Gmail par défaut
+    return ConfigSMTP(
+        hote=secrets.get("smtp_hote", "smtp.gmail.com"),
+        port=int(secrets.get("smtp_port", 465)),
+        expediteur=secrets["email_archiviste"],
+        destinataire=secrets["email_reception"],
+        utilisateur=secrets["email_archiviste"],
+        mot_de_passe=secrets["mdp_archiviste"],
+        ssl=bool(secrets.get("smtp_ssl", True)),
+    )
+
+
+class FileAlertes:
+    def __init__(self, config, chemin_attente=CHEMIN_ATTENTE, tentatives_max=TENTATIVES_MAX,
+                 delai_initial=DELAI_INITIAL, delai_max=DELAI_MAX, inactivite_max=INACTIVITE_MAX):
+        self.config = config
+        self.chemin_attente = chemin_attente
+        self.tentatives_max = tentatives_max
+        self.delai_initial = delai_initial
+        self.delai_max = delai_max
+        self.inactivite_max = inactivite_max
+        self.derniere_erreur = None
+
+        # Alertes à envoyer : tas de (échéance, numéro, tentative, alerte), échéance en time.monotonic()
+        self._a_envoyer = []
+        self._numeros = itertools.count()
+        self._condition = threading.Condition()
+        self._verrou_fichier = threading.Lock()
+        self._non_envoyees = {}  # id -> alerte, jusqu'à confirmation de l'envoi
+        self._fichier_modifie = False  # lignes ajoutées au fichier d'attente depuis le dernier compactage
+        self._connexion = None
+        self._dernier_envoi = 0.0
+
+        for alerte in self._relire_attente():
+            self._programmer(alerte, 1, 0.0)
+        self._fil = threading.Thread(target=self._boucle, name="envoi-alertes", daemon=True)
+        self._fil.start()
+
+    def envoyer(self, sujet, corps):
+        # Ne bloque que le temps d'écrire une ligne sur le disque ; renvoie l'identifiant de l'alerte
+        alerte = {'id': uuid.uuid4().hex, 'sujet': sujet, 'corps': corps, 'cree': time.time()}
+        self._journaliser(alerte)
+        self._programmer(alerte, 1, time.monotonic())
+        return alerte['id']
+
+    def en_attente(self):
+        with self._condition:
+            return len(self._a_envoyer)
+
+    def _programmer(self, alerte, tentative, echeance):
+        with self._condition:
+            heapq.heappush(self._a_envoyer, (echeance, next(self._numeros), tentative, alerte))
+            self._condition.notify()
+
+    # --- Fichier d'attente ---
+    def _journaliser(self, evenement):
+        # Nouvelle alerte ou confirmation d'envoi ({'id', 'envoye'}), suivie aussi en mémoire pour le compactage
+        with self._verrou_fichier:
+            if evenement.get('envoye'):
+                self._non_envoyees.pop(evenement['id'], None)
+            else:
+                self._non_envoyees[evenement['id']] = evenement
+            dossier = os.path.dirname(self.chemin_attente)
+            if dossier:
+                os.makedirs(dossier, exist_ok=True)
+            with open(self.chemin_attente, "a", encoding="utf-8") as f:
+                f.write(json.dumps(evenement, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            self._fichier_modifie = True
+
+    def _compacter(self):
+        # Réécrit le fichier avec les seules alertes non confirmées (celles abandonnées après
+        # tentatives_max échecs comprises : elles repartiront au prochain démarrage)
+        with self._verrou_fichier:
+            if not self._fichier_modifie:
+                return
+            temporaire = f"{self.chemin_attente}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temporaire, "w", encoding="utf-8") as f:
+                for alerte in self._non_envoyees.values():
+                    f.write(json.dumps(alerte, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temporaire, self.chemin_attente)
+            self._fichier_modifie = False
+
+    def _relire_attente(self):
+        # Alertes écrites mais jamais confirmées ; le fichier est compacté sans les alertes envoyées
+        if not os.path.exists(self.chemin_attente):
+            return []
+        alertes = {}
+        with open(self.chemin_attente, encoding="utf-8") as f:
+            for ligne in f:
+                try:
+                    evenement = json.loads(ligne)
+                except ValueError:
+                    continue  # dernière ligne tronquée par un arrêt brutal
+                if evenement.get('envoye'):
+                    alertes.pop(evenement.get('id'), None)
+                elif 'sujet' in evenement:
+                    alertes[evenement['id']] = evenement
+
+        self._non_envoyees = alertes
+        self._fichier_modifie = True
+        self._compacter()
+        return list(alertes.values())
+
+    # --- Fil d'envoi ---
+    def _boucle(self):
+        while True:
+            suivante = self._prochaine()
+            if suivante is None:
+                self._fermer()
+                continue
+            self._essayer(*suivante)
+            with self._condition:
+                file_vide = not self._a_envoyer
+            if file_vide:
+                self._compacter()
+
+    def _prochaine(self):
+        # (tentative, alerte) arrivée à échéance, ou None après inactivite_max sans rien à envoyer
+        limite = time.monotonic() + self.inactivite_max
+        with self._condition:
+            while True:
+                maintenant = time.monotonic()
+                if self._a_envoyer and self._a_envoyer[0][0] <= maintenant:
+                    _, _, tentative, alerte = heapq.heappop(self._a_envoyer)
+                    return tentative, alerte
+                if maintenant >= limite:
+                    return None
+                echeance = min(self._a_envoyer[0][0], limite) if self._a_envoyer else limite
+                self._condition.wait(timeout=echeance - maintenant)
+
+    def _essayer(self, tentative, alerte):
+        try:
+            self._transmettre(alerte)
+        except (smtplib.SMTPException, OSError) as e:
+            self.derniere_erreur = e
+            self._fermer()
+            if tentative < self.tentatives_max:
+                delai = min(self.delai_initial * 2 ** (tentative - 1), self.delai_max)
+                self._programmer(alerte, tentative + 1, time.monotonic() + delai)
+            # Sinon : toujours dans le fichier d'attente, nouvel essai au prochain démarrage
+            return False
+        self._journaliser({'id': alerte['id'], 'envoye': True})
+        return True
+
+    def _transmettre(self, alerte):
+        msg = MIMEText(alerte['corps'])
+        msg['Subject'] = alerte['sujet']
+        msg['From'] = self.config.expediteur
+        msg['To'] = self.config.destinataire
+        self._connecter().send_message(msg)
+        self._dernier_envoi = time.monotonic()
+
+    def _connecter(self):
+        if self._connexion is not None and time.monotonic() - self._dernier_envoi > self.inactivite_max:
+            self._fermer()
+        if self._connexion is None:
+            classe = smtplib.SMTP_SSL if self.config.ssl else smtplib.SMTP
+            connexion = classe(self.config.hote, self.config.port, timeout=DELAI_CONNEXION)
+            if self.config.utilisateur:
+                connexion.login(self.config.utilisateur, self.config.mot_de_passe)
+            self._connexion = connexion
+        return self._connexion
+
+    def _fermer(self):
+        if self._connexion is None:
+            return
+        try:
+            self._connexion.quit()
+        except (smtplib.SMTPException, OSError):
+            pass
+        self._connexion = None
@@ -0,0 +1,237 @@
+# ==========================================
+# ⏱️ BANC D'ESSAI DU GRENIER
+# ==========================================
+# Mesure chaque étape de données et chaque page de main.py sur des catalogues de taille croissante
+# (le vrai matchs.csv, puis 10 000, 100 000 et 1 000 000 matchs synthétiques).
+# Chaque taille est mesurée dans un processus neuf (modules, st.cache_resource et instantané
+# repartent de zéro), le catalogue lui étant désigné par GRENIER_CSV (cf. donnees.py).
+# Pour chaque mesure : médiane et minimum sur plusieurs répétitions, en secondes.
+#   python benchmarks/banc.py                                  # toutes les tailles
+#   python benchmarks/banc.py --tailles reel 10000             # sous-ensemble
+#   python benchmarks/banc.py --comparer ancien.json           # rapport avec un run précédent
+# Résultats : benchmarks/resultats/banc-<date>.json (un objet JSON, lisible par machine).
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DOSSIER = os.path.dirname(os.path.abspath(__file__))
+DOSSIER_CATALOGUES = os.path.join(DOSSIER, "catalogues")
+DOSSIER_RESULTATS = os.path.join(DOSSIER, "resultats")
+sys.path.insert(0, RACINE)
+
+TAILLES = ["reel", "10000", "100000", "1000000"]
+REPETITIONS = 3
+DELAI_PAGE = 900  # secondes, pour les pages sur 1 million de matchs
+PAGES = [
+    'accueil', 'panier', 'faq', 'mes_recherches', 'pepites', 'progression', 'catalogue', 'ephemeride',
+    'recherche_date', 'recherche_equipe', 'face_a_face', 'recherche_avancee', 'statistiques', 'arborescence',
+]
+ETAT_PAGES = {
+    'arborescence': {'chemin': ['Nations', 'Coupe du Monde', 'Phase finale']},
+    'recherche_equipe': {'recherche_equipe_cible': 'Marseille'},
+}
+TERMES_RECHERCHE = ["Marseille", "coupe du monde", "juv", "Parc des Princes"]
+
+
+def chronometrer(fonction, repetitions=REPETITIONS):
+    durees = []
+    for _ in range(repetitions):
+        debut = time.perf_counter()
+        fonction()
+        durees.append(time.perf_counter() - debut)
+    return {'median_s': statistics.median(durees), 'min_s': min(durees)}
+
+
+# --- ÉTAPES DE DONNÉES (sans Streamlit) ---
+def mesurer_donnees(chemin_csv, repetitions):
+    from donnees import CHEMIN_INSTANTANE, charger_catalogue, construire_instantane, lire_csv, normaliser_catalogue
+    from indexation import (
+        construire_index_confrontations, construire_index_dates, construire_index_equipes,
+        construire_index_filtres, construire_index_recherche, construire_vocabulaire, positions_recherche,
+    )
+    from requetes import MoteurRecherche, filtre_recherche
+    from statistiques import calculer_cubes, construire_figures
+    from tarifs import devis
+
+    chemin_instantane = CHEMIN_INSTANTANE  # GRENIER_INSTANTANE, fixé par le processus parent
+    mesures = {}
+    mesures['lecture_csv'] = chronometrer(lambda: normaliser_catalogue(lire_csv(chemin_csv)), repetitions)
+    mesures['instantane_ecriture'] = chronometrer(lambda: construire_instantane(chemin_csv, chemin_instantane), 1)
+    mesures['instantane_lecture'] = chronometrer(lambda: charger_catalogue(chemin_csv, chemin_instantane), repetitions)
+
+    df = charger_catalogue(chemin_csv, chemin_instantane)
+    mesures['index_equipes'] = chronometrer(lambda: construire_index_equipes(df), repetitions)
+    mesures['index_confrontations'] = chronometrer(lambda: construire_index_confrontations(df), repetitions)
+    mesures['index_dates'] = chronometrer(lambda: construire_index_dates(df), repetitions)
+    mesures['index_filtres'] = chronometrer(lambda: construire_index_filtres(df), repetitions)
+    mesures['index_recherche'] = chronometrer(lambda: construire_index_recherche(df), repetitions)
+
+    index_equipes = construire_index_equipes(df)
+    index_filtres = construire_index_filtres(df)
+    index_recherche = construire_index_recherche(df)
+    mesures['vocabulaire'] = chronometrer(lambda: construire_vocabulaire(df, index_equipes, index_filtres), repetitions)
+
+    mesures['recherche_rapide'] = chronometrer(
+        lambda: [df.iloc[positions_recherche(index_recherche, terme)] for terme in TERMES_RECHERCHE], repetitions)
+
+    equipes = sorted(index_equipes, key=lambda e: -len(index_equipes[e]))[:3]
+    competitions = sorted(index_filtres.valeurs['Compétition'], key=lambda c: -len(index_filtres.valeurs['Compétition'][c]))[:2]
+    filtres = [
+        filtre_recherche(equipes=equipes[:1]),
+        filtre_recherche(equipes=equipes, competitions=competitions),
+        filtre_recherche(competitions=competitions[:1], format='dvd'),
+    ]
+    # Moteur neuf à chaque répétition : on mesure le calcul, pas le cache de résultats
+    mesures['recherche_avancee'] = chronometrer(
+        lambda: [MoteurRecherche(index_equipes, index_filtres).positions(f) for f in filtres], repetitions)
+
+    mesures['statistiques_cubes'] = chronometrer(lambda: calculer_cubes(df), repetitions)
+    cubes = calculer_cubes(df)
+    mesures['statistiques_figures'] = chronometrer(lambda: construire_figures(cubes), repetitions)
+    mesures['devis_1000'] = chronometrer(lambda: devis(['DVD', 'Numérique'] * 500, [False] * 1000), repetitions)
+    return len(df), mesures
+
+
+# --- PAGES (AppTest) ---
+def _page(page, etat=None):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(os.path.join(RACINE, "main.py"), default_timeout=DELAI_PAGE)
+    at.session_state.page = page
+    for cle, valeur in (etat or {}).items():
+        at.session_state[cle] = valeur
+    return at
+
+
+def _executer(at, action=None):
+    debut = time.perf_counter()
+    (action(at) if action else at).run()
+    duree = time.perf_counter() - debut
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+    return duree
+
+
+def mesurer_pages(repetitions):
+    mesures = {}
+    # Premier passage : chargement du catalogue et des index dans st.cache_resource
+    mesures['demarrage_app'] = {'median_s': _executer(_page('accueil'))}
+    mesures['demarrage_app']['min_s'] = mesures['demarrage_app']['median_s']
+
+    for page in PAGES:
+        try:
+            durees = [_executer(_page(page, ETAT_PAGES.get(page))) for _ in range(repetitions)]
+            mesures[f"page_{page}"] = {'median_s': statistics.median(durees), 'min_s': min(durees)}
+        except Exception as e:
+            mesures[f"page_{page}"] = {'erreur': str(e)[:200]}
+
+    # Interactions : recherche rapide et filtre équipe de la recherche avancée
+    interactions = {
+        'recherche_rapide': ('accueil', lambda at: at.text_input[0].input("Marseille")),
+        'recherche_avancee_equipe': ('recherche_avancee', lambda at: at.multiselect[0].set_value([at.multiselect[0].options[0]])),
+    }
+    for nom, (page, action) in interactions.items():
+        try:
+            durees = []
+            for _ in range(repetitions):
+                at = _page(page)
+                _executer(at)
+                durees.append(_executer(at, action))
+            mesures[f"interaction_{nom}"] = {'median_s': statistics.median(durees), 'min_s': min(durees)}
+        except Exception as e:
+            mesures[f"interaction_{nom}"] = {'erreur': str(e)[:200]}
+    return mesures
+
+
+def mesurer(chemin_csv, repetitions):
+    nb_matchs, donnees = mesurer_donnees(chemin_csv, repetitions)
+    return {'catalogue': chemin_csv, 'nb_matchs': nb_matchs, 'donnees': donnees, 'pages': mesurer_pages(repetitions)}
+
+
+# --- ORCHESTRATION ---
+def catalogue_pour(taille):
+    if taille == "reel":
+        return os.path.join(RACINE, "matchs.csv")
+    chemin = os.path.join(DOSSIER_CATALOGUES, f"catalogue_{taille}.csv")
+    if not os.path.exists(chemin):
+        from catalogue_synthetique import ecrire_catalogue, generer_catalogue
+        ecrire_catalogue(generer_catalogue(int(taille)), chemin)
+    return chemin
+
+
+def mesurer_taille(taille, repetitions):
+    chemin = catalogue_pour(taille)
+    env = dict(os.environ, GRENIER_CSV=chemin, GRENIER_INSTANTANE=os.path.splitext(chemin)[0] + ".arrow")
+    if taille == "reel":
+        # L'instantané du vrai catalogue n'est pas touché : on travaille sur une copie à côté des synthétiques
+        env['GRENIER_INSTANTANE'] = os.path.join(DOSSIER_CATALOGUES, "catalogue_reel.arrow")
+        os.makedirs(DOSSIER_CATALOGUES, exist_ok=True)
+    processus = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--mesurer", chemin, "--repetitions", str(repetitions)],
+        cwd=RACINE, env=env, capture_output=True, text=True,
+    )
+    if processus.returncode != 0:
+        return {'catalogue': chemin, 'erreur': processus.stderr.strip().splitlines()[-1:]}
+    return json.loads(processus.stdout.strip().splitlines()[-1])
+
+
+def environnement():
+    import numpy
+    import pandas
+    import streamlit
+    return {
+        'python': platform.python_version(), 'machine': platform.machine(), 'systeme': platform.platform(),
+        'processeurs': os.cpu_count(), 'pandas': pandas.__version__, 'numpy': numpy.__version__,
+        'streamlit': streamlit.__version__,
+    }
+
+
+def comparer(resultats, ancien):
+    # Rapport médiane nouvelle / ancienne : < 1 = plus rapide
+    for taille, mesures in resultats['tailles'].items():
+        precedent = ancien.get('tailles', {}).get(taille)
+        if not precedent or 'erreur' in mesures or 'erreur' in precedent:
+            continue
+        print(f"\n— {taille} —")
+        for groupe in ('donnees', 'pages'):
+            for nom, mesure in mesures[groupe].items():
+                avant = precedent.get(groupe, {}).get(nom, {}).get('median_s')
+                if avant and 'median_s' in mesure:
+                    print(f"{nom:<40} {avant:9.4f}s -> {mesure['median_s']:9.4f}s  x{mesure['median_s'] / avant:.2f}")
+
+
+if __name__ == "__main__":
+    parseur = argparse.ArgumentParser(description="Banc d'essai du Grenier du Football")
+    parseur.add_argument("--tailles", nargs="+", default=TAILLES, help="'reel' et/ou nombres de matchs synthétiques")
+    parseur.add_argument("--repetitions", type=int, default=REPETITIONS)
+    parseur.add_argument("--sortie", default=None, help="fichier JSON de résultats")
+    parseur.add_argument("--comparer", default=None, help="résultats d'un run précédent")
+    parseur.add_argument("--mesurer", default=None, help=argparse.SUPPRESS)  # processus enfant : un seul catalogue
+    arguments = parseur.parse_args()
+
+    if arguments.mesurer:
+        print(json.dumps(mesurer(arguments.mesurer, arguments.repetitions)))
+        sys.exit(0)
+
+    resultats = {'date': datetime.now().isoformat(timespec='seconds'), 'environnement': environnement(), 'tailles': {}}
+    for taille in arguments.tailles:
+        debut = time.perf_counter()
+        resultats['tailles'][taille] = mesurer_taille(taille, arguments.repetitions)
+        print(f"✅ {taille} : mesuré en {time.perf_counter() - debut:.0f} s", file=sys.stderr)
+
+    sortie = arguments.sortie or os.path.join(DOSSIER_RESULTATS, f"banc-{datetime.now():%Y%m%d-%H%M%S}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(sortie)), exist_ok=True)
+    with open(sortie, "w", encoding="utf-8") as f:
+        json.dump(resultats, f, ensure_ascii=False, indent=2)
+    print(f"✅ Résultats : {sortie}", file=sys.stderr)
+
+    if arguments.comparer:
+        with open(arguments.comparer, encoding="utf-8") as f:
+            comparer(resultats, json.load(f))
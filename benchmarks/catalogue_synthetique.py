@@ -0,0 +1,69 @@
+# ==========================================
+# 🧪 CATALOGUE SYNTHÉTIQUE (BANCS D'ESSAI)
+# ==========================================
+# Fabrique un CSV de N matchs au schéma exact de matchs.csv (Match;Saison;Compétition;...;Clé face à face).
+# Chaque ligne part d'une vraie ligne tirée au hasard (compétition, phase, stade, diffuseur, format,
+# commentaire restent cohérents entre eux), puis date, équipes et numéro sont redistribués ; Saison
+# et clés de confrontation sont recalculées. Graine fixe : le même fichier à chaque génération.
+# `python benchmarks/catalogue_synthetique.py 100000 /tmp/catalogue_100k.csv`
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RACINE)
+
+from donnees import lire_csv  # noqa: E402
+
+SOURCE = os.path.join(RACINE, "matchs.csv")
+PREMIER_JOUR = np.datetime64("1970-01-01")
+DERNIER_JOUR = np.datetime64("2025-06-30")
+COLONNES_ENTIERES = ['Match', 'Journée', 'Numéro match EDF', 'Numéro match Milan dans compétition']
+
+
+def generer_catalogue(nb_lignes, source=SOURCE, graine=0):
+    rng = np.random.default_rng(graine)
+    reel = lire_csv(source).dropna(subset=['Compétition'])
+    df = reel.sample(n=nb_lignes, replace=True, random_state=graine).reset_index(drop=True)
+
+    # Équipes : tirées dans tout le vivier réel, jamais deux fois la même dans un match
+    equipes = pd.unique(pd.concat([reel['Domicile'], reel['Extérieur']]).dropna())
+    tirage = rng.integers(0, len(equipes), size=(nb_lignes, 2))
+    tirage[:, 1] = np.where(tirage[:, 0] == tirage[:, 1], (tirage[:, 1] + 1) % len(equipes), tirage[:, 1])
+    df['Domicile'] = equipes[tirage[:, 0]]
+    df['Extérieur'] = equipes[tirage[:, 1]]
+
+    # Dates uniformes sur la période couverte par le catalogue ; la saison commence en juillet
+    jours = PREMIER_JOUR + rng.integers(0, (DERNIER_JOUR - PREMIER_JOUR).astype(int), nb_lignes).astype("timedelta64[D]")
+    dates = pd.DatetimeIndex(jours)
+    df['Date'] = dates.strftime("%d/%m/%Y")
+    debut_saison = dates.year - (dates.month < 7)
+    df['Saison'] = debut_saison.astype(str) + "-" + (debut_saison + 1).astype(str)
+
+    df['Match'] = np.arange(1, nb_lignes + 1)
+    ordre = df['Domicile'] <= df['Extérieur']
+    premiere = df['Domicile'].where(ordre, df['Extérieur'])
+    seconde = df['Extérieur'].where(ordre, df['Domicile'])
+    df['clé confrontation'] = premiere + " - " + seconde
+    df['Clé face à face'] = premiere + "|" + seconde
+
+    for col in COLONNES_ENTIERES:
+        if col in df.columns:
+            df[col] = df[col].astype("Int64")
+    return df[reel.columns]
+
+
+def ecrire_catalogue(df, chemin):
+    dossier = os.path.dirname(chemin)
+    if dossier:
+        os.makedirs(dossier, exist_ok=True)
+    df.to_csv(chemin, sep=";", index=False, encoding="utf-8-sig")
+
+
+if __name__ == "__main__":
+    nb_lignes = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    chemin = sys.argv[2] if len(sys.argv) > 2 else f"catalogue_{nb_lignes}.csv"
+    ecrire_catalogue(generer_catalogue(nb_lignes), chemin)
+    print(f"✅ {chemin} généré : {nb_lignes} matchs")
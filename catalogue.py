@@ -0,0 +1,294 @@
+# ==========================================
+# 🔄 CATALOGUE VIVANT (RECHARGEMENT À CHAUD)
+# ==========================================
+# Une seule instance par processus (st.cache_resource). Toutes les quelques secondes, au
+# passage d'un visiteur, on compare taille et date de matchs.csv à ce qui a été lu :
+#  - fichier inchangé : rien à faire ;
+#  - lignes ajoutées à la fin (début du fichier identique, vérifié par empreinte SHA-1) :
+#    seule la fin est lue, puis catalogue et index sont prolongés ;
+#  - autre modification : rechargement complet, dans un fil à part ; les visiteurs continuent
+#    avec la version courante jusqu'à ce que la nouvelle soit prête.
+# Un ajout illisible (ligne mal formée) est ignoré et relu au contrôle suivant, sans toucher
+# à la version servie. L'instantané Arrow est réécrit par un seul fil, qui ne garde que la
+# dernière version demandée.
+# Chaque état est une VersionCatalogue complète, remplacée d'un bloc : une session qui lit
+# l'ancienne version la garde intacte jusqu'à la fin de son exécution. Une version est
+# partagée telle quelle par toutes les sessions (aucune copie) : DataFrame et index sont
+# en lecture seule, les pages filtrent sans jamais écrire dedans.
+# Les observateurs (fonctions df_nouveaux -> None) sont prévenus, dans un fil à part, des
+# matchs apparus dans une nouvelle version (cf. graal.py).
+import hashlib
+import io
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, fields, is_dataclass, replace
+
+import numpy as np
+
+from donnees import (
+    CHEMIN_CSV, CHEMIN_INSTANTANE, VERSION_INSTANTANE,
+    charger_instantane, construire_instantane, etendre_catalogue, figer_catalogue, lire_csv, normaliser_catalogue,
+)
+from indexation import (
+    IndexArbo, IndexDates, IndexFiltres, IndexRecherche, Vocabulaire,
+    construire_index_arbo, construire_index_confrontations, construire_index_dates,
+    construire_index_equipes, construire_index_filtres, construire_index_recherche, construire_vocabulaire,
+    etendre_index_arbo, etendre_index_confrontations, etendre_index_dates,
+    etendre_index_equipes, etendre_index_filtres, etendre_index_recherche, etendre_vocabulaire,
+)
+
+# Délai minimal entre deux contrôles du fichier (secondes)
+INTERVALLE_CONTROLE = 2.0
+
+journal = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class VersionCatalogue:
+    version: str
+    df: object
+    index_equipes: dict
+    index_confrontations: dict
+    index_recherche: IndexRecherche
+    index_dates: IndexDates
+    index_arbo: IndexArbo
+    index_filtres: IndexFiltres
+    vocabulaire: Vocabulaire
+
+
+def _figer(objet):
+    if isinstance(objet, np.ndarray):
+        objet.flags.writeable = False
+    elif isinstance(objet, dict):
+        for valeur in objet.values():
+            _figer(valeur)
+    elif is_dataclass(objet):
+        for champ in fields(objet):
+            _figer(getattr(objet, champ.name))
+
+
+def figer_version(version):
+    figer_catalogue(version.df)
+    for champ in fields(version):
+        if champ.name != 'df':
+            _figer(getattr(version, champ.name))
+    return version
+
+
+class GestionnaireCatalogue:
+    def __init__(self, menu, chemin_csv=CHEMIN_CSV, chemin_instantane=CHEMIN_INSTANTANE, intervalle=INTERVALLE_CONTROLE,
+                 observateurs=()):
+        self.menu = menu
+        self.chemin_csv = chemin_csv
+        self.chemin_instantane = chemin_instantane
+        self.intervalle = intervalle
+        self.observateurs = list(observateurs)
+        self._courante = None
+        self._verrou = threading.Lock()
+        self._dernier_controle = 0.0
+        # Instantané à écrire (df, signature) : seul le plus récent compte
+        self._verrou_instantane = threading.Lock()
+        self._instantane_en_attente = None
+        self._ecriture_en_cours = False
+        self._charger_complet()
+
+    @property
+    def courante(self):
+        return self._courante
+
+    def actualiser(self):
+        # Renvoie la version à utiliser pour cette exécution. Si une autre session est déjà en
+        # train de lire le fichier, on ne l'attend pas : la version courante reste valable.
+        if time.monotonic() - self._dernier_controle < self.intervalle:
+            return self._courante
+        if not self._verrou.acquire(blocking=False):
+            return self._courante
+        en_fond = False
+        try:
+            self._dernier_controle = time.monotonic()
+            etat = os.stat(self.chemin_csv)
+            if (etat.st_mtime_ns, etat.st_size) != self._etat_fichier:
+                if etat.st_size > self._octets_lus and self._debut_inchange():
+                    self._lire_ajouts(etat)
+                else:
+                    # Le verrou passe au fil de rechargement : pas d'autre contrôle avant qu'il ait fini
+                    threading.Thread(target=self._recharger_en_fond, daemon=True).start()
+                    en_fond = True
+        except OSError:
+            pass  # fichier momentanément illisible : on garde la version courante
+        except Exception:
+            journal.exception("Ajout illisible dans %s, nouvel essai au prochain contrôle", self.chemin_csv)
+        finally:
+            if not en_fond:
+                self._verrou.release()
+        return self._courante
+
+    def _recharger_en_fond(self):
+        try:
+            self._charger_complet()
+        except Exception:
+            journal.exception("Rechargement de %s impossible, version courante conservée", self.chemin_csv)
+        finally:
+            self._verrou.release()
+
+    # --- Lecture complète ---
+    def _charger_complet(self):
+        etat = os.stat(self.chemin_csv)
+        with open(self.chemin_csv, "rb") as f:
+            contenu = f.read()
+        empreinte = hashlib.sha1(contenu)
+        signature = empreinte.hexdigest()
+
+        df = charger_instantane(self.chemin_instantane, signature)
+        if df is None:
+            # Instantané absent ou périmé : lecture des octets déjà hachés, instantané réécrit en arrière-plan
+            df = normaliser_catalogue(lire_csv(io.BytesIO(contenu)))
+            self._programmer_instantane(df, signature)
+        df.attrs['version'] = f"{VERSION_INSTANTANE}:{signature}"
+        index_equipes = construire_index_equipes(df)
+        index_filtres = construire_index_filtres(df)
+        nouvelle = figer_version(VersionCatalogue(
+            version=df.attrs['version'],
+            df=df,
+            index_equipes=index_equipes,
+            index_confrontations=construire_index_confrontations(df),
+            index_recherche=construire_index_recherche(df),
+            index_dates=construire_index_dates(df),
+            index_arbo=construire_index_arbo(df, self.menu),
+            index_filtres=index_filtres,
+            vocabulaire=construire_vocabulaire(df, index_equipes, index_filtres),
+        ))
+
+        # L'état du fichier ne change qu'une fois la nouvelle version construite : un échec sera retenté
+        self._entete = contenu[:contenu.find(b"\n") + 1]
+        self._empreinte = empreinte
+        self._octets_lus = len(contenu)
+        self._etat_fichier = (etat.st_mtime_ns, etat.st_size)
+        ancienne, self._courante = self._courante, nouvelle
+        # Fichier réécrit : les nouveaux matchs sont ceux dont le numéro n'existait pas
+        if ancienne is not None and 'Match' in df.columns:
+            self._prevenir(df[~df['Match'].isin(ancienne.df['Match'])])
+
+    # --- Lecture incrémentale ---
+    def _debut_inchange(self):
+        with open(self.chemin_csv, "rb") as f:
+            debut = f.read(self._octets_lus)
+        return hashlib.sha1(debut).digest() == self._empreinte.digest()
+
+    def _lire_ajouts(self, etat):
+        with open(self.chemin_csv, "rb") as f:
+            f.seek(self._octets_lus)
+            ajout = f.read(etat.st_size - self._octets_lus)
+        # Une ligne en cours d'écriture (sans fin de ligne) sera lue au prochain contrôle
+        ajout = ajout[:ajout.rfind(b"\n") + 1]
+        if not ajout:
+            self._etat_fichier = (etat.st_mtime_ns, etat.st_size)
+            return
+
+        # Une erreur de lecture remonte avant toute mise à jour : l'ajout sera relu au prochain contrôle
+        df_ajout = normaliser_catalogue(lire_csv(io.BytesIO(self._entete + ajout)))
+        empreinte = self._empreinte.copy()
+        empreinte.update(ajout)
+        signature = empreinte.hexdigest()
+
+        ancienne = self._courante
+        if df_ajout.empty:
+            df = ancienne.df.copy(deep=False)
+            df.attrs['version'] = f"{VERSION_INSTANTANE}:{signature}"
+            nouvelle = replace(ancienne, version=df.attrs['version'], df=df)
+        else:
+            decalage = len(ancienne.df)
+            df = etendre_catalogue(ancienne.df, df_ajout)
+            df.attrs['version'] = f"{VERSION_INSTANTANE}:{signature}"
+            df_queue = df.iloc[decalage:]
+            index_equipes = etendre_index_equipes(ancienne.index_equipes, df_queue, decalage)
+            index_filtres = etendre_index_filtres(ancienne.index_filtres, df_queue, decalage)
+            nouvelle = VersionCatalogue(
+                version=df.attrs['version'],
+                df=df,
+                index_equipes=index_equipes,
+                index_confrontations=etendre_index_confrontations(ancienne.index_confrontations, df_queue, decalage),
+                index_recherche=etendre_index_recherche(ancienne.index_recherche, df_queue, decalage),
+                index_dates=etendre_index_dates(ancienne.index_dates, df_queue, decalage),
+                index_arbo=etendre_index_arbo(ancienne.index_arbo, df, df_queue, decalage, self.menu),
+                index_filtres=index_filtres,
+                vocabulaire=etendre_vocabulaire(ancienne.vocabulaire, df_queue, index_equipes, index_filtres),
+            )
+
+        nouvelle = figer_version(nouvelle)
+        self._empreinte = empreinte
+        self._octets_lus += len(ajout)
+        self._etat_fichier = (etat.st_mtime_ns, etat.st_size)
+        self._courante = nouvelle
+        if not df_ajout.empty:
+            self._prevenir(nouvelle.df.iloc[len(ancienne.df):])
+
+        # Instantané Arrow régénéré en arrière-plan pour le prochain démarrage
+        self._programmer_instantane(nouvelle.df, signature)
+
+    def _prevenir(self, df_nouveaux):
+        if self.observateurs and not df_nouveaux.empty:
+            threading.Thread(target=self._notifier, args=(df_nouveaux,), daemon=True).start()
+
+    def _notifier(self, df_nouveaux):
+        for observateur in self.observateurs:
+            try:
+                observateur(df_nouveaux)
+            except Exception:
+                # Un observateur en échec ne doit gêner ni les autres ni le rechargement, mais il est signalé
+                journal.exception("Observateur %s en échec sur %d nouveaux matchs",
+                                  getattr(observateur, '__name__', observateur), len(df_nouveaux))
+
+    # --- Instantané Arrow : un seul fil d'écriture, seule la dernière version demandée est écrite ---
+    def _programmer_instantane(self, df, signature):
+        with self._verrou_instantane:
+            self._instantane_en_attente = (df, signature)
+            if self._ecriture_en_cours:
+                return
+            self._ecriture_en_cours = True
+        threading.Thread(target=self._sauver_instantanes, daemon=True).start()
+
+    def _sauver_instantanes(self):
+        while True:
+            with self._verrou_instantane:
+                if self._instantane_en_attente is None:
+                    self._ecriture_en_cours = False
+                    return
+                df, signature = self._instantane_en_attente
+                self._instantane_en_attente = None
+            try:
+                construire_instantane(self.chemin_csv, self.chemin_instantane, df=df, signature=signature)
+            except (OSError, RuntimeError):
+                pass
+
+
+if __name__ == "__main__":
+    # Vérification : `python catalogue.py` (copie de matchs.csv, puis ajouts en fin de fichier)
+    import shutil
+    import tempfile
+
+    import pandas as pd
+
+    with tempfile.TemporaryDirectory() as dossier:
+        chemin_csv = os.path.join(dossier, "matchs.csv")
+        shutil.copyfile(CHEMIN_CSV, chemin_csv)
+        gestionnaire = GestionnaireCatalogue({}, chemin_csv, os.path.join(dossier, "matchs.arrow"), intervalle=0)
+        depart = gestionnaire.actualiser()
+
+        # Bloc ajouté dont toutes les dates sont des numéros de série Excel (45000 -> 15/03/2023)
+        modele = lire_csv(CHEMIN_CSV).dropna(subset=['Compétition']).head(2).copy()
+        modele['Date'] = [45000, 45001]
+        with open(chemin_csv, "a", encoding="utf-8", newline="") as f:
+            f.write(modele.to_csv(sep=";", header=False, index=False, lineterminator="\r\n"))
+        ajoutee = gestionnaire.actualiser()
+        assert ajoutee is not depart, "ajout non pris en compte"
+        assert len(ajoutee.df) == len(depart.df) + 2
+        assert list(ajoutee.df['Date'].iloc[-2:]) == ["15/03/2023", "16/03/2023"]
+        assert list(ajoutee.df['date_dt'].iloc[-2:]) == [pd.Timestamp(2023, 3, 15), pd.Timestamp(2023, 3, 16)]
+
+        # Écriture de l'instantané en arrière-plan terminée avant de supprimer le dossier
+        while gestionnaire._ecriture_en_cours:
+            time.sleep(0.05)
+    print(f"✅ Ajout de {len(modele)} matchs aux dates Excel : catalogue prolongé ({len(ajoutee.df)} matchs)")
@@ -0,0 +1,637 @@
+# ==========================================
+# 🧰 SOCLE COMMUN DES PAGES
+# ==========================================
+# Importé une fois par processus : données partagées (catalogue, index, ressources), pop-ups,
+# affichage des résultats, barre latérale et pied de page. Chaque page (vues/*.py) n'en prend
+# que ce qu'elle utilise ; main.py ne fait que la navigation.
+import streamlit as st
+import pandas as pd
+import base64
+from alertes import FileAlertes, config_depuis_secrets
+from catalogue import GestionnaireCatalogue
+from graal import RegistreGraal, message_trouvaille
+from mesures import chronometre, mesure
+from logos import source_logo, url_fichier
+from panier import ajouter_au_panier, ajouter_lot_au_panier, cle_match, retirer_du_panier
+from requetes import MoteurRecherche
+from tarifs import ARTICLES_PAR_OFFERT, jauge_offert
+
+# --- LECTURE DU LOGO LGF ---
+@st.cache_data
+def get_base64_image(image_path):
+    try:
+        with open(image_path, "rb") as img_file:
+            return base64.b64encode(img_file.read()).decode()
+    except Exception:
+        return ""
+
+# Service statique activé (.streamlit/config.toml) : les images sont servies par URL, mises en cache par le navigateur
+LOGOS_STATIQUES = st.get_option("server.enableStaticServing")
+
+@st.cache_data
+def get_image_src(image_path, statique=False):
+    if statique:
+        url = url_fichier(image_path)
+        if url:
+            return url
+    img_b64 = get_base64_image(image_path)
+    return f"data:image/png;base64,{img_b64}" if img_b64 else ""
+
+# ==========================================
+# ⚙️ GESTION DE LA NAVIGATION & PANIER
+# ==========================================
+def initialiser_session():
+    if 'page' not in st.session_state: st.session_state.page = 'accueil'
+    if 'chemin' not in st.session_state: st.session_state.chemin = []
+    if 'edition_choisie' not in st.session_state: st.session_state.edition_choisie = None
+    if 'recherche_equipe_cible' not in st.session_state: st.session_state.recherche_equipe_cible = None
+    if 'recherche_comp_cible' not in st.session_state: st.session_state.recherche_comp_cible = None
+    if 'panier' not in st.session_state: st.session_state.panier = {}
+    if 'fiches_page' not in st.session_state: st.session_state.fiches_page = 0
+
+def go_home():
+    st.session_state.page = 'accueil'
+    st.session_state.chemin = []
+    st.session_state.edition_choisie = None
+    st.session_state.recherche_equipe_cible = None
+    st.session_state.recherche_comp_cible = None
+
+def aller_a(page):
+    # Seule la page demandée est exécutée (vues/<page>.py) ; l'état de session suit
+    st.session_state.page = page
+    st.switch_page(f"vues/{page}.py")
+
+# ==========================================
+# ⚙️ FONCTIONS DES POP-UPS (INFORMATIONS)
+# ==========================================
+@st.dialog("🧭 Guide & Contenu")
+def popup_guide_contenu():
+    st.markdown("""
+    **Bienvenue dans l'antre du Grenier du Football !** Près de 5000 matchs au chaud : des classiques, des raretés, des “je l’avais oublié celui-là !”. Du foot vintage, numérisé à partir de VHS, aux saisons plus récentes… et on n’a pas fini de fouiller.
+    
+    **Dans ce catalogue :**
+    * 🌍 Des **matchs de clubs** et de **sélections nationales**.
+    * 🏆 Les grandes **compétitions internationales** : Coupe du Monde, Euro, Copa America, Jeux Olympiques...
+    * ✨ Les **Coupes d'Europe** : Ligue des Champions, Coupe UEFA, Coupe des Coupes...
+    * 🥇 Les **grands championnats** : Ligue 1, Serie A, Liga, Premier League...
+    * 🕰️ Des matchs **amicaux, historiques et rares**.
+    ---
+    ### 🛠️ Mode d'emploi : Comment fouiller les archives ?
+    
+    Pour explorer ce catalogue massif, deux affichages s'offrent à vous (sélectionnables juste au-dessus des listes de matchs) :
+    
+    * 📊 **Le Tableau classique :** Idéal pour une recherche rapide. C'est une vue condensée qui vous permet de trier facilement les colonnes (par année, compétition, etc.).
+    * 📇 **Les Fiches détaillées :** La vue parfaite pour les puristes ! Plongez dans les détails de chaque match de manière beaucoup plus visuelle et aérée.
+    
+    💡 **L'astuce secrète :** Dans la vue "Fiches détaillées", **les petites étiquettes des clubs et compétitions sont interactives !** Cliquez simplement sur "Marseille" ou "Coupe du Monde" sur une fiche, et le site filtrera instantanément tout l'historique de cette équipe ou de ce tournoi. Bonne fouille !
+    """)
+
+@st.dialog("💾 Formats & Organisation")
+def popup_formats():
+    st.markdown("### 🗂️ Données répertoriées")
+    st.markdown("""
+    * #️⃣ Numéro du match dans le grenier
+    * 🗓️ Date et saison du match
+    * 🏆 Compétition et phase
+    * 🏟️ Lieu et stade
+    * 📺 Diffuseur d'origine (TF1, Canal+, etc.)
+    * 🎙️ Langue des commentaires
+    * 📼 Qualité (DVD, MP4,...)
+        """)
+    st.divider()
+    st.markdown("### 📼 Formats disponibles")
+    st.markdown("""
+    * 💻 **Numérique :** formats courants (.mp4, .avi, .mkv) – parfaits pour ordinateur, tablette ou TV.
+    * 💿 **DVD :** fichiers .VOB stockés sur disque dur.
+    * 📼 **VHS :** pour les puristes, quelques exemplaires disponibles au format original.
+    """)
+
+@st.dialog("💶 Tarifs & Offres")
+def popup_tarifs():
+    st.markdown("### 💰 Grille Tarifaire")
+    st.markdown("""
+    * 💿 **1 match au format DVD** = **5 €**
+      *(⚠️ Note : Pour les formats DVD, vous recevez les fichiers informatiques originaux (.VOB), il n'y a pas d'envoi de DVD physique)*
+    * 💻 **1 match au format Numérique** (mp4, mkv...) = **3 €**
+    """)
+    st.divider()
+    st.markdown("### 🎁 Offres & Réductions")
+    st.markdown("""
+    * 🆓 **1 match offert** tous les 10 matchs achetés (le match le moins cher de votre sélection est automatiquement déduit à partir du 11ème match).
+    * 🩹 **Remise "Archive Imparfaite" (-1 €) :** Si un match présente un défaut lié à l'usure du temps (qualité altérée, fichier incomplet...), une remise de 1€ est automatiquement déduite dans votre panier.
+    * 🔄 **Offre cumulable :** 2 matchs offerts pour 20 achetés, 3 pour 30, etc.
+    """)
+
+@st.dialog("✉️ Contact & Commandes")
+def popup_contact_commandes():
+    st.markdown("""
+    **Comment valider votre commande ?**
+    * 🛒 **Le Panier :** Une fois votre sélection terminée, envoyez simplement le récapitulatif de votre panier par e-mail à **legrenierdufootball@hotmail.com** ou en Message Privé sur Instagram **[@legrenierdufootball](https://www.instagram.com/legrenierdufootball/)**.
+    * 💳 **Le Paiement :** À réception de votre message, je vous répondrai avec les instructions pour procéder au paiement sécurisé via **PayPal**.
+    * 🚀 **La Livraison :** Dès validation du paiement, vos matchs sont envoyés rapidement et en toute sécurité via des plateformes de téléchargement.
+    
+    ---
+    **Une question spécifique ?** Vous cherchez un match qui n'est pas (encore) dans le catalogue ? N'hésitez pas à m'écrire par e-mail ou via Instagram, je vous répondrai avec plaisir !
+    """)
+
+@st.dialog("🤝 Proposer un Échange")
+def popup_echanges():
+    st.markdown("""
+    **Faisons grandir Le Grenier ensemble !** Je suis continuellement à la recherche de nouvelles archives pour sauvegarder le patrimoine footballistique. Si vous possédez vos propres enregistrements sur disques durs, DVD ou VHS, je suis très ouvert aux échanges !
+    
+    **Comment procéder ?**
+    * 🔎 Consultez la section **"Mes Recherches"** dans le menu pour découvrir mes projets prioritaires actuels.
+    * 📋 Envoyez-moi votre liste de matchs ou vos propositions par e-mail à **legrenierdufootball@hotmail.com** ou sur Instagram **[@legrenierdufootball](https://www.instagram.com/legrenierdufootball/)**.
+    * 🔄 Nous pourrons alors convenir d'un échange équitable de fichiers numériques.
+    """)
+
+@st.dialog("📱 Le Grenier sur mobile")
+def popup_raccourci_mobile():
+    st.markdown("""
+    ### Gardez le Grenier à portée de main !
+    Vous pouvez ajouter un raccourci de ce site directement sur l'écran d'accueil de votre téléphone. Cela créera une icône pour y accéder en un clic.
+    
+    🍎 **Sur iPhone (Safari) :**
+    1. Appuyez sur l'icône **Partager** (le carré avec une flèche vers le haut, en bas de l'écran).
+    2. Faites défiler vers le bas et appuyez sur **Sur l'écran d'accueil**.
+    3. Confirmez en appuyant sur **Ajouter**.
+
+    🤖 **Sur Android (Chrome) :**
+    1. Appuyez sur les **trois petits points** (en haut à droite).
+    2. Appuyez sur **Ajouter à l'écran d'accueil**.
+    3. Confirmez en appuyant sur **Ajouter**.
+    """)
+
+MENU_ARBO = {
+    "Nations": {
+        "Coupe du Monde": {
+            "Phase finale": "FILTER_CDM_FINALE",
+            "Eliminatoires": "FILTER_CDM_ELIM"
+        },
+        "Championnat d'Europe": {
+            "Phase finale": "FILTER_EURO_FINALE",
+            "Eliminatoires": "FILTER_EURO_ELIM"
+        },
+        "Ligue des Nations": "Ligue des Nations",
+        "Copa America": "Copa America",
+        "Coupe des Confédérations": "Coupe des Confédérations",
+        "Jeux Olympiques": "Jeux Olympiques"
+    },
+    "Coupes d'Europe": {
+        "C1": ["Coupe d'Europe des clubs champions", "Champions League"],
+        "C2": ["Coupe des Coupes"],
+        "C3": ["Coupe Intertoto", "Coupe UEFA", "Europa League"],
+        "C4": ["Europa Conference"],
+        "Supercoupe d'Europe": "Supercoupe d'Europe"
+    },
+    "Championnats & Coupes": {
+        "Tournois internationaux clubs": {
+            "Coupe Intercontinentale": "Coupe intercontinentale",
+            "Coupe du Monde des clubs de la FIFA": "Coupe du Monde des clubs de la FIFA",
+            "Coupe du Monde des Clubs 2025": "Coupe du Monde des Clubs 2025"
+        },
+        "Championnat de France": ["Division 1", "Ligue 1", "Division 2", "Ligue 2"],
+        "Coupe Nationale": ["Coupe de France", "Coupe de la Ligue", "Trophée des Champions"],
+        "Championnats étrangers": {
+            "Italie": ["Serie A", "Coppa Italia"],
+            "Espagne": ["Liga", "Copa del Rey"],
+            "Angleterre": ["Premier League", "FA Cup"],
+            "Allemagne": ["Bundesliga"]
+        }
+    },
+    "Amicaux Internationaux": {
+        "Amical": ["Amical", "Opel Master Cup"],
+        "Tournoi international": ["Tournoi Hassan II", "Kirin Cup"]
+    }
+}
+
+# Alertes Graal : file d'envoi SMTP et registre des demandes, partagés par tout le processus
+@st.cache_resource
+def file_alertes():
+    return FileAlertes(config_depuis_secrets(st.secrets))
+
+@st.cache_resource
+def registre_graal():
+    return RegistreGraal()
+
+def signaler_graal(df_nouveaux):
+    # Appelé en arrière-plan quand des matchs arrivent : seules les demandes dont l'alerte est bien dans
+    # la file sont closes ; en cas d'échec (SMTP non configuré...), les autres restent ouvertes
+    registre = registre_graal()
+    signalees = []
+    try:
+        for trouvaille in registre.rapprocher(df_nouveaux):
+            file_alertes().envoyer(*message_trouvaille(trouvaille))
+            signalees.append(trouvaille)
+    finally:
+        registre.clore(signalees)
+
+# Chargement des données (instantané Arrow, repli sur le CSV s'il est périmé)
+# Le gestionnaire est partagé par tout le processus et suit les ajouts à matchs.csv. Toutes les
+# sessions lisent le même catalogue, sans copie : il est en lecture seule, on ne fait que le filtrer.
+@st.cache_resource
+def gestionnaire_catalogue():
+    return GestionnaireCatalogue(MENU_ARBO, observateurs=[signaler_graal])
+
+@st.cache_resource(max_entries=2)
+def moteur_recherche(version, _catalogue):
+    # Un moteur (et son cache de résultats) par version du catalogue
+    return MoteurRecherche(_catalogue.index_equipes, _catalogue.index_filtres)
+
+def catalogue_courant():
+    # Appelé par les pages qui affichent des matchs : les autres ne chargent rien
+    try:
+        with mesure("chargement_catalogue"):
+            return gestionnaire_catalogue().actualiser()
+    except Exception as e:
+        st.error(f"Erreur de lecture : {e}")
+        st.stop()
+
+COLONNES_POSSIBLES = ['Match','Saison', 'Date', 'Compétition', 'Phase', 'Journée', 'Domicile', 'Extérieur', 'Score', 'Stade', 'Diffuseur', 'Langue', 'Qualité', 'Commentaires sur fichier']
+
+# --- OUTIL : FICHES DE MATCHS ---
+TAILLES_PAGE_FICHES = [20, 50, 100]
+
+def afficher_pagination(page_fiches, nb_pages, position):
+    c_debut, c_prec, c_info, c_suiv, c_fin = st.columns([1, 1, 2, 1, 1])
+    with c_debut:
+        if st.button("⏮️", key=f"fiches_debut_{position}", use_container_width=True, disabled=page_fiches == 0):
+            st.session_state.fiches_page = 0
+            st.rerun()
+    with c_prec:
+        if st.button("◀️", key=f"fiches_prec_{position}", use_container_width=True, disabled=page_fiches == 0):
+            st.session_state.fiches_page = page_fiches - 1
+            st.rerun()
+    with c_info:
+        st.markdown(f"<p style='text-align: center; margin-top: 8px;'>Page <b>{page_fiches + 1}</b> / {nb_pages}</p>", unsafe_allow_html=True)
+    with c_suiv:
+        if st.button("▶️", key=f"fiches_suiv_{position}", use_container_width=True, disabled=page_fiches >= nb_pages - 1):
+            st.session_state.fiches_page = page_fiches + 1
+            st.rerun()
+    with c_fin:
+        if st.button("⏭️", key=f"fiches_fin_{position}", use_container_width=True, disabled=page_fiches >= nb_pages - 1):
+            st.session_state.fiches_page = nb_pages - 1
+            st.rerun()
+
+# --- CANAL DU PANIER ---
+# Une action sur le panier (fiche, sélection du tableau, ligne du panier) ne réexécute que son
+# fragment et la pastille de la barre latérale, jamais la page entière : filtres, fiches et logos
+# restent tels quels. Les rappels (on_click) modifient st.session_state.panier puis désignent les
+# fragments à redessiner.
+BADGE_PANIER = "badge_panier"
+
+def rafraichir_panier(*fragments):
+    st.rerun([*fragments, BADGE_PANIER])
+
+def basculer_fiche(row, cle_fragment):
+    match_id = cle_match(row)
+    if match_id in st.session_state.panier:
+        retirer_du_panier(st.session_state.panier, match_id)
+    else:
+        ajouter_au_panier(st.session_state.panier, row)
+    rafraichir_panier(cle_fragment)
+
+def bouton_panier_fiche(row, cle_bouton, cle_fragment):
+    if cle_match(row) in st.session_state.panier:
+        st.button("✅ Ajouté (Retirer)", key=cle_bouton, use_container_width=True,
+                  on_click=basculer_fiche, args=(row, cle_fragment))
+    else:
+        st.button("🛒 Ajouter au panier", key=cle_bouton, type="primary", use_container_width=True,
+                  on_click=basculer_fiche, args=(row, cle_fragment))
+
+TABLEAU_SELECTION = "tableau_selection"
+
+def ajouter_selection(df_selection):
+    ajouter_lot_au_panier(st.session_state.panier, df_selection)
+    # Matchs ajoutés : nouveau tableau (cases décochées, bouton masqué) au redessin du fragment
+    st.session_state.tableau_selection_n = st.session_state.get('tableau_selection_n', 0) + 1
+    rafraichir_panier(TABLEAU_SELECTION)
+
+@st.fragment(key=TABLEAU_SELECTION)
+def tableau_selection(df_resultats):
+    # Cocher des cases ne réexécute que le tableau et son bouton
+    st.markdown("<p style='color: gray; font-size:14px;'>☑️ Cochez les matchs dans la première colonne, puis cliquez sur le bouton bleu apparu juste au-dessus du tableau pour les ajouter au panier.</p>", unsafe_allow_html=True)
+    
+    # Astuce : On crée un "espace vide" au-dessus du tableau que l'on remplira plus tard
+    bouton_placeholder = st.empty()
+    
+    colonnes_presentes = [c for c in COLONNES_POSSIBLES if c in df_resultats.columns]
+    df_display = df_resultats[colonnes_presentes]
+    df_display.insert(0, "Sélection", False)
+    
+    edited_df = st.data_editor(
+        df_display,
+        column_config={
+            "Sélection": st.column_config.CheckboxColumn("🛒 Ajouter", default=False)
+        },
+        disabled=colonnes_presentes,
+        hide_index=True,
+        use_container_width=True,
+        height=400,
+        key=f"editeur_selection_{st.session_state.get('tableau_selection_n', 0)}"
+    )
+    
+    selected_rows = edited_df[edited_df["Sélection"] == True]
+    
+    # On remplit l'espace vide situé AU-DESSUS avec le bouton bleu si des cases sont cochées
+    if len(selected_rows) > 0:
+        with bouton_placeholder:
+            st.button(f"🛒 Ajouter les {len(selected_rows)} match(s) sélectionné(s) au panier", type="primary", use_container_width=True,
+                      on_click=ajouter_selection, args=(df_resultats.loc[selected_rows.index],))
+
+@chronometre("affichage_resultats", taille=len)
+def afficher_resultats(df_resultats):
+    if df_resultats.empty:
+        st.warning("Aucun match trouvé.")
+        return
+        
+    # --- BOUTON TOUT AJOUTER ---
+    col_metrique, col_ajout_tout = st.columns([1, 1])
+    
+    with col_metrique:
+        st.metric("Matchs trouvés", len(df_resultats))
+        
+    with col_ajout_tout:
+        st.markdown("<div style='margin-top: 15px;'></div>", unsafe_allow_html=True)
+        if st.button(f"🛒 Ajouter la totalité des {len(df_resultats)} matchs au panier", use_container_width=True, type="primary"):
+            ajouter_lot_au_panier(st.session_state.panier, df_resultats)
+            st.rerun()
+    
+    mode = st.radio("Mode d'affichage :", ["📊 Tableau classique", "🃏 Fiches détaillées"], horizontal=True)
+    
+    if mode == "📊 Tableau classique":
+        tableau_selection(df_resultats)
+
+    else:
+        # Seules les fiches de la page courante sont construites, quel que soit le nombre de résultats
+        taille_page = st.selectbox("🃏 Fiches par page :", TAILLES_PAGE_FICHES, key="fiches_taille")
+        nb_pages = max(1, -(-len(df_resultats) // taille_page))
+        
+        # Nouveaux résultats (autre page, autre filtre) : retour à la première page
+        signature = (st.session_state.page, len(df_resultats), df_resultats.index[0], df_resultats.index[-1])
+        if st.session_state.get('fiches_signature') != signature:
+            st.session_state.fiches_signature = signature
+            st.session_state.fiches_page = 0
+        page_fiches = min(st.session_state.fiches_page, nb_pages - 1)
+        df_page = df_resultats.iloc[page_fiches * taille_page:(page_fiches + 1) * taille_page]
+        
+        st.write("---")
+        if nb_pages > 1:
+            afficher_pagination(page_fiches, nb_pages, "haut")
+        cols = st.columns(2)
+        
+        for i, (index, row) in enumerate(df_page.iterrows()):
+            with cols[i % 2]:
+                with st.container(border=True):
+                    
+                    stade = row.get('Stade', 'Stade inconnu')
+                    if pd.isna(stade) or not str(stade).strip(): stade = "Stade inconnu"
+                    val_phase = str(row.get('Phase', '')).strip() if pd.notna(row.get('Phase')) else ""
+                    comp_name = str(row.get('Compétition', '')).strip()
+                    
+                    stade_str = stade
+                    if val_phase: stade_str += f" - {val_phase}"
+                    
+                    st.caption(f"🗓️ {row['date_longue']} | 🏟️ {stade_str}")
+                    
+                    if comp_name:
+                        if st.button(f"🏆 {comp_name}", key=f"btn_comp_{index}_{i}", use_container_width=True):
+                            st.session_state.recherche_comp_cible = comp_name
+                            aller_a('recherche_avancee')
+                    
+                    dom = row.get('Domicile', '')
+                    ext = row.get('Extérieur', '')
+                    score = row.get('Score', '-')
+                    
+                    logo_dom = source_logo(dom, statique=LOGOS_STATIQUES)
+                    logo_ext = source_logo(ext, statique=LOGOS_STATIQUES)
+                    
+                    c_dom, c_score, c_ext = st.columns([1, 1, 1])
+                    
+                    with c_dom:
+                        if logo_dom:
+                            html_dom = f"<div style='text-align:center;'><img src='{logo_dom}' style='width:60px; margin-bottom:5px;'></div>"
+                            st.markdown(html_dom, unsafe_allow_html=True)
+                        if st.button(dom, key=f"btn_dom_{index}_{i}", use_container_width=True):
+                            st.session_state.recherche_equipe_cible = dom
+                            aller_a('recherche_equipe')
+                        
+                    with c_score:
+                        st.markdown(f"<h2 style='text-align: center; margin-top: 15px;'>{score}</h2>", unsafe_allow_html=True)
+                        
+                    with c_ext:
+                        if logo_ext:
+                            html_ext = f"<div style='text-align:center;'><img src='{logo_ext}' style='width:60px; margin-bottom:5px;'></div>"
+                            st.markdown(html_ext, unsafe_allow_html=True)
+                        if st.button(ext, key=f"btn_ext_{index}_{i}", use_container_width=True):
+                            st.session_state.recherche_equipe_cible = ext
+                            aller_a('recherche_equipe')
+                    
+                    diffuseur = row.get('Diffuseur', '')
+                    qualite = row.get('Qualité', '')
+                    has_diff = pd.notna(diffuseur) and str(diffuseur).strip() != ""
+                    has_qual = pd.notna(qualite) and str(qualite).strip() != ""
+                    
+                    if has_diff or has_qual:
+                        html_footer = "<div style='text-align: center; margin-top:12px; border-top: 0.5px solid #444; padding-top:8px;'>"
+                        if has_diff:
+                            html_footer += f"<span style='background-color:#1E3A8A; color:white; padding: 4px 10px; border-radius: 12px; font-size:12px; margin-right:8px; font-weight:500;'>📺 {diffuseur}</span>"
+                        if has_qual:
+                            couleur_q = "#8B5A2B" if row['has_dvd'] else "#4B5563"
+                            html_footer += f"<span style='background-color:{couleur_q}; color:white; padding: 4px 10px; border-radius: 12px; font-size:12px; font-weight:500;'>💾 {qualite}</span>"
+                        html_footer += "</div>"
+                        st.markdown(html_footer, unsafe_allow_html=True)
+                        
+                    st.write("") 
+                    
+                    # Un fragment par fiche : seul ce bouton (et la pastille du panier) est redessiné au clic
+                    cle_fragment = f"fiche_{index}_{i}"
+                    st.fragment(bouton_panier_fiche, key=cle_fragment)(row, f"cart_{index}_{i}", cle_fragment)
+
+        if nb_pages > 1:
+            afficher_pagination(page_fiches, nb_pages, "bas")
+
+# ==========================================
+# 🧭 BARRE LATÉRALE PERSISTANTE
+# ==========================================
+@st.fragment(key=BADGE_PANIER)
+def badge_panier():
+    # Pastille et jauge : redessinées seules à chaque action sur le panier (cf. rafraichir_panier)
+    nb_articles = len(st.session_state.panier)
+
+    if nb_articles > 0:
+        if st.button(f"🛒 Mon Panier ({nb_articles})", use_container_width=True, type="primary"):
+            aller_a('panier')
+    else:
+        if st.button("🛒 Mon Panier (0)", use_container_width=True):
+            aller_a('panier')
+        
+    nb_gratuits, reste, val_jauge = jauge_offert(nb_articles)
+
+    if nb_articles == 0:
+        msg_jauge = "🎁 1 match offert tous les 10 achetés !"
+    elif reste == 0:
+        pluriel = "s" if nb_gratuits > 1 else ""
+        msg_jauge = f"🎉 {nb_gratuits} match{pluriel} offert{pluriel} ! (Encore {ARTICLES_PAR_OFFERT} pour le prochain)"
+    elif reste == ARTICLES_PAR_OFFERT - 1:
+        msg_jauge = "🚨 Plus qu'un match pour débloquer votre cadeau !"
+    else:
+        manquant = ARTICLES_PAR_OFFERT - reste
+        msg_jauge = f"🔥 Plus que {manquant} matchs pour en avoir 1 offert !"
+
+    st.markdown(f"<p style='text-align: center; font-size: 13px; color: #d97706; margin-bottom: 5px; font-weight: 600;'>{msg_jauge}</p>", unsafe_allow_html=True)
+    st.progress(val_jauge)
+
+def barre_laterale():
+    with st.sidebar:
+        st.markdown("<h2 style='text-align: center;'>📺 Menu Rapide</h2>", unsafe_allow_html=True)
+        st.write("")
+    
+        if st.button("🏠 Accueil", use_container_width=True):
+            go_home()
+            aller_a('accueil')
+                
+        if st.button("❓ F.A.Q & Infos", use_container_width=True):
+            aller_a('faq')
+
+        if st.button("📱 Le Grenier sur mobile", use_container_width=True):
+            popup_raccourci_mobile() 
+
+        st.markdown("""
+            <a href="https://www.instagram.com/legrenierdufootball/" target="_blank" style="
+                display: flex;
+                align-items: center;
+                justify-content: center;
+                background-color: transparent;
+                border: 1px solid #555;
+                border-radius: 8px;
+                color: #fafafa;
+                padding: 10px;
+                text-decoration: none;
+                font-size: 15px;
+                font-weight: 500;
+                margin-bottom: 10px;
+                transition: 0.2s;
+            " onmouseover="this.style.borderColor='#E1306C'; this.style.color='#E1306C';" onmouseout="this.style.borderColor='#555'; this.style.color='#fafafa';">
+                <svg xmlns="http://www.w3.org/2000/svg" width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round" style="margin-right: 8px;">
+                    <rect x="2" y="2" width="20" height="20" rx="5" ry="5"></rect>
+                    <path d="M16 11.37A4 4 0 1 1 12.63 8 4 4 0 0 1 16 11.37z"></path>
+                    <line x1="17.5" y1="6.5" x2="17.51" y2="6.5"></line>
+                </svg>
+                Rejoignez le Grenier
+            </a>
+        """, unsafe_allow_html=True)
+        
+        st.divider()
+                      
+        badge_panier()
+            
+        st.divider()
+        st.markdown("""
+        <h3 style='margin-bottom: -10px;'>📂 Catégories</h3>
+    
+        <style>
+        div.element-container:has(.css-nations) + div.element-container button {
+            background-color: #b8860b !important; border-color: #b8860b !important;
+        }
+        div.element-container:has(.css-nations) + div.element-container button:hover {
+            background-color: #8b6508 !important; border-color: #8b6508 !important;
+        }
+        div.element-container:has(.css-nations) + div.element-container button p { color: white !important; font-weight: 500;}
+
+        div.element-container:has(.css-europe) + div.element-container button {
+            background-color: #1a2b4c !important; border-color: #1a2b4c !important;
+        }
+        div.element-container:has(.css-europe) + div.element-container button:hover {
+            background-color: #101a2e !important; border-color: #101a2e !important;
+        }
+        div.element-container:has(.css-europe) + div.element-container button p { color: white !important; font-weight: 500;}
+
+        div.element-container:has(.css-champ) + div.element-container button {
+            background-color: #722f37 !important; border-color: #722f37 !important;
+        }
+        div.element-container:has(.css-champ) + div.element-container button:hover {
+            background-color: #4a1e23 !important; border-color: #4a1e23 !important;
+        }
+        div.element-container:has(.css-champ) + div.element-container button p { color: white !important; font-weight: 500;}
+
+        div.element-container:has(.css-amicaux) + div.element-container button {
+            background-color: #5b7c6c !important; border-color: #5b7c6c !important;
+        }
+        div.element-container:has(.css-amicaux) + div.element-container button:hover {
+            background-color: #435b4f !important; border-color: #435b4f !important;
+        }
+        div.element-container:has(.css-amicaux) + div.element-container button p { color: white !important; font-weight: 500;}
+        </style>
+        """, unsafe_allow_html=True)
+
+        st.markdown('<div class="css-nations" style="margin-bottom: -15px;"></div>', unsafe_allow_html=True)
+        if st.button("🌍 Nations (Mondial, Euro...)", use_container_width=True):
+            st.session_state.chemin = ['Nations']
+            aller_a('arborescence')
+        
+        st.markdown('<div class="css-europe" style="margin-bottom: -15px;"></div>', unsafe_allow_html=True)
+        if st.button("🏆 Coupes d'Europe (LDC...)", use_container_width=True):
+            st.session_state.chemin = ["Coupes d'Europe"]
+            aller_a('arborescence')
+        
+        st.markdown('<div class="css-champ" style="margin-bottom: -15px;"></div>', unsafe_allow_html=True)
+        if st.button("🏟️ Championnats & Coupes", use_container_width=True):
+            st.session_state.chemin = ['Championnats & Coupes']
+            aller_a('arborescence')
+        
+        st.markdown('<div class="css-amicaux" style="margin-bottom: -15px;"></div>', unsafe_allow_html=True)
+        if st.button("🤝 Amicaux Internationaux", use_container_width=True):
+            st.session_state.chemin = ['Amicaux Internationaux']
+            aller_a('arborescence')
+        
+        st.divider()
+        st.markdown("### 🌟 Nouveautés")
+        if st.button("✨ Archives Dépoussiérées", use_container_width=True):
+            aller_a('pepites')
+        if st.button("🎯 Progression Collection", use_container_width=True):
+            aller_a('progression')
+        
+        st.divider()
+        st.markdown("### 🤝 Échanges & Requêtes")
+        if st.button("🔎 Mes Recherches", use_container_width=True):
+            aller_a('mes_recherches')
+        
+        st.divider()
+        st.markdown("### 🔍 Outils")
+        if st.button("📖 Catalogue Complet", use_container_width=True):
+            aller_a('catalogue')
+        if st.button("📊 Statistiques", use_container_width=True):
+            aller_a('statistiques')
+        if st.button("🛡️ Par Équipe", use_container_width=True):
+            aller_a('recherche_equipe')
+        if st.button("⚔️ Face-à-Face", use_container_width=True):
+            aller_a('face_a_face')
+        if st.button("🕵️ Recherche Avancée", use_container_width=True):
+            aller_a('recherche_avancee')
+
+# ==========================================
+# 🛑 PIED DE PAGE (FOOTER GLOBAL)
+# ==========================================
+def pied_de_page():
+    st.write("---")
+
+    foot_a, foot_b = st.columns([1, 1])
+
+    with foot_a:
+        st.markdown("<br><p style='color: gray; font-size: 14px;'>© 2026 - Le Grenier du Football<br><i>Archives pour passionnés.</i></p>", unsafe_allow_html=True)
+
+    with foot_b:
+        st.markdown("**Le Bureau de l'Archiviste**")
+        st.markdown("✉️ [legrenierdufootball@hotmail.com](mailto:legrenierdufootball@hotmail.com)")
+    
+        st.markdown("""
+            <div style="display: flex; gap: 15px; margin-top: 10px; align-items: center;">
+                <a href="https://www.instagram.com/legrenierdufootball/" target="_blank">
+                    <img src="https://upload.wikimedia.org/wikipedia/commons/a/a5/Instagram_icon.png" width="30" alt="Instagram">
+                </a>
+                <a href="https://www.facebook.com/profile.php?id=61584405236853" target="_blank">
+                    <img src="https://upload.wikimedia.org/wikipedia/commons/b/b8/2021_Facebook_icon.svg" width="30" alt="Facebook">
+                </a>
+            </div>
+        """, unsafe_allow_html=True)
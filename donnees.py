@@ -0,0 +1,257 @@
+# ==========================================
+# 📦 CATALOGUE DES MATCHS (CSV -> INSTANTANÉ ARROW)
+# ==========================================
+# Lecture de matchs.csv, normalisation, et instantané colonnaire (Arrow IPC)
+# relu en mémoire mappée au démarrage. Ce module ne dépend pas de Streamlit :
+# il sert aussi d'étape de construction -> `python donnees.py`
+import hashlib
+import os
+import re
+import threading
+import unicodedata
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+except ImportError:  # pyarrow absent : on reste sur la lecture du CSV
+    pa = None
+
+# Autre catalogue possible (bancs d'essai, cf. benchmarks/) : GRENIER_CSV=chemin/vers/catalogue.csv
+CHEMIN_CSV = os.environ.get("GRENIER_CSV", "matchs.csv")
+CHEMIN_INSTANTANE = os.environ.get("GRENIER_INSTANTANE", os.path.splitext(CHEMIN_CSV)[0] + ".arrow")
+CLE_SIGNATURE = b"grenier.signature_csv"
+# À incrémenter dès que la préparation des colonnes change : les instantanés existants deviennent périmés
+VERSION_INSTANTANE = 3
+
+
+# ==========================================
+# ⚙️ FONCTION MAGIQUE POUR LES NOMS D'ÉQUIPES
+# ==========================================
+def nettoyer_nom_equipe(nom):
+    if pd.isna(nom): return ""
+    nom_sans_accents = ''.join(c for c in unicodedata.normalize('NFD', str(nom)) if unicodedata.category(c) != 'Mn')
+    nom_propre = re.sub(r'[^a-z0-9]', '', nom_sans_accents.lower())
+    return nom_propre
+
+def nettoyer_noms_equipes(noms):
+    # Même nettoyage sur toute une colonne (accesseurs .str) ; valeur manquante -> ""
+    return (noms.astype("string").fillna("")
+            .str.normalize('NFD').str.encode('ascii', 'ignore').str.decode('ascii')
+            .str.lower().str.replace(r'[^a-z0-9]', '', regex=True))
+
+
+# --- SCHÉMA TYPÉ DU CATALOGUE ---
+# Les deux colonnes d'équipes partagent un même dictionnaire : une équipe a le même code
+# entier à domicile et à l'extérieur, et les filtres comparent des codes au lieu de chaînes.
+COLONNES_EQUIPES = ['Domicile', 'Extérieur']
+COLONNES_CATEGORIELLES = [
+    'Saison', 'Compétition', 'Phase', 'Stade', 'Diffuseur', 'Langue', 'Qualité', 'Type Compétition',
+]
+COLONNES_ENTIERES = ['Match', 'Journée', 'Numéro match EDF', 'Numéro match Milan dans compétition']
+
+# --- COLONNES DÉRIVÉES (calculées une fois, stockées dans l'instantané) ---
+COLONNES_DERIVEES = ['has_dvd', 'has_num', 'a_defaut', 'date_dt', 'date_longue', 'Affiche']
+MOTIF_DVD = r"dvd|vob"
+MOTIF_NUMERIQUE = r"mp4|mkv|avi|ts|numérique|mpeg|wmv|divx"
+EQUIPES_SANS_AFFICHE = ["Multiplex / Divers", "-", ""]
+JOURS_FR = ["lundi", "mardi", "mercredi", "jeudi", "vendredi", "samedi", "dimanche"]
+MOIS_FR = ["janvier", "février", "mars", "avril", "mai", "juin", "juillet", "août", "septembre", "octobre", "novembre", "décembre"]
+
+
+def signature_csv(chemin=CHEMIN_CSV):
+    empreinte = hashlib.sha1()
+    with open(chemin, "rb") as f:
+        for bloc in iter(lambda: f.read(1 << 20), b""):
+            empreinte.update(bloc)
+    return empreinte.hexdigest()
+
+
+def lire_csv(chemin=CHEMIN_CSV):
+    # chemin peut aussi être un flux d'octets (lecture incrémentale de la fin du fichier).
+    # Date toujours lue en texte : un bloc ajouté où toutes les dates sont des numéros de série
+    # Excel serait sinon une colonne d'entiers, où la date convertie ne peut pas être réécrite.
+    return pd.read_csv(chemin, sep=";", encoding="utf-8-sig", dtype={'Score': str, 'Date': str})
+
+
+def normaliser_catalogue(df):
+    df.columns = df.columns.str.strip()
+
+    df = df.dropna(subset=['Saison', 'Compétition'], how='all')
+
+    df['Domicile'] = df['Domicile'].fillna("Multiplex / Divers")
+    df['Extérieur'] = df['Extérieur'].fillna("-")
+    df['Score'] = df['Score'].fillna("-")
+    df['Stade'] = df['Stade'].fillna("Plusieurs stades")
+
+    df = df.dropna(subset=['Domicile', 'Extérieur'])
+
+    if 'Date' in df.columns:
+        dates_numeriques = pd.to_numeric(df['Date'], errors='coerce')
+        masque_excel = dates_numeriques.notna()
+        if masque_excel.any():
+            dates_converties = pd.to_datetime(dates_numeriques[masque_excel], unit='D', origin='1899-12-30')
+            df.loc[masque_excel, 'Date'] = dates_converties.dt.strftime('%d/%m/%Y')
+
+    return enrichir_catalogue(appliquer_schema(df.reset_index(drop=True)))
+
+
+def appliquer_schema(df):
+    equipes = sorted(set(df['Domicile'].dropna()) | set(df['Extérieur'].dropna()))
+    dtype_equipes = pd.CategoricalDtype(equipes)
+    for col in COLONNES_EQUIPES:
+        df[col] = df[col].astype(dtype_equipes)
+
+    for col in COLONNES_CATEGORIELLES:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+
+    for col in COLONNES_ENTIERES:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors='coerce').round().astype('Int64')
+    return df
+
+
+def enrichir_catalogue(df):
+    # Format disponible : DVD et/ou numérique ; une qualité non reconnue est vendue en numérique
+    qualite = df['Qualité'].astype(str) if 'Qualité' in df.columns else pd.Series("", index=df.index)
+    df['has_dvd'] = qualite.str.contains(MOTIF_DVD, case=False, na=False).to_numpy(dtype=bool)
+    has_num = qualite.str.contains(MOTIF_NUMERIQUE, case=False, na=False).to_numpy(dtype=bool)
+    df['has_num'] = has_num | ~df['has_dvd'].to_numpy()
+
+    # Archive imparfaite : un commentaire est renseigné sur le fichier
+    if 'Commentaires sur fichier' in df.columns:
+        commentaire = df['Commentaires sur fichier'].fillna("").astype(str).str.strip()
+        df['a_defaut'] = (commentaire.ne("") & ~commentaire.str.lower().isin(['nan', 'none'])).to_numpy(dtype=bool)
+    else:
+        df['a_defaut'] = False
+
+    # Date longue des fiches : "Samedi 3 mai 1997" (la date brute si elle n'est pas au format jj/mm/aaaa)
+    date_brute = df['Date'].fillna("").astype(str) if 'Date' in df.columns else pd.Series("", index=df.index)
+    date_dt = pd.to_datetime(date_brute, format="%d/%m/%Y", errors='coerce')
+    valides = date_dt.notna().to_numpy()
+    date_longue = date_brute.to_numpy(dtype=object)
+    if valides.any():
+        dates = date_dt[valides].dt
+        jours = np.asarray(JOURS_FR, dtype=object)[dates.dayofweek.to_numpy()]
+        mois = np.asarray(MOIS_FR, dtype=object)[dates.month.to_numpy() - 1]
+        date_longue[valides] = jours + " " + dates.day.astype(str).to_numpy(dtype=object) + " " + mois + " " + dates.year.astype(str).to_numpy(dtype=object)
+    df['date_dt'] = date_dt
+    df['date_longue'] = pd.Series(date_longue, index=df.index, dtype=str).str.capitalize()
+
+    # Affiche : les deux équipes dans l'ordre alphabétique, pour compter A-B et B-A ensemble
+    dom = df['Domicile'].astype(str).str.strip()
+    ext = df['Extérieur'].astype(str).str.strip()
+    dans_ordre = dom <= ext
+    affiche = dom.where(dans_ordre, ext) + " - " + ext.where(dans_ordre, dom)
+    sans_affiche = dom.isin(EQUIPES_SANS_AFFICHE) | ext.isin(EQUIPES_SANS_AFFICHE)
+    df['Affiche'] = affiche.where(~sans_affiche).astype('category')
+    return df
+
+
+def etendre_catalogue(df, df_queue):
+    # Ajoute des lignes normalisées à la fin du catalogue, sans toucher à l'ancien DataFrame.
+    # Les colonnes catégorielles prennent l'union des deux dictionnaires (les deux colonnes
+    # d'équipes gardent un dictionnaire commun) ; les positions existantes ne changent pas.
+    categories = {}
+    for col in df.columns:
+        if isinstance(df[col].dtype, pd.CategoricalDtype) and col not in COLONNES_EQUIPES:
+            categories[col] = df[col].cat.categories
+    categories_equipes = df[COLONNES_EQUIPES[0]].cat.categories
+    for col in COLONNES_EQUIPES:
+        categories_equipes = categories_equipes.union(df_queue[col].astype(object).dropna().unique())
+
+    colonnes = {}
+    for col in df.columns:
+        ancienne = df[col]
+        nouvelle = df_queue[col] if col in df_queue.columns else pd.Series(pd.NA, index=df_queue.index)
+        if col in COLONNES_EQUIPES or col in categories:
+            cats = categories_equipes if col in COLONNES_EQUIPES else categories[col].union(nouvelle.astype(object).dropna().unique())
+            dtype = pd.CategoricalDtype(cats)
+            ancienne = ancienne if ancienne.dtype == dtype else ancienne.cat.set_categories(cats)
+            nouvelle = nouvelle.astype(object).astype(dtype)
+        elif nouvelle.dtype != ancienne.dtype:
+            nouvelle = nouvelle.astype(ancienne.dtype)
+        colonnes[col] = pd.concat([ancienne, nouvelle], ignore_index=True)
+
+    resultat = pd.DataFrame(colonnes)
+    resultat.attrs = dict(df.attrs)
+    return resultat
+
+
+def figer_catalogue(df):
+    # Catalogue partagé par toutes les sessions : ses tableaux numpy passent en lecture seule.
+    # Filtrer reste libre (copy-on-write) ; une écriture en place sur le catalogue partagé
+    # lève une erreur au lieu de modifier ce que voient les autres visiteurs.
+    for col in df.columns:
+        valeurs = df[col].array
+        for nom in ('_ndarray', '_data', '_mask', '_codes'):
+            tableau = getattr(valeurs, nom, None)
+            # La colonne peut être une vue d'un bloc 2D : on fige aussi le tableau d'origine
+            while isinstance(tableau, np.ndarray):
+                tableau.flags.writeable = False
+                tableau = tableau.base
+    return df
+
+
+# --- INSTANTANÉ ARROW ---
+def construire_instantane(chemin_csv=CHEMIN_CSV, chemin_instantane=CHEMIN_INSTANTANE, df=None, signature=None):
+    if pa is None:
+        raise RuntimeError("pyarrow est nécessaire pour construire l'instantané du catalogue")
+    if signature is None:
+        signature = signature_csv(chemin_csv)
+    if df is None:
+        df = normaliser_catalogue(lire_csv(chemin_csv))
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}), CLE_SIGNATURE: f"{VERSION_INSTANTANE}:{signature}".encode()})
+
+    # Écriture dans un fichier temporaire propre à ce fil puis renommage : un lecteur ne voit jamais un
+    # fichier à moitié écrit, deux écritures simultanées ne se mélangent pas
+    chemin_tmp = f"{chemin_instantane}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with pa.OSFile(chemin_tmp, "wb") as sortie:
+        with pa.ipc.new_file(sortie, table.schema) as ecrivain:
+            ecrivain.write_table(table)
+    os.replace(chemin_tmp, chemin_instantane)
+    return df
+
+
+def charger_instantane(chemin_instantane=CHEMIN_INSTANTANE, signature=None):
+    # Renvoie None si l'instantané est absent, illisible ou périmé par rapport au CSV
+    if pa is None or not os.path.exists(chemin_instantane):
+        return None
+    try:
+        source = pa.memory_map(chemin_instantane, "r")
+        table = pa.ipc.open_file(source).read_all()
+    except (OSError, pa.ArrowInvalid):
+        return None
+
+    metadata = table.schema.metadata or {}
+    if signature is not None and metadata.get(CLE_SIGNATURE, b"").decode() != f"{VERSION_INSTANTANE}:{signature}":
+        return None
+    return table.to_pandas(split_blocks=True)
+
+
+def charger_catalogue(chemin_csv=CHEMIN_CSV, chemin_instantane=CHEMIN_INSTANTANE, signature=None):
+    if signature is None:
+        signature = signature_csv(chemin_csv)
+
+    df = charger_instantane(chemin_instantane, signature)
+    if df is None:
+        # Instantané périmé : on repasse par le CSV et on tente de le régénérer pour le prochain démarrage
+        df = normaliser_catalogue(lire_csv(chemin_csv))
+        if pa is not None:
+            try:
+                construire_instantane(chemin_csv, chemin_instantane, df=df, signature=signature)
+            except OSError:
+                pass
+
+    # Version du catalogue : clé des caches calculés à partir de lui (statistiques...)
+    df.attrs['version'] = f"{VERSION_INSTANTANE}:{signature}"
+    return df
+
+
+if __name__ == "__main__":
+    df = construire_instantane()
+    print(f"✅ {CHEMIN_INSTANTANE} généré : {len(df)} matchs")
@@ -0,0 +1,273 @@
+# ==========================================
+# 🏆 REGISTRE DES GRAALS (MATCHS RECHERCHÉS)
+# ==========================================
+# Chaque alerte du formulaire "ALERTE-MOI" est gardée dans une base SQLite locale. Le texte
+# libre ("Nantes-Juventus 96", "la finale de la Coupe du Monde 98"...) est réduit à des jetons :
+#  - equipe:<nom nettoyé>  (groupes de 1 à 4 mots reconnus parmi les équipes du catalogue) ;
+#  - competition:<famille> (Coupe du Monde, Euro, C1, Coupe de France...) ;
+#  - annee:<aaaa>          ("96" -> 1996, "2002" -> 2002).
+# Les jetons des demandes ouvertes forment un index inversé (table jetons, clé jeton). Quand des
+# matchs arrivent dans matchs.csv, leurs jetons sont joints à cet index en une seule requête :
+# une demande est satisfaite par un match qui porte tous ses jetons (COUNT = nb_jetons), sans
+# comparer chaque match à chaque demande.
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import date
+
+import pandas as pd
+
+from alertes import CHEMIN_ATTENTE
+from donnees import nettoyer_nom_equipe, nettoyer_noms_equipes
+from indexation import mots_normalises
+
+CHEMIN_GRAAL = os.path.join(os.path.dirname(CHEMIN_ATTENTE), "graal.sqlite")
+
+# Familles de compétitions : expressions reconnues (mots sans accents, minuscules).
+# Les expressions les plus longues sont cherchées d'abord ("coupe du monde des clubs" avant "coupe du monde").
+FAMILLES_COMPETITIONS = {
+    'cdm_clubs': ["coupe du monde des clubs", "mondial des clubs"],
+    'cdm': ["coupe du monde", "mondial", "cdm", "world cup"],
+    'euro': ["euro", "championnat d europe"],
+    'c1': ["champions league", "ligue des champions", "coupe d europe des clubs champions", "coupe des clubs champions", "c1"],
+    'c2': ["coupe des coupes", "c2"],
+    'c3': ["coupe uefa", "europa league", "c3"],
+    'supercoupe': ["supercoupe d europe"],
+    'intertoto': ["intertoto"],
+    'coupe_france': ["coupe de france"],
+    'coupe_ligue': ["coupe de la ligue"],
+    'championnat_france': ["ligue 1", "division 1", "d1"],
+    'serie_a': ["serie a"],
+    'liga': ["liga"],
+    'premier_league': ["premier league"],
+}
+MOTIFS_COMPETITIONS = sorted(
+    ((f" {expression} ", famille) for famille, expressions in FAMILLES_COMPETITIONS.items() for expression in expressions),
+    key=lambda motif: -len(motif[0]),
+)
+TAILLE_MAX_NOM = 4  # nombre de mots maximal d'un nom d'équipe
+# Premiers mots de noms d'équipes trop courants dans une phrase pour servir d'alias
+MOTS_GENERIQUES = {
+    "club", "derby", "stade", "union", "racing", "sporting", "olympique", "royal", "etoile", "avenir", "cote", "afrique",
+    "reste", "nouvelle", "haut", "republique", "west", "young", "standard", "fifa",
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS demandes (
+    id INTEGER PRIMARY KEY,
+    email TEXT NOT NULL,
+    texte TEXT NOT NULL,
+    cree REAL NOT NULL,
+    nb_jetons INTEGER NOT NULL,
+    statut TEXT NOT NULL DEFAULT 'ouverte'
+);
+CREATE TABLE IF NOT EXISTS jetons (
+    jeton TEXT NOT NULL,
+    demande INTEGER NOT NULL REFERENCES demandes(id),
+    PRIMARY KEY (jeton, demande)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS trouvailles (
+    demande INTEGER NOT NULL REFERENCES demandes(id),
+    match TEXT NOT NULL,
+    trouve REAL NOT NULL,
+    PRIMARY KEY (demande, match)
+);
+"""
+
+
+@dataclass(frozen=True)
+class Trouvaille:
+    demande: int
+    email: str
+    texte: str
+    matchs: list  # fiches (dict) des matchs qui satisfont la demande
+
+
+# --- JETONS ---
+# Demandes et matchs passent par le même nettoyage que les noms d'équipes du catalogue
+# (donnees.nettoyer_nom_equipe, mot par mot via indexation.mots_normalises)
+def _extraire_competitions(mots):
+    # Renvoie les familles trouvées et les mots restants
+    texte = f" {' '.join(mots)} "
+    familles = set()
+    for motif, famille in MOTIFS_COMPETITIONS:
+        if motif in texte:
+            familles.add(famille)
+            texte = texte.replace(motif, " | ")
+    return familles, [mot for mot in texte.split() if mot != "|"]
+
+
+def familles_competition(nom):
+    return _extraire_competitions(mots_normalises(nom))[0]
+
+
+def lexique_equipes(equipes):
+    # Nom nettoyé (cf. donnees.nettoyer_nom_equipe) -> jeton ; les noms vides sont écartés.
+    # Le premier mot d'un nom composé sert d'alias s'il ne désigne qu'une équipe ("bayern").
+    lexique = {}
+    alias = {}
+    for equipe in equipes:
+        cle = nettoyer_nom_equipe(equipe)
+        if not cle or cle.isdigit():
+            continue
+        lexique[cle] = f"equipe:{cle}"
+        mots = mots_normalises(equipe)
+        if len(mots) > 1 and len(mots[0]) > 3 and not mots[0].isdigit():
+            alias.setdefault(mots[0], set()).add(cle)
+    for mot, cles in alias.items():
+        if len(cles) == 1 and mot not in lexique and mot not in MOTS_GENERIQUES:
+            lexique[mot] = f"equipe:{cles.pop()}"
+    return lexique
+
+
+def _annee(mot):
+    if len(mot) == 4 and mot.isdigit() and 1900 <= int(mot) <= 2100:
+        return int(mot)
+    if len(mot) == 2 and mot.isdigit():
+        return 2000 + int(mot) if int(mot) <= date.today().year % 100 else 1900 + int(mot)
+    return None
+
+
+def jetons_demande(texte, lexique):
+    familles, mots = _extraire_competitions(mots_normalises(texte))
+    jetons = {f"competition:{famille}" for famille in familles}
+
+    # Équipes : plus long groupe de mots reconnu d'abord ("saint etienne" -> saintetienne)
+    restants = []
+    i = 0
+    while i < len(mots):
+        for taille in range(min(TAILLE_MAX_NOM, len(mots) - i), 0, -1):
+            jeton = lexique.get(''.join(mots[i:i + taille]))
+            if jeton:
+                jetons.add(jeton)
+                i += taille
+                break
+        else:
+            restants.append(mots[i])
+            i += 1
+
+    jetons.update(f"annee:{annee}" for annee in map(_annee, restants) if annee)
+    return jetons
+
+
+def jetons_matchs(df):
+    # (position dans df, jeton) pour chaque match, colonne par colonne ; familles calculées une fois par compétition
+    df = df.reset_index(drop=True)
+    equipes = pd.concat([nettoyer_noms_equipes(df['Domicile']), nettoyer_noms_equipes(df['Extérieur'])])
+    equipes = "equipe:" + equipes[equipes != ""]
+
+    competitions = df['Compétition'].dropna().astype(object)
+    familles = {
+        competition: [f"competition:{famille}" for famille in familles_competition(competition)]
+        for competition in competitions.unique()
+    }
+    competitions = competitions.map(familles).explode().dropna()
+
+    if 'date_dt' in df.columns:
+        annees = "annee:" + df['date_dt'].dt.year.dropna().astype(int).astype(str)
+    else:
+        annees = pd.Series(dtype=object)
+
+    jetons = pd.concat([equipes.astype(object), competitions, annees.astype(object)])
+    return set(zip(jetons.index.tolist(), jetons.tolist()))
+
+
+# --- REGISTRE ---
+class RegistreGraal:
+    def __init__(self, chemin=CHEMIN_GRAAL):
+        self.chemin = chemin
+        self._verrou = threading.Lock()
+        dossier = os.path.dirname(chemin)
+        if dossier:
+            os.makedirs(dossier, exist_ok=True)
+        with self._connexion() as base:
+            base.executescript(SCHEMA)
+
+    @contextmanager
+    def _connexion(self):
+        # Une connexion par opération (appels depuis plusieurs fils), validée puis fermée
+        base = sqlite3.connect(self.chemin, timeout=30)
+        base.row_factory = sqlite3.Row
+        try:
+            with base:
+                yield base
+        finally:
+            base.close()
+
+    def enregistrer(self, email, texte, equipes):
+        # equipes : vocabulaire du catalogue courant. Une demande sans équipe ni compétition
+        # reconnue est gardée mais jamais rapprochée automatiquement (une année seule est trop vague).
+        jetons = jetons_demande(texte, lexique_equipes(equipes))
+        if not any(not jeton.startswith("annee:") for jeton in jetons):
+            jetons = set()
+        with self._verrou, self._connexion() as base:
+            curseur = base.execute(
+                "INSERT INTO demandes (email, texte, cree, nb_jetons) VALUES (?, ?, ?, ?)",
+                (email, texte, time.time(), len(jetons)),
+            )
+            base.executemany("INSERT INTO jetons (jeton, demande) VALUES (?, ?)",
+                             [(jeton, curseur.lastrowid) for jeton in sorted(jetons)])
+        return curseur.lastrowid
+
+    def demandes_ouvertes(self):
+        with self._connexion() as base:
+            return base.execute("SELECT COUNT(*) FROM demandes WHERE statut = 'ouverte'").fetchone()[0]
+
+    def rapprocher(self, df_nouveaux):
+        # Demandes ouvertes satisfaites par au moins un des nouveaux matchs (sans les clore)
+        if df_nouveaux.empty:
+            return []
+        paires = jetons_matchs(df_nouveaux)
+        with self._verrou, self._connexion() as base:
+            base.execute("CREATE TEMP TABLE lignes (position INTEGER NOT NULL, jeton TEXT NOT NULL)")
+            base.executemany("INSERT INTO lignes (position, jeton) VALUES (?, ?)", paires)
+            resultats = base.execute("""
+                SELECT d.id, d.email, d.texte, l.position
+                FROM lignes l
+                JOIN jetons j ON j.jeton = l.jeton
+                JOIN demandes d ON d.id = j.demande AND d.statut = 'ouverte'
+                GROUP BY d.id, l.position
+                HAVING COUNT(*) = d.nb_jetons
+                ORDER BY d.id, l.position
+            """).fetchall()
+            base.execute("DROP TABLE lignes")
+
+        trouvailles = {}
+        for ligne in resultats:
+            if ligne['id'] not in trouvailles:
+                trouvailles[ligne['id']] = Trouvaille(ligne['id'], ligne['email'], ligne['texte'], [])
+            fiche = df_nouveaux.iloc[ligne['position']]
+            trouvailles[ligne['id']].matchs.append(
+                {champ: ("" if pd.isna(fiche.get(champ)) else fiche.get(champ))
+                 for champ in ('Match', 'Date', 'Compétition', 'Domicile', 'Extérieur')}
+            )
+        return list(trouvailles.values())
+
+    def clore(self, trouvailles):
+        # Demandes prévenues : retirées de l'index, matchs trouvés gardés en mémoire
+        maintenant = time.time()
+        with self._verrou, self._connexion() as base:
+            for trouvaille in trouvailles:
+                base.execute("UPDATE demandes SET statut = 'trouvee' WHERE id = ?", (trouvaille.demande,))
+                base.execute("DELETE FROM jetons WHERE demande = ?", (trouvaille.demande,))
+                base.executemany(
+                    "INSERT OR IGNORE INTO trouvailles (demande, match, trouve) VALUES (?, ?, ?)",
+                    [(trouvaille.demande, str(m['Match']), maintenant) for m in trouvaille.matchs],
+                )
+
+
+def message_trouvaille(trouvaille):
+    # Sujet et corps du message envoyé à l'archiviste, qui prévient le collectionneur
+    lignes = "\n".join(
+        f"- {m['Date']} | {m['Domicile']} - {m['Extérieur']} ({m['Compétition']}) [Match {m['Match']}]"
+        for m in trouvaille.matchs
+    )
+    sujet = f"🏆 GRAAL TROUVÉ : {trouvaille.texte}"
+    corps = (
+        f"Salut l'Archiviste,\n\nLa pépite recherchée par {trouvaille.email} vient d'arriver dans le Grenier :\n\n"
+        f"- Recherche : {trouvaille.texte}\n\nMatch(s) correspondant(s) :\n{lignes}\n\nÀ toi de le prévenir !"
+    )
+    return sujet, corps
@@ -0,0 +1,491 @@
+# ==========================================
+# 🗂️ INDEX DU CATALOGUE
+# ==========================================
+# Index inversés construits une fois au chargement : clé -> positions des lignes.
+# Le catalogue est réindexé de 0 à n-1 (normaliser_catalogue), les positions sont
+# donc aussi les étiquettes d'index des lignes.
+import re
+from bisect import bisect_left
+from dataclasses import dataclass
+
+import numpy as np
+
+from donnees import nettoyer_nom_equipe
+
+VIDE = np.empty(0, dtype=np.intp)
+
+
+def construire_index_equipes(df):
+    # Équipe -> positions triées des matchs où elle joue, à domicile comme à l'extérieur
+    morceaux = {}
+    for col in ['Domicile', 'Extérieur']:
+        for equipe, positions in df.groupby(col, observed=True, sort=False).indices.items():
+            morceaux.setdefault(equipe, []).append(positions)
+    return {equipe: np.unique(np.concatenate(liste)) for equipe, liste in morceaux.items()}
+
+
+def construire_index_confrontations(df):
+    # "Équipe A|Équipe B" -> positions, à partir de la colonne 'Clé face à face' du fichier
+    cles_equipes = df['Domicile'].astype(str) + "|" + df['Extérieur'].astype(str)
+    if 'Clé face à face' in df.columns:
+        # Clé incomplète quand une équipe manquait dans le fichier ("Multiplex / Divers", "-")
+        cles = df['Clé face à face']
+        incompletes = cles.isna() | cles.str.startswith("|", na=False) | cles.str.endswith("|", na=False)
+        cles = cles.where(~incompletes, cles_equipes)
+    else:
+        cles = cles_equipes
+    return dict(cles.groupby(cles, sort=False).indices)
+
+
+def _fusionner(index, ajouts, decalage=0):
+    # Nouvel index (l'ancien reste intact pour les sessions qui le lisent encore) : les positions
+    # ajoutées sont toutes après les positions existantes, la concaténation reste triée
+    fusion = dict(index)
+    for cle, positions in ajouts.items():
+        positions = positions + decalage
+        fusion[cle] = np.concatenate([index[cle], positions]) if cle in index else positions
+    return fusion
+
+
+def etendre_index_equipes(index_equipes, df_queue, decalage):
+    return _fusionner(index_equipes, construire_index_equipes(df_queue), decalage)
+
+
+def etendre_index_confrontations(index_confrontations, df_queue, decalage):
+    return _fusionner(index_confrontations, construire_index_confrontations(df_queue), decalage)
+
+
+def positions_equipe(index_equipes, equipe):
+    return index_equipes.get(equipe, VIDE)
+
+
+def positions_face_a_face(index_confrontations, equipe_a, equipe_b):
+    # La clé peut être écrite dans un sens ou dans l'autre selon la saisie
+    return np.union1d(
+        index_confrontations.get(f"{equipe_a}|{equipe_b}", VIDE),
+        index_confrontations.get(f"{equipe_b}|{equipe_a}", VIDE),
+    )
+
+
+# --- INDEX DES DATES (ÉPHÉMÉRIDE, RECHERCHE PAR DATE) ---
+@dataclass
+class IndexDates:
+    jours: dict                 # (mois, jour) -> positions des matchs joués ce jour-là, toutes années confondues
+    jours_semaine: dict         # 0 (lundi) ... 6 (dimanche) -> positions
+    dates_triees: np.ndarray    # dates connues, dans l'ordre chronologique
+    ordre: np.ndarray           # positions correspondant à dates_triees
+
+
+def construire_index_dates(df):
+    # S'appuie sur la colonne 'date_dt' (dates lues une fois au chargement, NaT si illisibles)
+    dates = df['date_dt']
+    connues = dates.notna()
+    dates_connues = dates[connues]
+    positions = np.flatnonzero(connues.to_numpy())
+    mois_jours = [dates_connues.dt.month.to_numpy(), dates_connues.dt.day.to_numpy()]
+    ordre = np.argsort(dates_connues.to_numpy(), kind="stable")
+    return IndexDates(
+        jours={(int(m), int(j)): positions[p] for (m, j), p in dates_connues.groupby(mois_jours, sort=False).indices.items()},
+        jours_semaine={int(j): positions[p] for j, p in dates_connues.groupby(dates_connues.dt.dayofweek.to_numpy(), sort=False).indices.items()},
+        dates_triees=dates_connues.to_numpy()[ordre],
+        ordre=positions[ordre],
+    )
+
+
+def etendre_index_dates(index_dates, df_queue, decalage):
+    ajout = construire_index_dates(df_queue)
+    rangs = np.searchsorted(index_dates.dates_triees, ajout.dates_triees, side="right")
+    return IndexDates(
+        jours=_fusionner(index_dates.jours, ajout.jours, decalage),
+        jours_semaine=_fusionner(index_dates.jours_semaine, ajout.jours_semaine, decalage),
+        dates_triees=np.insert(index_dates.dates_triees, rangs, ajout.dates_triees),
+        ordre=np.insert(index_dates.ordre, rangs, ajout.ordre + decalage),
+    )
+
+
+def positions_jour(index_dates, mois, jour):
+    return index_dates.jours.get((mois, jour), VIDE)
+
+
+def positions_jours_semaine(index_dates, jours_semaine):
+    morceaux = [index_dates.jours_semaine.get(j, VIDE) for j in jours_semaine]
+    return np.sort(np.concatenate(morceaux)) if morceaux else VIDE
+
+
+def positions_periode(index_dates, debut=None, fin=None, jours_semaine=None):
+    # Matchs joués entre debut et fin inclus (dates, ou None pour ne pas borner), dans l'ordre
+    # chronologique, éventuellement limités à certains jours de la semaine (0 = lundi)
+    gauche = 0 if debut is None else np.searchsorted(index_dates.dates_triees, np.datetime64(debut, "D"), side="left")
+    droite = len(index_dates.ordre) if fin is None else np.searchsorted(index_dates.dates_triees, np.datetime64(fin, "D") + 1, side="left")
+    positions = index_dates.ordre[gauche:droite]
+    if jours_semaine:
+        positions = positions[np.isin(positions, positions_jours_semaine(index_dates, jours_semaine))]
+    return positions
+
+
+# --- INDEX DES FILTRES (RECHERCHE AVANCÉE) ---
+COLONNES_FILTRES = ['Compétition', 'Phase', 'Stade', 'Saison']
+
+
+@dataclass
+class IndexFiltres:
+    valeurs: dict               # colonne -> {valeur -> positions}
+    dvd: np.ndarray             # positions des matchs disponibles en DVD
+    numerique: np.ndarray       # positions des autres matchs (numérique seulement)
+
+
+def construire_index_filtres(df):
+    est_dvd = df['has_dvd'].to_numpy(dtype=bool)
+    return IndexFiltres(
+        valeurs={col: dict(df.groupby(col, observed=True, sort=False).indices) for col in COLONNES_FILTRES if col in df.columns},
+        dvd=np.flatnonzero(est_dvd),
+        numerique=np.flatnonzero(~est_dvd),
+    )
+
+
+def etendre_index_filtres(index_filtres, df_queue, decalage):
+    ajout = construire_index_filtres(df_queue)
+    return IndexFiltres(
+        valeurs={col: _fusionner(index_filtres.valeurs.get(col, {}), ajout.valeurs.get(col, {}), decalage)
+                 for col in index_filtres.valeurs.keys() | ajout.valeurs.keys()},
+        dvd=np.concatenate([index_filtres.dvd, ajout.dvd + decalage]),
+        numerique=np.concatenate([index_filtres.numerique, ajout.numerique + decalage]),
+    )
+
+
+# --- VOCABULAIRES DES LISTES DE CHOIX ---
+# Options des selectbox / multiselect, calculées une fois par version du catalogue à partir des
+# clés des index, avec leur rang (index= d'un selectbox) et leur déclinaison par compétition.
+@dataclass
+class Vocabulaire:
+    equipes: list                   # toutes les équipes, par ordre alphabétique
+    rang_equipe: dict               # équipe -> rang dans equipes
+    options: dict                   # colonne -> valeurs triées (saisons : de la plus récente à la plus ancienne)
+    rangs: dict                     # colonne -> {valeur -> rang dans options[colonne]}
+    equipes_par_competition: dict   # compétition -> équipes qui y ont joué
+    saisons_par_competition: dict   # compétition -> saisons couvertes
+
+
+def _paires(df, cle, col):
+    if col not in df.columns:
+        return {}
+    paires = {}
+    for valeur_cle, valeur in df.groupby([cle, col], observed=True, sort=False).size().index:
+        paires.setdefault(valeur_cle, set()).add(valeur)
+    return paires
+
+
+def _vocabulaire(index_equipes, index_filtres, equipes_par_competition, saisons_par_competition):
+    equipes = sorted(index_equipes)
+    options = {col: sorted(valeurs, reverse=(col == 'Saison')) for col, valeurs in index_filtres.valeurs.items()}
+    return Vocabulaire(
+        equipes=equipes,
+        rang_equipe={equipe: rang for rang, equipe in enumerate(equipes)},
+        options=options,
+        rangs={col: {valeur: rang for rang, valeur in enumerate(valeurs)} for col, valeurs in options.items()},
+        equipes_par_competition={comp: sorted(eqs) for comp, eqs in equipes_par_competition.items()},
+        saisons_par_competition={comp: sorted(ss, reverse=True) for comp, ss in saisons_par_competition.items()},
+    )
+
+
+def construire_vocabulaire(df, index_equipes, index_filtres):
+    equipes = _paires(df, 'Compétition', 'Domicile')
+    for comp, eqs in _paires(df, 'Compétition', 'Extérieur').items():
+        equipes.setdefault(comp, set()).update(eqs)
+    return _vocabulaire(index_equipes, index_filtres, equipes, _paires(df, 'Compétition', 'Saison'))
+
+
+def etendre_vocabulaire(vocabulaire, df_queue, index_equipes, index_filtres):
+    # index_equipes / index_filtres : index déjà étendus ; seules les nouvelles lignes sont parcourues
+    ajout = construire_vocabulaire(df_queue, {}, IndexFiltres({}, VIDE, VIDE))
+    equipes = {comp: set(eqs) for comp, eqs in vocabulaire.equipes_par_competition.items()}
+    saisons = {comp: set(ss) for comp, ss in vocabulaire.saisons_par_competition.items()}
+    for comp, eqs in ajout.equipes_par_competition.items():
+        equipes.setdefault(comp, set()).update(eqs)
+    for comp, ss in ajout.saisons_par_competition.items():
+        saisons.setdefault(comp, set()).update(ss)
+    return _vocabulaire(index_equipes, index_filtres, equipes, saisons)
+
+
+def options_competitions(vocabulaire, competitions):
+    # (saisons, équipes) couvertes par un ensemble de compétitions (feuille de l'arborescence)
+    saisons, equipes = set(), set()
+    for comp in competitions:
+        saisons.update(vocabulaire.saisons_par_competition.get(comp, ()))
+        equipes.update(vocabulaire.equipes_par_competition.get(comp, ()))
+    return sorted(saisons, reverse=True), sorted(equipes)
+
+
+def restreindre(df_sous_ensemble, positions):
+    # Intersection d'un sous-ensemble déjà filtré avec une liste de positions du catalogue
+    return df_sous_ensemble.loc[np.intersect1d(df_sous_ensemble.index, positions, assume_unique=True)]
+
+
+# ==========================================
+# 🌳 INDEX DE L'ARBORESCENCE (MENU_ARBO)
+# ==========================================
+# Chaque feuille du menu est résolue une fois : les motifs sont appliqués aux noms de
+# compétitions distincts (quelques centaines) et non aux lignes, puis les positions des
+# compétitions retenues sont réunies.
+# Filtres nommés : (motif à inclure, motif à exclure), comme str.contains(..., case=False)
+FILTRES_COMPETITIONS = {
+    "FILTER_CDM_FINALE": ("Coupe du Monde", "Eliminatoires"),
+    "FILTER_CDM_ELIM": ("Eliminatoires Coupe du Monde", None),
+    "FILTER_EURO_FINALE": (r"\bEuro\b|Championnat d'Europe", "Eliminatoires|Europa|Coupe d'Europe"),
+    "FILTER_EURO_ELIM": (r"Eliminatoires \bEuro\b|Eliminatoires Championnat d'Europe", None),
+    # Pas une feuille du menu : sert à la page Progression
+    "FILTER_C1": ("Champions League|Coupe d'Europe des clubs champions", None),
+}
+PHASES_FINALE = ['finale', 'final']
+
+
+@dataclass
+class FeuilleArbo:
+    positions: np.ndarray
+    editions: list              # compétitions couvertes, en ordre alphabétique inverse (affichage des éditions)
+    editions_finales: list      # éditions dont au moins une finale est au catalogue
+    saisons_finales: int        # nombre de saisons distinctes dont une finale est au catalogue
+
+
+@dataclass
+class IndexArbo:
+    competitions: dict          # compétition -> positions
+    feuilles: dict              # feuille du menu (ou filtre nommé) -> FeuilleArbo
+
+
+def _feuilles_menu(noeud):
+    if isinstance(noeud, dict):
+        for enfant in noeud.values():
+            yield from _feuilles_menu(enfant)
+    elif isinstance(noeud, list):
+        yield from noeud
+    else:
+        yield noeud
+
+
+def _motif_feuille(feuille):
+    return FILTRES_COMPETITIONS.get(feuille, (feuille, None))
+
+
+def construire_index_arbo(df, menu):
+    competitions = dict(df.groupby('Compétition', observed=True, sort=False).indices)
+    return IndexArbo(competitions=competitions, feuilles=_resoudre_feuilles(df, competitions, menu))
+
+
+def etendre_index_arbo(index_arbo, df, df_queue, decalage, menu):
+    # df : catalogue complet (ancien + nouvelles lignes) ; seules les compétitions sont fusionnées,
+    # les motifs sont ré-appliqués aux noms de compétitions, jamais aux lignes
+    competitions = _fusionner(index_arbo.competitions, dict(df_queue.groupby('Compétition', observed=True, sort=False).indices), decalage)
+    return IndexArbo(competitions=competitions, feuilles=_resoudre_feuilles(df, competitions, menu))
+
+
+def _resoudre_feuilles(df, competitions, menu):
+    est_finale = np.zeros(len(df), dtype=bool)
+    if 'Phase' in df.columns:
+        est_finale = df['Phase'].str.strip().str.lower().isin(PHASES_FINALE).to_numpy(dtype=bool)
+
+    feuilles = {}
+    for feuille in dict.fromkeys([*_feuilles_menu(menu), *FILTRES_COMPETITIONS]):
+        inclure, exclure = _motif_feuille(feuille)
+        retenues = [
+            comp for comp in competitions
+            if re.search(inclure, comp, re.IGNORECASE) and not (exclure and re.search(exclure, comp, re.IGNORECASE))
+        ]
+        positions = np.sort(np.concatenate([competitions[comp] for comp in retenues])) if retenues else VIDE
+        finales = positions[est_finale[positions]]
+        feuilles[feuille] = FeuilleArbo(
+            positions=positions,
+            editions=sorted(retenues, reverse=True),
+            editions_finales=sorted({comp for comp in retenues if est_finale[competitions[comp]].any()}, reverse=True),
+            saisons_finales=int(df['Saison'].iloc[finales].nunique()) if 'Saison' in df.columns else len(finales),
+        )
+    return feuilles
+
+
+def positions_feuille(index_arbo, feuille):
+    entree = index_arbo.feuilles.get(feuille)
+    return entree.positions if entree is not None else VIDE
+
+
+def positions_competition(index_arbo, competition):
+    return index_arbo.competitions.get(competition, VIDE)
+
+
+# ==========================================
+# 🔎 INDEX DE LA RECHERCHE RAPIDE
+# ==========================================
+# Chaque valeur distincte des colonnes ci-dessous est normalisée comme les noms d'équipes
+# (sans accents, sans ponctuation) : "Saint-Étienne" et "saint etienne" donnent "saintetienne".
+# Tous les suffixes de ces formes sont triés : un terme cherché est un préfixe de suffixe,
+# donc une plage contiguë trouvée par dichotomie (recherche "contient" sans parcourir les lignes).
+COLONNES_RECHERCHE = {
+    'Domicile': 3, 'Extérieur': 3, 'Compétition': 2,
+    'Phase': 1, 'Stade': 1, 'Saison': 1, 'Date': 1,
+}
+
+# Niveau d'un suffixe dans sa valeur : milieu de mot, début de mot, ou début de la valeur
+MILIEU_MOT, DEBUT_MOT, DEBUT_VALEUR = 1, 2, 3
+# Score d'une correspondance selon ce niveau ; le terme égal à la valeur entière passe devant
+SCORE_MILIEU_MOT, SCORE_DEBUT_MOT, SCORE_VALEUR_ENTIERE = 1.0, 2.0, 4.0
+
+
+@dataclass
+class IndexRecherche:
+    nb_lignes: int
+    suffixes: list              # suffixes triés
+    debut_suffixe: np.ndarray   # suffixe i -> tranche [debut_suffixe[i], debut_suffixe[i+1]) des deux tableaux suivants
+    valeur_suffixe: np.ndarray  # identifiant de la valeur qui contient le suffixe
+    niveau_suffixe: np.ndarray  # MILIEU_MOT, DEBUT_MOT ou DEBUT_VALEUR
+    poids_valeur: np.ndarray    # poids de la colonne d'origine de la valeur
+    debut_lignes: np.ndarray    # valeur v -> tranche [debut_lignes[v], debut_lignes[v+1]) de lignes_valeur
+    lignes_valeur: np.ndarray   # positions des matchs qui portent la valeur
+    ids_valeurs: dict           # (colonne, valeur) -> identifiant, pour rattacher les lignes ajoutées
+
+
+INDEX_RECHERCHE_VIDE = IndexRecherche(
+    nb_lignes=0, suffixes=[], debut_suffixe=np.zeros(1, dtype=np.intp),
+    valeur_suffixe=VIDE, niveau_suffixe=np.empty(0, dtype=np.int8), poids_valeur=np.empty(0, dtype=np.float32),
+    debut_lignes=np.zeros(1, dtype=np.intp), lignes_valeur=VIDE, ids_valeurs={},
+)
+
+
+def mots_normalises(valeur):
+    # Mots d'un texte, chacun nettoyé comme un nom d'équipe (sans accents, minuscules)
+    mots = (nettoyer_nom_equipe(mot) for mot in re.split(r"\W+", str(valeur)))
+    return [mot for mot in mots if mot]
+
+
+def _suffixes_valeur(mots):
+    forme = "".join(mots)
+    debuts_mots, curseur = set(), 0
+    for mot in mots:
+        debuts_mots.add(curseur)
+        curseur += len(mot)
+    for i in range(len(forme)):
+        yield forme[i:], DEBUT_VALEUR if i == 0 else (DEBUT_MOT if i in debuts_mots else MILIEU_MOT)
+
+
+def _inserer_tranches(debuts, donnees, indices, nouvelles, longueurs, valeurs):
+    # Tableaux "CSR" (debuts, donnees...) : la tranche indices[j] reçoit longueurs[j] valeurs (lues à
+    # la suite dans valeurs), à sa fin ; si nouvelles[j], une nouvelle tranche est insérée avant elle.
+    # Les indices sont croissants. Renvoie de nouveaux tableaux, les anciens restent intacts.
+    points = np.repeat(np.where(nouvelles, debuts[indices], debuts[np.minimum(indices + 1, len(debuts) - 1)]), longueurs)
+    donnees = [np.insert(tableau, points, ajout.astype(tableau.dtype)) for tableau, ajout in zip(donnees, valeurs)]
+
+    comptes = np.diff(debuts)
+    np.add.at(comptes, indices[~nouvelles], longueurs[~nouvelles])
+    comptes = np.insert(comptes, indices[nouvelles], longueurs[nouvelles])
+    return np.concatenate([[0], np.cumsum(comptes)]).astype(np.intp), donnees
+
+
+def etendre_index_recherche(index, df_queue, decalage):
+    # Rattache les lignes df_queue (positions decalage, decalage+1...) à l'index : une valeur déjà
+    # connue reçoit seulement de nouvelles positions, une valeur nouvelle apporte ses suffixes.
+    ids_valeurs = dict(index.ids_valeurs)
+    nb_valeurs = len(index.poids_valeur)
+    lignes_ajoutees, poids, lignes, entrees = {}, [], [], {}
+    for col, poids_col in COLONNES_RECHERCHE.items():
+        if col not in df_queue.columns:
+            continue
+        for valeur, positions in df_queue.groupby(col, observed=True, sort=False).indices.items():
+            positions = positions + decalage
+            id_valeur = ids_valeurs.get((col, valeur))
+            if id_valeur is not None:
+                lignes_ajoutees[id_valeur] = positions
+                continue
+            mots = mots_normalises(valeur)
+            if not mots:
+                continue
+            id_valeur = nb_valeurs + len(poids)
+            ids_valeurs[(col, valeur)] = id_valeur
+            poids.append(poids_col)
+            lignes.append(positions)
+            for suffixe, niveau in _suffixes_valeur(mots):
+                entrees.setdefault(suffixe, []).append((id_valeur, niveau))
+
+    # Lignes : on prolonge les tranches des valeurs connues, les nouvelles valeurs viennent à la fin
+    ids_connus = np.asarray(sorted(lignes_ajoutees), dtype=np.intp)
+    debut_lignes, (lignes_valeur,) = _inserer_tranches(
+        index.debut_lignes, [index.lignes_valeur], ids_connus, np.zeros(len(ids_connus), dtype=bool),
+        np.asarray([len(lignes_ajoutees[i]) for i in ids_connus], dtype=np.intp),
+        [np.concatenate([VIDE, *(lignes_ajoutees[i] for i in ids_connus)])],
+    )
+    debut_lignes = np.concatenate([debut_lignes, debut_lignes[-1] + np.cumsum([len(p) for p in lignes], dtype=np.intp)])
+    lignes_valeur = np.concatenate([lignes_valeur, *lignes]).astype(np.intp)
+
+    # Suffixes : chaque suffixe nouveau est inséré à son rang, un suffixe connu est prolongé
+    cles = sorted(entrees)
+    if index.suffixes:
+        rangs = [bisect_left(index.suffixes, cle) for cle in cles]
+        nouvelles = [r == len(index.suffixes) or index.suffixes[r] != cle for r, cle in zip(rangs, cles)]
+    else:
+        rangs, nouvelles = [0] * len(cles), [True] * len(cles)
+    paires = [paire for cle in cles for paire in entrees[cle]]
+    debut_suffixe, (valeur_suffixe, niveau_suffixe) = _inserer_tranches(
+        index.debut_suffixe, [index.valeur_suffixe, index.niveau_suffixe],
+        np.asarray(rangs, dtype=np.intp), np.asarray(nouvelles, dtype=bool),
+        np.asarray([len(entrees[cle]) for cle in cles], dtype=np.intp),
+        [np.asarray([p[0] for p in paires], dtype=np.intp), np.asarray([p[1] for p in paires], dtype=np.int8)],
+    )
+    nouveaux_suffixes = [cle for cle, nouvelle in zip(cles, nouvelles) if nouvelle]
+
+    return IndexRecherche(
+        nb_lignes=max(index.nb_lignes, decalage + len(df_queue)),
+        suffixes=sorted(index.suffixes + nouveaux_suffixes) if nouveaux_suffixes else index.suffixes,
+        debut_suffixe=debut_suffixe,
+        valeur_suffixe=valeur_suffixe,
+        niveau_suffixe=niveau_suffixe,
+        poids_valeur=np.concatenate([index.poids_valeur, np.asarray(poids, dtype=np.float32)]),
+        debut_lignes=debut_lignes,
+        lignes_valeur=lignes_valeur,
+        ids_valeurs=ids_valeurs,
+    )
+
+
+def construire_index_recherche(df):
+    return etendre_index_recherche(INDEX_RECHERCHE_VIDE, df, 0)
+
+
+def _scores_terme(index, terme):
+    # Score de chaque ligne pour un terme (0 = le terme n'apparaît pas dans la ligne)
+    scores = np.zeros(index.nb_lignes, dtype=np.float32)
+    debut = bisect_left(index.suffixes, terme)
+    fin = bisect_left(index.suffixes, terme + "\uffff", lo=debut)
+    if debut == fin:
+        return scores
+
+    tranche = slice(index.debut_suffixe[debut], index.debut_suffixe[fin])
+    ids = index.valeur_suffixe[tranche]
+    niveaux = index.niveau_suffixe[tranche]
+    score_niveau = np.where(niveaux == MILIEU_MOT, SCORE_MILIEU_MOT, SCORE_DEBUT_MOT).astype(np.float32)
+    if index.suffixes[debut] == terme:
+        nb_exacts = index.debut_suffixe[debut + 1] - index.debut_suffixe[debut]
+        score_niveau[:nb_exacts][niveaux[:nb_exacts] == DEBUT_VALEUR] = SCORE_VALEUR_ENTIERE
+
+    # Meilleur score par valeur, puis report sur toutes les lignes qui portent la valeur
+    score_valeurs = np.zeros(len(index.poids_valeur), dtype=np.float32)
+    np.maximum.at(score_valeurs, ids, score_niveau * index.poids_valeur[ids])
+    valeurs = np.flatnonzero(score_valeurs)
+    longueurs = index.debut_lignes[valeurs + 1] - index.debut_lignes[valeurs]
+    decalages = np.repeat(index.debut_lignes[valeurs] - (np.cumsum(longueurs) - longueurs), longueurs)
+    positions = index.lignes_valeur[decalages + np.arange(longueurs.sum())]
+    np.maximum.at(scores, positions, np.repeat(score_valeurs[valeurs], longueurs))
+    return scores
+
+
+def positions_recherche(index, requete):
+    # Tous les termes doivent apparaître (ET), chacun en début ou au milieu d'un mot ;
+    # les lignes sont classées par score décroissant puis dans l'ordre du catalogue.
+    termes = [terme for terme in (nettoyer_nom_equipe(t) for t in requete.split()) if terme]
+    if not termes:
+        return VIDE
+
+    total = None
+    for terme in dict.fromkeys(termes):
+        scores = _scores_terme(index, terme)
+        total = scores if total is None else np.where((total > 0) & (scores > 0), total + scores, 0)
+        if not total.any():
+            return VIDE
+
+    positions = np.flatnonzero(total)
+    return positions[np.argsort(-total[positions], kind="stable")]
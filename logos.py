@@ -0,0 +1,297 @@
+# ==========================================
+# 🖼️ LOGOS : MANIFESTE, MINIATURES & DATA-URI
+# ==========================================
+# Les logos sont décrits par un manifeste (manifeste_logos.json), généré par `python logos.py`
+# et lu en une fois par processus : nom d'équipe nettoyé -> fichier canonique, empreinte du
+# contenu, dimensions. L'application ne parcourt jamais Logos/ et ne teste aucun fichier
+# pour trouver un logo : une recherche est une lecture de dictionnaire.
+# Règles de priorité quand plusieurs fichiers donnent le même nom nettoyé :
+#  1. même contenu (même empreinte) : un seul logo, copié à plusieurs endroits ;
+#  2. sinon, le fichier le moins profond dans l'arborescence l'emporte (Logos/euro2016.png
+#     avant Logos/Monde/Europe/normal/euro2016.png) ;
+#  3. à profondeur égale, le premier chemin dans l'ordre alphabétique.
+# Les fichiers écartés sont listés dans le manifeste (clé "ecartes") et affichés à la génération.
+# Les variantes de noms du catalogue (fautes, préfixes...) passent par ALIAS_LOGOS, reportés dans
+# le manifeste (clé "alias").
+# Les miniatures WebP (60 et 120 px de large) sont nommées d'après l'empreinte de leur source :
+# un logo modifié a une nouvelle miniature, sans comparer de dates. Elles ne sont générées que par
+# `python logos.py` : à l'affichage, un logo sans miniature est servi tel quel (fichier d'origine).
+# `python logos.py` : manifeste + toutes les miniatures, publiées dans static/logos/ sous le nom
+# <empreinte>-<taille>.webp. À l'affichage, l'adresse se déduit du manifeste, sans lire de fichier.
+import base64
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+from functools import lru_cache
+
+from donnees import nettoyer_nom_equipe
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow absent : on sert les fichiers d'origine
+    Image = None
+
+DOSSIER_LOGOS = "Logos"
+FICHIER_MANIFESTE = "manifeste_logos.json"
+DOSSIER_MINIATURES = ".miniatures"
+DOSSIER_STATIQUE = os.path.join("static", "logos")
+URL_STATIQUE = "app/static/logos"
+TAILLES_MINIATURES = (60, 120)
+EXTENSIONS_LOGOS = ('.png', '.jpg', '.jpeg')
+journal = logging.getLogger(__name__)
+
+TYPES_MIME = {'.webp': 'image/webp', '.png': 'image/png', '.jpg': 'image/jpeg', '.jpeg': 'image/jpeg'}
+
+
+# --- GÉNÉRATION DU MANIFESTE ---
+def _empreinte(chemin):
+    with open(chemin, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()[:16]
+
+
+def _dimensions(chemin):
+    if Image is None:
+        return None, None
+    try:
+        with Image.open(chemin) as image:
+            return image.size
+    except OSError:
+        return None, None
+
+
+def _priorite(chemin):
+    # Plus petit = prioritaire : profondeur dans Logos/, puis ordre alphabétique
+    relatif = os.path.relpath(chemin, DOSSIER_LOGOS).replace(os.sep, "/")
+    return relatif.count("/"), relatif
+
+
+# Nom tel qu'écrit dans matchs.csv -> nom du fichier logo (nettoyés tous les deux à la génération)
+ALIAS_LOGOS = {
+    "Sporting Lisbonne": "sporting",
+    "Sloven Liberec": "slovanliberec",
+    "Dynamo Moscou": "dinamomoscou",
+    "FC Barcelone": "barcelone",
+    "Copehague": "copenhague",
+    "Jenesse d'Esch": "jeunessedesch",
+    "Lyon-la-Duchère": "logo-la-duchere",
+    "France 98": "France",
+}
+
+
+def construire_manifeste(dossier_racine=DOSSIER_LOGOS, alias=ALIAS_LOGOS):
+    candidats = {}
+    for root, dirs, files in os.walk(dossier_racine):
+        for file in files:
+            if file.lower().endswith(EXTENSIONS_LOGOS):
+                cle = nettoyer_nom_equipe(os.path.splitext(file)[0])
+                if cle:
+                    candidats.setdefault(cle, []).append(os.path.join(root, file))
+
+    logos, ecartes = {}, {}
+    for cle, chemins in sorted(candidats.items()):
+        chemins = sorted(chemins, key=_priorite)
+        retenu = chemins[0]
+        largeur, hauteur = _dimensions(retenu)
+        logos[cle] = {
+            'chemin': retenu.replace(os.sep, "/"),
+            'empreinte': _empreinte(retenu),
+            'largeur': largeur,
+            'hauteur': hauteur,
+        }
+        if len(chemins) > 1:
+            ecartes[cle] = [
+                {'chemin': c.replace(os.sep, "/"), 'doublon': _empreinte(c) == logos[cle]['empreinte']}
+                for c in chemins[1:]
+            ]
+
+    table_alias = {}
+    for variante, cible in sorted(alias.items()):
+        cle_variante, cle_cible = nettoyer_nom_equipe(variante), nettoyer_nom_equipe(cible)
+        if cle_cible in logos and cle_variante not in logos:
+            table_alias[cle_variante] = cle_cible
+    return {'logos': logos, 'alias': table_alias, 'ecartes': ecartes}
+
+
+def ecrire_manifeste(manifeste, chemin=FICHIER_MANIFESTE):
+    temporaire = f"{chemin}.{os.getpid()}.tmp"
+    with open(temporaire, "w", encoding="utf-8") as f:
+        json.dump(manifeste, f, ensure_ascii=False, indent=1, sort_keys=True)
+        f.write("\n")
+    os.replace(temporaire, chemin)
+
+
+# --- LECTURE (UNE FOIS PAR PROCESSUS) ---
+@lru_cache(maxsize=None)
+def manifeste_logos(chemin=FICHIER_MANIFESTE):
+    try:
+        with open(chemin, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        # Manifeste absent ou illisible : on le reconstruit en mémoire (parcours de Logos/)
+        return construire_manifeste()
+
+
+def entree_logo(nom):
+    # Fiche du manifeste pour un nom d'équipe ou de compétition, alias compris ; None sans logo
+    manifeste = manifeste_logos()
+    cle = nettoyer_nom_equipe(nom)
+    return manifeste['logos'].get(manifeste['alias'].get(cle, cle))
+
+
+# --- MINIATURES ---
+@lru_cache(maxsize=None)
+def _miniatures_presentes(taille):
+    # Une seule lecture du dossier par taille et par processus
+    try:
+        return frozenset(os.listdir(os.path.join(DOSSIER_MINIATURES, str(taille))))
+    except OSError:
+        return frozenset()
+
+
+def chemin_miniature(entree, taille):
+    # Miniature d'une fiche du manifeste si `python logos.py` l'a générée, sinon le fichier d'origine
+    nom = f"{entree['empreinte']}.webp"
+    if nom in _miniatures_presentes(taille):
+        return os.path.join(DOSSIER_MINIATURES, str(taille), nom)
+    return entree['chemin']
+
+
+def _generer_miniature(entree, taille, chemin):
+    # False si Pillow est absent ou ne sait pas lire le logo
+    if Image is None:
+        return False
+    try:
+        with Image.open(entree['chemin']) as image:
+            image = image.convert("RGBA")
+            # Largeur fixée (affichage en width:60px), hauteur proportionnelle, jamais d'agrandissement
+            image.thumbnail((taille, taille * 10), Image.LANCZOS)
+            chemin_tmp = f"{chemin}.{os.getpid()}.{threading.get_ident()}.tmp"
+            image.save(chemin_tmp, format="WEBP", quality=90)
+        os.replace(chemin_tmp, chemin)
+    except OSError:
+        return False
+    return True
+
+
+def miniature_logo(nom, taille=120):
+    entree = entree_logo(nom)
+    return chemin_miniature(entree, taille) if entree else None
+
+
+def nom_statique(entree, taille):
+    return f"{entree['empreinte']}-{taille}.webp"
+
+
+def generer_miniatures():
+    # Toutes les miniatures manquantes, copiées dans static/logos/ (à la génération, jamais à l'affichage)
+    nb = 0
+    os.makedirs(DOSSIER_STATIQUE, exist_ok=True)
+    publies = set(os.listdir(DOSSIER_STATIQUE))
+    for taille in TAILLES_MINIATURES:
+        dossier = os.path.join(DOSSIER_MINIATURES, str(taille))
+        os.makedirs(dossier, exist_ok=True)
+        presentes = set(os.listdir(dossier))
+        for entree in manifeste_logos()['logos'].values():
+            nom = f"{entree['empreinte']}.webp"
+            chemin = os.path.join(dossier, nom)
+            if nom not in presentes and not _generer_miniature(entree, taille, chemin):
+                continue
+            nom_publie = nom_statique(entree, taille)
+            if nom_publie not in publies:
+                destination = os.path.join(DOSSIER_STATIQUE, nom_publie)
+                chemin_tmp = f"{destination}.{os.getpid()}.{threading.get_ident()}.tmp"
+                shutil.copyfile(chemin, chemin_tmp)
+                os.replace(chemin_tmp, destination)
+            nb += 1
+    _miniatures_presentes.cache_clear()
+    return nb
+
+
+# --- DATA-URI EN CACHE (LRU) ---
+@lru_cache(maxsize=2048)
+def data_uri_logo(cle, taille=60):
+    entree = entree_logo(cle)
+    if not entree:
+        return None
+    chemin = chemin_miniature(entree, taille)
+    try:
+        with open(chemin, "rb") as f:
+            contenu = base64.b64encode(f.read()).decode()
+    except OSError:
+        return None
+    mime = TYPES_MIME.get(os.path.splitext(chemin)[1].lower(), 'image/png')
+    return f"data:{mime};base64,{contenu}"
+
+
+# --- FICHIERS STATIQUES À ADRESSE UNIQUE ---
+# Le nom du fichier publié est l'empreinte de son contenu : une adresse ne change jamais de
+# contenu. Le cache long (Cache-Control d'un an, immutable) n'est ajouté que par le middleware
+# CacheLogos de serveur.py, donc avec `streamlit run serveur.py` ; avec main.py, Streamlit sert
+# ces fichiers sans cache long (simple revalidation par le navigateur).
+# url_fichier publie une image isolée (logo du site) ; les logos d'équipes sont publiés par generer_miniatures.
+def url_fichier(chemin):
+    try:
+        with open(chemin, "rb") as f:
+            contenu = f.read()
+        empreinte = hashlib.sha1(contenu).hexdigest()[:16]
+        nom = f"{empreinte}{os.path.splitext(chemin)[1].lower()}"
+        destination = os.path.join(DOSSIER_STATIQUE, nom)
+        if not os.path.exists(destination):
+            os.makedirs(DOSSIER_STATIQUE, exist_ok=True)
+            chemin_tmp = f"{destination}.{os.getpid()}.tmp"
+            with open(chemin_tmp, "wb") as f:
+                f.write(contenu)
+            os.replace(chemin_tmp, destination)
+    except OSError:
+        return None
+    return f"{URL_STATIQUE}/{nom}?v={empreinte}"
+
+
+@lru_cache(maxsize=None)
+def _logos_publies():
+    # Une seule lecture de static/logos/ par processus
+    try:
+        publies = frozenset(os.listdir(DOSSIER_STATIQUE))
+    except OSError:
+        publies = frozenset()
+    if not publies:
+        journal.warning("%s/ est vide : logos envoyés en data-URI. Lancer `python logos.py` au déploiement.",
+                        DOSSIER_STATIQUE)
+    return publies
+
+
+@lru_cache(maxsize=2048)
+def url_logo(cle, taille=60):
+    # Adresse déduite du manifeste ; None si la miniature n'a pas été publiée (repli sur la data-URI)
+    entree = entree_logo(cle)
+    if not entree:
+        return None
+    nom = nom_statique(entree, taille)
+    if nom not in _logos_publies():
+        return None
+    return f"{URL_STATIQUE}/{nom}?v={entree['empreinte']}"
+
+
+def source_logo(nom, taille=60, statique=False):
+    # Adresse à mettre dans <img src=...> : URL statique si possible, data-URI sinon
+    cle = nettoyer_nom_equipe(nom)
+    if statique:
+        url = url_logo(cle, taille)
+        if url:
+            return url
+    return data_uri_logo(cle, taille)
+
+
+if __name__ == "__main__":
+    manifeste = construire_manifeste()
+    ecrire_manifeste(manifeste)
+    manifeste_logos.cache_clear()
+    print(f"✅ {FICHIER_MANIFESTE} : {len(manifeste['logos'])} logos, {len(manifeste['alias'])} alias")
+    for cle, ecartes in manifeste['ecartes'].items():
+        for ecarte in ecartes:
+            motif = "doublon identique" if ecarte['doublon'] else "⚠️ contenu différent"
+            print(f"   {cle} : {manifeste['logos'][cle]['chemin']} retenu, {ecarte['chemin']} écarté ({motif})")
+    print(f"✅ {generer_miniatures()} miniatures prêtes dans {DOSSIER_MINIATURES}/, publiées dans {DOSSIER_STATIQUE}/")
@@ -0,0 +1,230 @@
+# ==========================================
+# 📏 MESURES DE PERFORMANCE (PAGES & ÉTAPES)
+# ==========================================
+# Chronométrage léger, sans Streamlit, agrégé en mémoire pour tout le processus :
+#  - `with mesure("filtre_equipe") as m: ... ; m.resultats = len(df)` ou `@chronometre("etape")` ;
+#  - chaque mesure est rangée par (étape, page) dans deux histogrammes : durée et nombre de résultats ;
+#  - la page est celle de l'exécution en cours (debut_execution), propre à chaque session.
+# Sorties, activées par variables d'environnement :
+#  - GRENIER_MESURES_PROMETHEUS=chemin.prom : fichier texte Prometheus (collecteur "textfile"),
+#    réécrit au plus toutes les 10 s ;
+#  - GRENIER_MESURES_JSON=chemin.jsonl : une ligne JSON par mesure, gardée en mémoire et ajoutée
+#    au fichier par paquets, au même rythme ;
+# Les écritures se font dans un fil à part : une exécution de page ne touche jamais le disque
+# pour ses mesures, le verrou ne protège que les histogrammes et le tampon en mémoire.
+#  - GRENIER_PROFILS=1 : autorise le profil d'une seule exécution (?profil=cprofile ou
+#    ?profil=pyinstrument dans l'adresse), écrit dans .profils/.
+import atexit
+import bisect
+import contextvars
+import cProfile
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+try:
+    import pyinstrument
+except ImportError:  # pyinstrument absent : profils cProfile uniquement
+    pyinstrument = None
+
+BORNES_DUREES = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+BORNES_RESULTATS = (0, 1, 10, 100, 1_000, 10_000, 100_000, 1_000_000)
+CHEMIN_PROMETHEUS = os.environ.get("GRENIER_MESURES_PROMETHEUS")
+CHEMIN_JSON = os.environ.get("GRENIER_MESURES_JSON")
+PROFILS_AUTORISES = os.environ.get("GRENIER_PROFILS") == "1"
+DOSSIER_PROFILS = ".profils"
+INTERVALLE_EXPORT = 10.0
+
+_page_courante = contextvars.ContextVar("page_courante", default="")
+
+
+class Histogramme:
+    def __init__(self, bornes):
+        self.bornes = bornes
+        self.seaux = [0] * (len(bornes) + 1)  # dernier seau : au-delà de la plus grande borne
+        self.compte = 0
+        self.somme = 0.0
+
+    def ajouter(self, valeur):
+        self.seaux[bisect.bisect_left(self.bornes, valeur)] += 1
+        self.compte += 1
+        self.somme += valeur
+
+
+class RegistreMesures:
+    def __init__(self, chemin_prometheus=CHEMIN_PROMETHEUS, chemin_json=CHEMIN_JSON, intervalle=INTERVALLE_EXPORT):
+        self.chemin_prometheus = chemin_prometheus
+        self.chemin_json = chemin_json
+        self.intervalle = intervalle
+        self.durees = {}
+        self.resultats = {}
+        self._verrou = threading.Lock()
+        self._verrou_export = threading.Lock()  # un seul fil d'export à la fois
+        self._lignes_json = []
+        self._dernier_export = 0.0
+
+    def enregistrer(self, etape, page, duree, resultats=None):
+        cle = (etape, page)
+        ligne = None
+        if self.chemin_json:
+            ligne = {'ts': round(time.time(), 3), 'etape': etape, 'page': page, 'duree_s': round(duree, 6)}
+            if resultats is not None:
+                ligne['resultats'] = resultats
+        with self._verrou:
+            self.durees.setdefault(cle, Histogramme(BORNES_DUREES)).ajouter(duree)
+            if resultats is not None:
+                self.resultats.setdefault(cle, Histogramme(BORNES_RESULTATS)).ajouter(resultats)
+            if ligne is not None:
+                self._lignes_json.append(ligne)
+
+    # --- Export JSON (lignes accumulées depuis le dernier export) ---
+    def vider_json(self):
+        with self._verrou:
+            lignes, self._lignes_json = self._lignes_json, []
+        if lignes:
+            with open(self.chemin_json, "a", encoding="utf-8") as f:
+                f.write("".join(json.dumps(ligne, ensure_ascii=False) + "\n" for ligne in lignes))
+
+    # --- Export Prometheus ---
+    def texte_prometheus(self):
+        with self._verrou:
+            lignes = []
+            for nom, aide, histogrammes in (
+                ("grenier_etape_duree_secondes", "Durée des étapes (chargement, filtres, agrégations, rendu) par page", self.durees),
+                ("grenier_etape_resultats", "Nombre de résultats produits par étape et par page", self.resultats),
+            ):
+                lignes += [f"# HELP {nom} {aide}", f"# TYPE {nom} histogram"]
+                for (etape, page), histo in sorted(histogrammes.items()):
+                    etiquettes = f'etape="{_echapper(etape)}",page="{_echapper(page)}"'
+                    cumul = 0
+                    for borne, nombre in zip((*histo.bornes, "+Inf"), histo.seaux):
+                        cumul += nombre
+                        lignes.append(f'{nom}_bucket{{{etiquettes},le="{borne}"}} {cumul}')
+                    lignes.append(f"{nom}_sum{{{etiquettes}}} {histo.somme}")
+                    lignes.append(f"{nom}_count{{{etiquettes}}} {histo.compte}")
+            return "\n".join(lignes) + "\n"
+
+    def exporter_prometheus(self, chemin=None):
+        chemin = chemin or self.chemin_prometheus
+        temporaire = chemin + ".tmp"
+        with open(temporaire, "w", encoding="utf-8") as f:
+            f.write(self.texte_prometheus())
+        os.replace(temporaire, chemin)  # le collecteur ne lit jamais un fichier à moitié écrit
+
+    def exporter_si_du(self):
+        if not (self.chemin_prometheus or self.chemin_json) or time.monotonic() - self._dernier_export < self.intervalle:
+            return
+        if not self._verrou_export.acquire(blocking=False):
+            return
+        self._dernier_export = time.monotonic()
+        threading.Thread(target=self._exporter, daemon=True).start()
+
+    def _exporter(self):
+        try:
+            if self.chemin_json:
+                self.vider_json()
+            if self.chemin_prometheus:
+                self.exporter_prometheus()
+        except OSError:
+            pass
+        finally:
+            self._verrou_export.release()
+
+
+def _echapper(valeur):
+    return str(valeur).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+REGISTRE = RegistreMesures()
+if REGISTRE.chemin_json:
+    atexit.register(REGISTRE.vider_json)  # dernières mesures à l'arrêt du serveur
+
+
+# --- MESURES ---
+class Mesure:
+    __slots__ = ("etape", "page", "resultats")
+
+    def __init__(self, etape, page, resultats):
+        self.etape = etape
+        self.page = page
+        self.resultats = resultats
+
+
+@contextmanager
+def mesure(etape, resultats=None, page=None):
+    en_cours = Mesure(etape, page if page is not None else _page_courante.get(), resultats)
+    debut = time.perf_counter()
+    try:
+        yield en_cours
+    finally:
+        REGISTRE.enregistrer(en_cours.etape, en_cours.page, time.perf_counter() - debut, en_cours.resultats)
+
+
+def chronometre(etape, taille=None):
+    # taille : fonction des mêmes arguments que la fonction mesurée -> nombre de résultats (ex. len)
+    def decorer(fonction):
+        @functools.wraps(fonction)
+        def enveloppe(*args, **kwargs):
+            with mesure(etape, resultats=taille(*args, **kwargs) if taille else None):
+                return fonction(*args, **kwargs)
+        return enveloppe
+    return decorer
+
+
+# --- EXÉCUTION D'UNE PAGE ---
+@dataclass
+class Execution:
+    page: str
+    debut: float
+    profil: object = None
+
+
+def debut_execution(page, profil=None):
+    # profil : None, "cprofile" ou "pyinstrument" (ignoré si GRENIER_PROFILS n'est pas activé)
+    _page_courante.set(page)
+    return Execution(page=page, debut=time.perf_counter(), profil=_demarrer_profil(profil))
+
+
+def fin_execution(execution, interrompue=False):
+    # Appelé dans un finally : une exécution interrompue (st.rerun, st.switch_page, st.stop) arrête aussi
+    # son profil, et sa durée est comptée à part pour ne pas fausser celle des exécutions complètes
+    etape = "execution_interrompue" if interrompue else "execution"
+    REGISTRE.enregistrer(etape, execution.page, time.perf_counter() - execution.debut)
+    chemin_profil = _arreter_profil(execution)
+    REGISTRE.exporter_si_du()
+    return chemin_profil
+
+
+def _demarrer_profil(mode):
+    if not mode or not PROFILS_AUTORISES:
+        return None
+    try:
+        if mode == "pyinstrument" and pyinstrument is not None:
+            profil = pyinstrument.Profiler()
+            profil.start()
+        else:
+            profil = cProfile.Profile()
+            profil.enable()
+    except (RuntimeError, ValueError):
+        return None  # un autre profil est déjà actif dans le processus
+    return profil
+
+
+def _arreter_profil(execution):
+    profil = execution.profil
+    if profil is None:
+        return None
+    os.makedirs(DOSSIER_PROFILS, exist_ok=True)
+    base = os.path.join(DOSSIER_PROFILS, f"{execution.page}-{time.strftime('%Y%m%d-%H%M%S')}")
+    if isinstance(profil, cProfile.Profile):
+        profil.disable()
+        profil.dump_stats(base + ".prof")  # python -m pstats / snakeviz
+        return base + ".prof"
+    profil.stop()
+    with open(base + ".html", "w", encoding="utf-8") as f:
+        f.write(profil.output_html())
+    return base + ".html"
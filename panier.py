@@ -0,0 +1,70 @@
+# ==========================================
+# 🛒 PANIER
+# ==========================================
+# Le panier (st.session_state.panier) est un dictionnaire ordonné : identifiant 'Match'
+# -> fiche compacte du match. Appartenance, ajout et retrait se font en temps constant.
+import numpy as np
+import pandas as pd
+
+# Seuls les champs utiles au panier, au prix et au récapitulatif de commande sont gardés
+# (has_dvd, has_num et a_defaut sont précalculés au chargement du catalogue, cf. donnees.enrichir_catalogue)
+CHAMPS_PANIER = [
+    'Match', 'Date', 'Compétition', 'Domicile', 'Extérieur', 'Qualité', 'Commentaires sur fichier',
+    'has_dvd', 'has_num', 'a_defaut',
+]
+
+
+def cle_match(match):
+    # Identifiant stable du match ; repli sur date + équipes pour une ligne sans numéro
+    numero = match.get('Match')
+    if numero is not None and not pd.isna(numero):
+        return int(numero)
+    return f"{match.get('Date', '')}_{match.get('Domicile', '')}_{match.get('Extérieur', '')}"
+
+
+def article_panier(match):
+    article = {}
+    for champ in CHAMPS_PANIER:
+        valeur = match.get(champ, "")
+        article[champ] = "" if pd.isna(valeur) else valeur
+    article['format_choisi'] = 'DVD' if article['has_dvd'] else 'Numérique'
+    return article
+
+
+def ajouter_au_panier(panier, match):
+    # Renvoie True si le match a été ajouté, False s'il y était déjà
+    cle = cle_match(match)
+    if cle in panier:
+        return False
+    panier[cle] = article_panier(match)
+    return True
+
+
+def retirer_du_panier(panier, cle):
+    panier.pop(cle, None)
+
+
+# --- AJOUT EN LOT (TOUT AJOUTER / LIGNES COCHÉES) ---
+def cles_matchs(df):
+    if 'Match' in df.columns and df['Match'].notna().all():
+        return pd.Index(pd.to_numeric(df['Match']).astype('int64'))
+    return pd.Index([cle_match(ligne) for ligne in df.to_dict('records')])
+
+
+def ajouter_lot_au_panier(panier, df_selection):
+    # Une seule passe vectorisée : différence d'ensembles avec le panier, format par défaut
+    # calculé sur toute la colonne, puis ajout groupé. Renvoie le nombre de matchs ajoutés.
+    if df_selection.empty:
+        return 0
+    cles = cles_matchs(df_selection)
+    nouveaux = ~cles.isin(list(panier)) & ~cles.duplicated()
+    if not nouveaux.any():
+        return 0
+
+    df_nouveaux = df_selection.reindex(columns=CHAMPS_PANIER)[nouveaux]
+    est_dvd = df_nouveaux['has_dvd'].fillna(False).to_numpy(dtype=bool)
+    articles = df_nouveaux.astype(object).where(df_nouveaux.notna(), "").to_dict('records')
+    for article, fmt in zip(articles, np.where(est_dvd, 'DVD', 'Numérique').tolist()):
+        article['format_choisi'] = fmt
+    panier.update(zip(cles[nouveaux], articles))
+    return len(articles)
@@ -0,0 +1,102 @@
+# ==========================================
+# 🕵️ MOTEUR DE LA RECHERCHE AVANCÉE
+# ==========================================
+# Un filtre (équipes, compétitions, phases, stades, saisons, format) est normalisé en
+# FiltreRecherche : valeurs triées et dédoublonnées, l'ordre de sélection ne compte pas.
+# Chaque critère est l'union des positions de ses valeurs (index précalculés), les critères
+# sont croisés par intersection en commençant par le plus petit. Résultats et unions par
+# critère sont gardés dans un cache LRU : revenir sur un filtre ou en affiner un est immédiat.
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, fields
+
+import numpy as np
+
+from indexation import VIDE
+
+FORMATS = ('dvd', 'numerique')
+TAILLE_CACHE = 256
+
+
+@dataclass(frozen=True)
+class FiltreRecherche:
+    equipes: tuple = ()
+    competitions: tuple = ()
+    phases: tuple = ()
+    stades: tuple = ()
+    saisons: tuple = ()
+    format: str = None          # None (tous), 'dvd' ou 'numerique'
+
+
+# Critère du filtre -> colonne de l'index des filtres (les équipes ont leur propre index)
+COLONNES_CRITERES = {'competitions': 'Compétition', 'phases': 'Phase', 'stades': 'Stade', 'saisons': 'Saison'}
+
+
+def filtre_recherche(equipes=(), competitions=(), phases=(), stades=(), saisons=(), format=None):
+    if format not in FORMATS:
+        format = None
+    return FiltreRecherche(
+        equipes=tuple(sorted(set(equipes))),
+        competitions=tuple(sorted(set(competitions))),
+        phases=tuple(sorted(set(phases))),
+        stades=tuple(sorted(set(stades))),
+        saisons=tuple(sorted(set(saisons))),
+        format=format,
+    )
+
+
+class MoteurRecherche:
+    def __init__(self, index_equipes, index_filtres, taille_cache=TAILLE_CACHE):
+        self.index_equipes = index_equipes
+        self.index_filtres = index_filtres
+        self.taille_cache = taille_cache
+        self._cache = OrderedDict()
+        self._verrou = threading.Lock()
+
+    def _memoriser(self, cle, calcul):
+        with self._verrou:
+            if cle in self._cache:
+                self._cache.move_to_end(cle)
+                return self._cache[cle]
+        resultat = calcul()
+        resultat.flags.writeable = False
+        with self._verrou:
+            self._cache[cle] = resultat
+            while len(self._cache) > self.taille_cache:
+                self._cache.popitem(last=False)
+        return resultat
+
+    def _union(self, critere, valeurs):
+        # Positions des matchs qui portent au moins une des valeurs du critère
+        if critere == 'equipes':
+            index = self.index_equipes
+        else:
+            index = self.index_filtres.valeurs.get(COLONNES_CRITERES[critere], {})
+        morceaux = [index[v] for v in valeurs if v in index]
+        if len(morceaux) == 1:
+            return morceaux[0]
+        return self._memoriser((critere, valeurs), lambda: np.unique(np.concatenate(morceaux)) if morceaux else VIDE)
+
+    def positions(self, filtre):
+        # Positions triées des matchs retenus, ou None si le filtre ne restreint rien
+        ensembles = [
+            self._union(champ.name, getattr(filtre, champ.name))
+            for champ in fields(filtre) if champ.name != 'format' and getattr(filtre, champ.name)
+        ]
+        if filtre.format is not None:
+            ensembles.append(getattr(self.index_filtres, filtre.format))
+        if not ensembles:
+            return None
+        if len(ensembles) == 1:
+            return ensembles[0]
+
+        def croiser():
+            ordre = sorted(ensembles, key=len)
+            resultat = ordre[0]
+            for ensemble in ordre[1:]:
+                if not len(resultat):
+                    break
+                resultat = np.intersect1d(resultat, ensemble, assume_unique=True)
+            return resultat
+
+        return self._memoriser(filtre, croiser)
@@ -0,0 +1,32 @@
+# ==========================================
+# 🌐 POINT D'ENTRÉE AVEC CACHE LONG DES LOGOS
+# ==========================================
+# `streamlit run serveur.py` lance la même application que main.py, en ajoutant un
+# en-tête de cache d'un an aux logos publiés dans static/logos/. Leur nom est l'empreinte
+# de leur contenu : une adresse ne change jamais de contenu, le navigateur ne les redemande pas.
+# Avec `streamlit run main.py`, les logos restent servis, simplement revalidés (ETag).
+import streamlit as st
+from starlette.middleware import Middleware
+
+from logos import URL_STATIQUE
+
+EN_TETE_CACHE = (b"cache-control", b"public, max-age=31536000, immutable")
+
+
+class CacheLogos:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or f"/{URL_STATIQUE}/" not in scope.get("path", ""):
+            return await self.app(scope, receive, send)
+
+        async def envoyer(message):
+            if message["type"] == "http.response.start" and message.get("status") == 200:
+                message["headers"] = [*message.get("headers", []), EN_TETE_CACHE]
+            await send(message)
+
+        await self.app(scope, receive, envoyer)
+
+
+app = st.App("main.py", middleware=[Middleware(CacheLogos)])
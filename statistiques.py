@@ -0,0 +1,86 @@
+# ==========================================
+# 📊 STATISTIQUES DU CATALOGUE
+# ==========================================
+# Les comptages de la page "Le Bilan de l'Inventaire" ne dépendent que du catalogue :
+# ils sont calculés une fois par version de matchs.csv (groupby vectorisés), puis
+# transformés en figures Plotly sérialisées (dictionnaires) que la page affiche telles quelles.
+import plotly.express as px
+
+from donnees import EQUIPES_SANS_AFFICHE
+
+
+def _comptages(serie):
+    # Effectifs des valeurs présentes (catégories vides écartées), du plus fréquent au plus rare
+    comptes = serie.value_counts(dropna=True)
+    return comptes[comptes > 0]
+
+
+def calculer_cubes(df):
+    cubes = {}
+    cubes['saisons'] = df.groupby('Saison', observed=True).size().sort_index()
+
+    if 'Type Compétition' in df.columns:
+        cubes['types'] = _comptages(df['Type Compétition'])
+
+    # Domicile et Extérieur partagent le même dictionnaire : on additionne les deux comptages
+    apparitions = _comptages(df['Domicile']).add(_comptages(df['Extérieur']), fill_value=0).astype(int)
+    apparitions = apparitions.drop(EQUIPES_SANS_AFFICHE, errors='ignore')
+    cubes['equipes'] = apparitions.sort_values(ascending=False, kind='stable')
+
+    cubes['affiches'] = _comptages(df['Affiche'])
+    cubes['diffuseurs'] = _comptages(df['Diffuseur'])
+    cubes['formats'] = _comptages(df['Qualité'])
+    return cubes
+
+
+def _tableau(comptes, colonne_valeur, colonne_nombre):
+    tableau = comptes.rename_axis(colonne_valeur).reset_index(name=colonne_nombre)
+    tableau[colonne_valeur] = tableau[colonne_valeur].astype(str)
+    return tableau
+
+
+def construire_figures(cubes):
+    figures = {}
+
+    fig_saisons = px.line(_tableau(cubes['saisons'], 'Saison', 'Nombre'), x='Saison', y='Nombre', markers=True,
+                          color_discrete_sequence=['#8b5a2b'])
+    fig_saisons.update_layout(xaxis_title="", yaxis_title="Nombre de matchs")
+    figures['saisons'] = fig_saisons
+
+    if 'types' in cubes:
+        fig_type = px.pie(_tableau(cubes['types'], 'Type', 'Nombre'), values='Nombre', names='Type', hole=0.4,
+                          color_discrete_sequence=px.colors.sequential.Oranges)
+        fig_type.update_traces(textposition='inside', textinfo='percent+label')
+        figures['types'] = fig_type
+
+    fig_equipes = px.bar(_tableau(cubes['equipes'].head(10), 'Équipe', 'Apparitions'), x='Apparitions', y='Équipe', orientation='h',
+                         color='Apparitions', color_continuous_scale='Oranges',
+                         text='Apparitions')
+    fig_equipes.update_traces(textposition='outside', textfont=dict(weight='bold'))
+    fig_equipes.update_layout(yaxis={'categoryorder':'total ascending'}, yaxis_title="")
+    figures['equipes'] = fig_equipes
+
+    fig_affiches = px.bar(_tableau(cubes['affiches'].head(10), 'Affiche', 'Rencontres'), x='Rencontres', y='Affiche', orientation='h',
+                          color='Rencontres', color_continuous_scale='Reds',
+                          text='Rencontres')
+    fig_affiches.update_traces(textposition='outside', textfont=dict(weight='bold'))
+    fig_affiches.update_layout(yaxis={'categoryorder':'total ascending'}, yaxis_title="")
+    figures['affiches'] = fig_affiches
+
+    fig_diff = px.pie(_tableau(cubes['diffuseurs'].head(10), 'Diffuseur', 'Matchs'), values='Matchs', names='Diffuseur',
+                      color_discrete_sequence=px.colors.sequential.RdBu)
+    fig_diff.update_traces(textposition='inside', textinfo='percent+label')
+    figures['diffuseurs'] = fig_diff
+
+    fig_qual = px.bar(_tableau(cubes['formats'].head(8), 'Format', 'Quantité'), x='Format', y='Quantité', text='Quantité',
+                      color='Quantité', color_continuous_scale='gray')
+    fig_qual.update_layout(xaxis_title="", yaxis_title="")
+    figures['formats'] = fig_qual
+
+    # Spécifications sérialisables : st.plotly_chart les accepte directement
+    return {nom: fig.to_dict() for nom, fig in figures.items()}
+
+
+def statistiques_catalogue(df):
+    cubes = calculer_cubes(df)
+    return cubes, construire_figures(cubes)
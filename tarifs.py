@@ -0,0 +1,128 @@
+# ==========================================
+# 💶 TARIFS & DEVIS DU PANIER
+# ==========================================
+# Règles de prix en un seul endroit, sans Streamlit :
+#  - DVD 5 €, numérique 3 € ;
+#  - "Archive Imparfaite" (commentaire sur le fichier) : -1 € sur le match ;
+#  - 1 match offert par tranche de 11 : les moins chers après remise.
+# Le devis d'un panier entier est calculé en une passe vectorisée (numpy).
+# Vérification et mesure : `python tarifs.py` (devis comparés à l'ancien calcul par tri, puis
+# durée du devis d'un panier de 1 000 matchs)
+from dataclasses import dataclass
+
+import numpy as np
+
+PRIX_FORMATS = {'DVD': 5, 'Numérique': 3}
+REMISE_DEFAUT = 1
+ARTICLES_PAR_OFFERT = 11
+
+
+@dataclass(frozen=True)
+class Devis:
+    prix_base: np.ndarray       # prix de chaque article selon son format
+    prix_final: np.ndarray      # prix de chaque article après remise "Archive Imparfaite"
+    nb_articles: int
+    nb_gratuits: int
+    sous_total: int             # somme des prix de base
+    remise_defauts: int
+    reduction_gratuits: int
+    total: int
+
+
+def prix_article(format_choisi, a_defaut=False):
+    prix = PRIX_FORMATS.get(format_choisi, PRIX_FORMATS['Numérique'])
+    return prix - REMISE_DEFAUT if a_defaut else prix
+
+
+def devis(formats, defauts):
+    # formats : format choisi de chaque article ('DVD' ou 'Numérique') ; defauts : booléens
+    est_dvd = np.asarray(formats, dtype=object) == 'DVD'
+    prix_base = np.where(est_dvd, PRIX_FORMATS['DVD'], PRIX_FORMATS['Numérique'])
+    remises = np.asarray(defauts, dtype=bool) * REMISE_DEFAUT
+    prix_final = prix_base - remises
+
+    nb_articles = len(prix_final)
+    nb_gratuits = nb_articles // ARTICLES_PAR_OFFERT
+    # Les nb_gratuits articles les moins chers, sans trier tout le panier
+    reduction_gratuits = int(np.partition(prix_final, nb_gratuits - 1)[:nb_gratuits].sum()) if nb_gratuits else 0
+
+    sous_total = int(prix_base.sum())
+    remise_defauts = int(remises.sum())
+    return Devis(
+        prix_base=prix_base,
+        prix_final=prix_final,
+        nb_articles=nb_articles,
+        nb_gratuits=nb_gratuits,
+        sous_total=sous_total,
+        remise_defauts=remise_defauts,
+        reduction_gratuits=reduction_gratuits,
+        total=sous_total - remise_defauts - reduction_gratuits,
+    )
+
+
+def devis_panier(panier):
+    articles = panier.values()
+    return devis([a.get('format_choisi', 'Numérique') for a in articles], [bool(a.get('a_defaut')) for a in articles])
+
+
+def jauge_offert(nb_articles):
+    # (matchs déjà offerts, articles dans la tranche en cours, remplissage de la jauge entre 0 et 1)
+    nb_gratuits, reste = divmod(nb_articles, ARTICLES_PAR_OFFERT)
+    if nb_articles and reste == 0:
+        return nb_gratuits, reste, 1.0
+    return nb_gratuits, reste, reste / ARTICLES_PAR_OFFERT
+
+
+def _devis_trie(panier):
+    # Ancien calcul de la page panier (boucle + tri de toute la liste), gardé comme référence
+    total_prix_base = 0
+    total_remise_defauts = 0
+    liste_prix = []
+    for match in panier.values():
+        a_defaut = bool(match.get('a_defaut'))
+        prix_base = 5 if match.get('format_choisi', 'Numérique') == 'DVD' else 3
+        total_prix_base += prix_base
+        if a_defaut:
+            total_remise_defauts += 1
+        liste_prix.append(prix_base - 1 if a_defaut else prix_base)
+    nb_gratuits = len(panier) // 11
+    reduction_gratuits = 0
+    if nb_gratuits > 0:
+        liste_prix.sort()
+        reduction_gratuits = sum(liste_prix[:nb_gratuits])
+    return (len(panier), nb_gratuits, total_prix_base, total_remise_defauts, reduction_gratuits,
+            total_prix_base - total_remise_defauts - reduction_gratuits)
+
+
+if __name__ == "__main__":
+    import timeit
+
+    # Tranches de matchs offerts (0, 10, 11, 22, 23...) x formats et défauts mélangés ou uniformes
+    rng = np.random.default_rng(1)
+    paniers_test = []
+    for nb in (0, 1, 10, 11, 12, 21, 22, 23, 33, 34, 100, 1000):
+        paniers_test.append({
+            i: {'format_choisi': 'DVD' if rng.random() < 0.4 else 'Numérique', 'a_defaut': bool(rng.random() < 0.2)}
+            for i in range(nb)
+        })
+        for format_choisi in ('DVD', 'Numérique'):
+            for a_defaut in (False, True):
+                paniers_test.append({i: {'format_choisi': format_choisi, 'a_defaut': a_defaut} for i in range(nb)})
+    # Panier où le match offert est une archive imparfaite (2 € au lieu de 3 €)
+    paniers_test.append({i: {'format_choisi': 'DVD' if i else 'Numérique', 'a_defaut': i == 0} for i in range(11)})
+    for panier_test in paniers_test:
+        d = devis_panier(panier_test)
+        obtenu = (d.nb_articles, d.nb_gratuits, d.sous_total, d.remise_defauts, d.reduction_gratuits, d.total)
+        assert obtenu == _devis_trie(panier_test), (obtenu, _devis_trie(panier_test))
+    assert devis_panier(paniers_test[-1]).reduction_gratuits == 2
+    print(f"✅ {len(paniers_test)} paniers : devis identiques à l'ancien calcul par tri")
+
+    rng = np.random.default_rng(0)
+    panier = {
+        i: {'format_choisi': 'DVD' if rng.random() < 0.4 else 'Numérique', 'a_defaut': bool(rng.random() < 0.1)}
+        for i in range(1000)
+    }
+    nb_repetitions = 1000
+    duree = timeit.timeit(lambda: devis_panier(panier), number=nb_repetitions) / nb_repetitions
+    d = devis_panier(panier)
+    print(f"✅ Devis de {d.nb_articles} matchs : {duree * 1000:.3f} ms (total {d.total} €, {d.nb_gratuits} offerts)")
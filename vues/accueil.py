@@ -0,0 +1,222 @@
+# ==========================================
+# PAGE : ACCUEIL
+# ==========================================
+import streamlit as st
+from datetime import datetime
+from indexation import positions_recherche, positions_jour
+from mesures import mesure
+from commun import (
+    LOGOS_STATIQUES, afficher_resultats, aller_a, catalogue_courant, file_alertes, get_image_src, registre_graal,
+    popup_contact_commandes, popup_echanges, popup_formats, popup_guide_contenu, popup_tarifs,
+)
+
+CATALOGUE = catalogue_courant()
+df = CATALOGUE.df
+INDEX_RECHERCHE = CATALOGUE.index_recherche
+INDEX_DATES = CATALOGUE.index_dates
+VOCABULAIRE = CATALOGUE.vocabulaire
+logo_src = get_image_src("logo.png", LOGOS_STATIQUES)
+
+st.markdown("""
+<style>
+@media (max-width: 768px) {
+    h1 { 
+        flex-direction: column !important; 
+        gap: 10px; 
+    }
+    h1 img { 
+        width: 80px !important; 
+        margin-right: 0 !important; 
+    }
+    h1 span { 
+        font-size: 26px !important; 
+        text-align: center; 
+        white-space: normal !important;
+    }
+    div[style*="max-width: 850px"] { 
+        font-size: 14px !important; 
+        padding: 0 10px; 
+    }
+    div[data-testid="stVerticalBlock"] > div:has(button) {
+        padding-bottom: 0px !important;
+    }
+}
+</style>
+""", unsafe_allow_html=True)
+
+if logo_src:
+    logo_html = f"<img src='{logo_src}' style='width: 120px; vertical-align: middle; margin-right: 0px; border-radius: 80%;'>"
+else:
+    logo_html = "⚽ "
+
+st.markdown(f"""
+    <div style='text-align: center; margin-bottom: 10px;'>
+        <h1 style='margin-bottom: 0px; display: flex; align-items: center; justify-content: center; line-height: 1;'>
+            {logo_html}
+            <span>Le Grenier du Football</span>
+        </h1>
+        <div style='max-width: 850px; margin: 0 auto; line-height: 1.6; font-size: 16px; color: #fafafa; margin-top: 15px;'>
+            Découvrez un grand choix d'<b>archives de matchs de football rétro</b>. Explorez un catalogue interactif de près de <b>5000 matchs classiques</b>, numérisés à partir de véritables <b>cassettes VHS et DVD</b>.<br><br>
+            Revivez en vidéo les rencontres historiques de la <i>Coupe du Monde</i>, de la <i>Ligue des Champions</i> et des grands championnats européens. De l'Équipe de France aux clubs de légende, l'Histoire du foot est ici.<br><br>
+            <b>Téléchargez vos matchs vintage préférés, complétez votre collection, ou proposez vos propres vidéos pour un échange entre passionnés.</b>
+        </div>
+    </div>
+""", unsafe_allow_html=True)
+
+st.write("---")
+
+col1, col2, col3 = st.columns(3)
+
+recherche_rapide = st.text_input("🔍 Recherche Rapide", placeholder="Tapez une équipe, une compétition, une année, un stade...")
+if recherche_rapide:
+    with mesure("filtre") as m:
+        df_trouve = df.iloc[positions_recherche(INDEX_RECHERCHE, recherche_rapide)]
+        m.resultats = len(df_trouve)
+    st.write(f"**Résultats trouvés pour :** '{recherche_rapide}'")
+    afficher_resultats(df_trouve)
+    st.write("---")
+
+st.markdown("""
+<style>
+div[data-testid="stHorizontalBlock"] > div:nth-child(4) button {
+    background-color: #2e7d32 !important; border-color: #2e7d32 !important; transition: all 0.3s ease;
+}
+div[data-testid="stHorizontalBlock"] > div:nth-child(4) button p { color: #ffffff !important; font-weight: 600 !important; }
+div[data-testid="stHorizontalBlock"] > div:nth-child(4) button:hover {
+    background-color: #1b5e20 !important; border-color: #1b5e20 !important; transform: scale(1.02);
+}
+div[data-testid="stHorizontalBlock"] > div:nth-child(5) button {
+    background-color: #1565c0 !important; border-color: #1565c0 !important; transition: all 0.3s ease;
+}
+div[data-testid="stHorizontalBlock"] > div:nth-child(5) button p { color: #ffffff !important; font-weight: 600 !important; }
+div[data-testid="stHorizontalBlock"] > div:nth-child(5) button:hover {
+    background-color: #0d47a1 !important; border-color: #0d47a1 !important; transform: scale(1.02);
+}
+</style>
+""", unsafe_allow_html=True)
+
+col_btn1, col_btn2, col_btn3, col_btn4, col_btn5 = st.columns(5)
+with col_btn1:
+    if st.button("🧭 Guide & Contenu", use_container_width=True): popup_guide_contenu()
+with col_btn2:
+    if st.button("💾 Formats", use_container_width=True): popup_formats()
+with col_btn3:
+    if st.button("💶 Tarifs", use_container_width=True): popup_tarifs()
+with col_btn4:
+    if st.button("✉️ Commandes", use_container_width=True): popup_contact_commandes()
+with col_btn5:
+    if st.button("🤝 Échanges", use_container_width=True): popup_echanges()
+
+st.write("---")
+
+with st.container(border=True):
+    c_txt, c_btn = st.columns([3, 1])
+    with c_txt:
+        st.markdown("<h4 style='margin-top:0px; margin-bottom:5px;'>🚨 Vous possédez vos propres archives ?</h4>", unsafe_allow_html=True)
+        st.markdown("Je suis constamment à la recherche de nouveaux matchs pour compléter le Grenier. Découvrez ma liste de recherches et proposons-nous des échanges !")
+    with c_btn:
+        st.write("") 
+        if st.button("🔎 Voir mes recherches", use_container_width=True, type="primary"):
+            aller_a('mes_recherches')
+
+st.write("---")
+
+st.markdown("### 📂 Explorer le Grenier")
+
+col_cat1, col_cat2 = st.columns(2)
+with col_cat1:
+    st.markdown('<div class="css-nations" style="margin-bottom: -15px;"></div>', unsafe_allow_html=True)
+    if st.button("🌍 Nations (Mondial, Euro...)", use_container_width=True, key="btn_acc_nat"):
+        st.session_state.chemin = ['Nations']
+        aller_a('arborescence')
+
+    st.markdown('<div class="css-europe" style="margin-bottom: -15px;"></div>', unsafe_allow_html=True)
+    if st.button("🏆 Coupes d'Europe (LDC...)", use_container_width=True, key="btn_acc_eur"):
+        st.session_state.chemin = ["Coupes d'Europe"]
+        aller_a('arborescence')
+
+with col_cat2:
+    st.markdown('<div class="css-champ" style="margin-bottom: -15px;"></div>', unsafe_allow_html=True)
+    if st.button("🏟️ Championnats & Coupes", use_container_width=True, key="btn_acc_champ"):
+        st.session_state.chemin = ['Championnats & Coupes']
+        aller_a('arborescence')
+
+    st.markdown('<div class="css-amicaux" style="margin-bottom: -15px;"></div>', unsafe_allow_html=True)
+    if st.button("🤝 Amicaux Internationaux", use_container_width=True, key="btn_acc_ami"):
+        st.session_state.chemin = ['Amicaux Internationaux']
+        aller_a('arborescence')
+
+st.write("---")
+
+col_cat, col_eph = st.columns(2)
+with col_cat:
+    st.markdown("### 📖 Tout voir d'un coup")
+    st.markdown("<p style='color: gray;'>Vous préférez flâner ? Affichez la liste complète de tous les matchs disponibles.</p>", unsafe_allow_html=True)
+    if st.button("Afficher le Catalogue Complet", use_container_width=True):
+        aller_a('catalogue')
+
+with col_eph:
+    st.markdown("### 📅 L'Éphéméride")
+    aujourdhui = datetime.now()
+    mois_francais = ["Janvier", "Février", "Mars", "Avril", "Mai", "Juin", "Juillet", "Août", "Septembre", "Octobre", "Novembre", "Décembre"]
+    date_affichee = f"{aujourdhui.day} {mois_francais[aujourdhui.month - 1]}"
+
+    nb_matchs_jour = len(positions_jour(INDEX_DATES, aujourdhui.month, aujourdhui.day))
+
+    if nb_matchs_jour > 0:
+        st.success(f"🔥 **{nb_matchs_jour} matchs** se sont joués un {date_affichee} !")
+        if st.button("Voir les matchs du jour", use_container_width=True):
+            aller_a('ephemeride')
+    else:
+        st.info(f"Que s'est-il passé un {date_affichee} ?")
+        if st.button("Chercher autre date", use_container_width=True):
+            aller_a('recherche_date')
+
+st.write("---")
+
+with st.container(border=True):
+    st.markdown("<h3 style='text-align: center; color: #d97706; margin-bottom: 5px;'>🏟️ Le Graal est peut-être au fond du Grenier...</h3>", unsafe_allow_html=True)
+
+    st.markdown("""
+    <p style='text-align: center; font-style: italic; color: #a1a1aa; font-size: 16px;'>
+    « Tu te souviens de ce match précis ? Celui de ton enfance, avec les maillots trop larges, les pubs Kodak et la prise d'antenne TF1 à la descente du bus ? »
+    </p>
+    <p style='text-align: center; font-size: 15px;'>
+    On fouille les archives 24h/24 pour exhumer des trésors. Si le match que tu cherches n'est pas encore dans le catalogue, ne le laisse pas s'échapper une deuxième fois. Laisse ton contact et je te préviendrai personnellement. <b>Zéro spam, promis.</b>
+    </p>
+    """, unsafe_allow_html=True)
+
+    st.write("") 
+
+    col_form1, col_form2 = st.columns(2)
+    with col_form1:
+        email_alerte = st.text_input("✉️ Ton Email :", placeholder="Le maillot au fond du sac...")
+    with col_form2:
+        match_alerte = st.text_input("📼 Le match que tu cherches :", placeholder="Ex : Nantes-Juventus 96, un vieux derby...")
+
+    st.write("")
+
+    if st.button("🚨 ALERTE-MOI DÈS QU'IL SORT DU GRENIER", use_container_width=True, type="primary"):
+        if email_alerte and match_alerte:
+            sujet = "🚨 ALERTE GRAAL : Nouvelle recherche sur le site"
+            corps = f"Salut l'Archiviste,\n\nUn collectionneur cherche une pépite :\n\n- E-mail du contact : {email_alerte}\n- Match recherché : {match_alerte}\n\nÀ toi de jouer !"
+
+            # Alerte mise en file d'abord (envoi SMTP en arrière-plan, cf. alertes.py) : si elle échoue,
+            # rien n'est enregistré et le collectionneur peut réessayer sans créer de doublon
+            try:
+                file_alertes().envoyer(sujet, corps)
+                alerte_envoyee = True
+            except Exception as e:
+                alerte_envoyee = False
+                st.error(f"⚠️ Oups, une erreur s'est produite lors de l'envoi de l'alerte. Veuillez me contacter directement sur legrenierdufootball@hotmail.com.")
+
+            if alerte_envoyee:
+                st.success("✅ C'est bien noté ! Je pars fouiller les cartons. Tu seras le premier prévenu dès que je mets la main dessus !")
+                st.balloons()
+                # Demande gardée pour être rapprochée des prochains ajouts au catalogue (cf. graal.py)
+                try:
+                    registre_graal().enregistrer(email_alerte, match_alerte, VOCABULAIRE.equipes)
+                except Exception:
+                    st.info("ℹ️ Ta demande est bien transmise à l'Archiviste, mais la surveillance automatique des nouveaux matchs n'a pas pu être activée : inutile de la renvoyer, je te recontacterai.")
+        else:
+            st.warning("⚠️ Oups, n'oublie pas de remplir ton e-mail et le match que tu cherches pour que je puisse te recontacter !")
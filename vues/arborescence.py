@@ -0,0 +1,167 @@
+# ==========================================
+# PAGE ARBORESCENCE (NAVIGATION DYNAMIQUE)
+# ==========================================
+import streamlit as st
+from indexation import (
+    positions_equipe, positions_feuille, positions_competition, options_competitions, restreindre,
+)
+from logos import miniature_logo
+from commun import MENU_ARBO, afficher_resultats, aller_a, catalogue_courant
+
+CATALOGUE = catalogue_courant()
+df = CATALOGUE.df
+INDEX_EQUIPES = CATALOGUE.index_equipes
+INDEX_ARBO = CATALOGUE.index_arbo
+VOCABULAIRE = CATALOGUE.vocabulaire
+
+if len(st.session_state.chemin) > 0:
+    cat_principale = st.session_state.chemin[0]
+
+    couleur_fond = "#333333" 
+    couleur_survol = "#222222"
+
+    if cat_principale == "Nations":
+        couleur_fond, couleur_survol = "#b8860b", "#8b6508"
+    elif cat_principale == "Coupes d'Europe":
+        couleur_fond, couleur_survol = "#1a2b4c", "#101a2e"
+    elif cat_principale == "Championnats & Coupes":
+        couleur_fond, couleur_survol = "#722f37", "#4a1e23"
+    elif cat_principale == "Amicaux Internationaux":
+        couleur_fond, couleur_survol = "#5b7c6c", "#435b4f"
+
+    st.markdown(f"""
+    <style>
+    div[data-testid="column"] div.stButton > button {{
+        background-color: {couleur_fond} !important;
+        border-color: {couleur_fond} !important;
+        transition: all 0.2s ease;
+    }}
+    div[data-testid="column"] div.stButton > button p {{
+        color: #ffffff !important;
+        font-weight: 500;
+    }}
+    div[data-testid="column"] div.stButton > button:hover {{
+        background-color: {couleur_survol} !important;
+        border-color: {couleur_survol} !important;
+        transform: scale(1.02);
+    }}
+    </style>
+    """, unsafe_allow_html=True)
+
+noeud_actuel = MENU_ARBO
+for etape in st.session_state.chemin:
+    if isinstance(noeud_actuel, dict): noeud_actuel = noeud_actuel[etape]
+    elif isinstance(noeud_actuel, list): noeud_actuel = etape
+
+fil_ariane = " > ".join(st.session_state.chemin)
+st.caption(f"📂 Chemin : {fil_ariane}")
+
+if st.button("⬅️ Retour"):
+    if st.session_state.edition_choisie is not None:
+        st.session_state.edition_choisie = None
+    else:
+        st.session_state.chemin.pop()
+        if len(st.session_state.chemin) == 0:
+            aller_a('accueil')
+    st.rerun()
+
+st.divider()
+
+if isinstance(noeud_actuel, dict):
+    cles = list(noeud_actuel.keys())
+    for i in range(0, len(cles), 3):
+        cols = st.columns(3)
+        for j in range(3):
+            if i + j < len(cles):
+                cle = cles[i + j]
+                with cols[j]:
+                    if st.button(cle, use_container_width=True):
+                        st.session_state.chemin.append(cle)
+                        st.rerun()
+
+elif isinstance(noeud_actuel, list):
+    for i in range(0, len(noeud_actuel), 3):
+        cols = st.columns(3)
+        for j in range(3):
+            if i + j < len(noeud_actuel):
+                element = noeud_actuel[i + j]
+                with cols[j]:
+                    if st.button(element, use_container_width=True):
+                        st.session_state.chemin.append(element)
+                        st.rerun()
+
+elif isinstance(noeud_actuel, str):
+    if noeud_actuel.startswith("FILTER_"):
+        if st.session_state.edition_choisie is None:
+            editions = INDEX_ARBO.feuilles[noeud_actuel].editions
+            if editions:
+                st.subheader("🗓️ Choisissez l'édition :")
+
+                for i in range(0, len(editions), 4):
+                    cols = st.columns(4) 
+                    for j in range(4):
+                        if i + j < len(editions):
+                            ed = editions[i + j]
+                            with cols[j]:
+                                if st.button(str(ed), use_container_width=True, key=f"btn_ed_{i+j}"):
+                                    st.session_state.edition_choisie = ed
+                                    st.rerun()
+            else:
+                st.warning("Aucune édition trouvée pour ce choix.")
+        else:
+            c1, c2 = st.columns([4, 1])
+            with c1: st.header(f"📍 {st.session_state.edition_choisie}")
+            with c2:
+                logo = miniature_logo(st.session_state.edition_choisie, 120)
+                if logo:
+                    st.image(logo, width=100)
+
+            df_final = df.iloc[positions_competition(INDEX_ARBO, st.session_state.edition_choisie)]
+            afficher_resultats(df_final)
+    else:
+        c1, c2 = st.columns([4, 1])
+        with c1: st.header(f"🏆 {noeud_actuel}")
+        with c2:
+            logo = miniature_logo(noeud_actuel, 120)
+            if logo:
+                st.image(logo, width=100)
+
+        df_final = df.iloc[positions_feuille(INDEX_ARBO, noeud_actuel)]
+
+        st.write("---")
+
+        col_saison, col_equipe = st.columns(2)
+
+        col_saison_nom = 'Saison' if 'Saison' in df_final.columns else ('Année' if 'Année' in df_final.columns else None)
+        saisons_feuille, equipes_feuille = options_competitions(VOCABULAIRE, INDEX_ARBO.feuilles[noeud_actuel].editions)
+
+        if col_saison_nom == 'Saison':
+            liste_saisons = ["Toutes les saisons"] + saisons_feuille
+        elif col_saison_nom:
+            liste_saisons = ["Toutes les saisons"] + sorted(df_final[col_saison_nom].dropna().unique().tolist(), reverse=True)
+        else:
+            try:
+                df_final['Annee_Extrait'] = df_final['Date'].astype(str).str.extract(r'(\d{4})')
+                liste_saisons = ["Toutes les saisons"] + sorted(df_final['Annee_Extrait'].dropna().unique().tolist(), reverse=True)
+                col_saison_nom = 'Annee_Extrait'
+            except:
+                liste_saisons = ["Toutes les saisons"]
+
+        with col_saison:
+            saison_choisie = st.selectbox("📅 Filtrer par Saison :", liste_saisons, label_visibility="collapsed")
+
+        liste_equipes = ["Toutes les équipes"] + equipes_feuille
+
+        with col_equipe:
+            equipe_choisie = st.selectbox("⚽ Filtrer par Équipe :", liste_equipes, label_visibility="collapsed")
+
+        if saison_choisie != "Toutes les saisons" and col_saison_nom:
+            df_final = df_final[df_final[col_saison_nom] == saison_choisie]
+
+        if equipe_choisie != "Toutes les équipes":
+            df_final = restreindre(df_final, positions_equipe(INDEX_EQUIPES, equipe_choisie))
+
+        st.markdown(f"<p style='color: #d97706; font-weight: bold; margin-top: 5px;'>🎯 {len(df_final)} match(s) disponible(s) avec ces filtres</p>", unsafe_allow_html=True)
+        st.write("---")
+
+        afficher_resultats(df_final)
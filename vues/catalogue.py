@@ -0,0 +1,40 @@
+# ==========================================
+# PAGE : CATALOGUE COMPLET
+# ==========================================
+import streamlit as st
+from indexation import positions_equipe, restreindre
+from commun import afficher_resultats, catalogue_courant
+
+CATALOGUE = catalogue_courant()
+df = CATALOGUE.df
+INDEX_EQUIPES = CATALOGUE.index_equipes
+VOCABULAIRE = CATALOGUE.vocabulaire
+
+st.header("📚 Catalogue Complet")
+
+df_catalogue = df
+
+st.write("---")
+col_saison, col_equipe = st.columns(2)
+
+col_saison_nom = 'Saison' if 'Saison' in df_catalogue.columns else 'Année'
+liste_saisons = ["Toutes les saisons"] + VOCABULAIRE.options.get('Saison', [])
+
+with col_saison:
+    saison_choisie = st.selectbox("📅 Filtrer par Saison :", liste_saisons)
+
+liste_equipes = ["Toutes les équipes"] + VOCABULAIRE.equipes
+
+with col_equipe:
+    equipe_choisie = st.selectbox("⚽ Filtrer par Équipe :", liste_equipes)
+
+if saison_choisie != "Toutes les saisons":
+    df_catalogue = df_catalogue[df_catalogue[col_saison_nom] == saison_choisie]
+
+if equipe_choisie != "Toutes les équipes":
+    df_catalogue = restreindre(df_catalogue, positions_equipe(INDEX_EQUIPES, equipe_choisie))
+
+st.markdown(f"**🎯 {len(df_catalogue)} match(s) trouvé(s)**")
+st.write("---")
+
+afficher_resultats(df_catalogue)
@@ -0,0 +1,18 @@
+# ==========================================
+# PAGE : ÉPHÉMÉRIDE
+# ==========================================
+import streamlit as st
+from datetime import datetime
+from indexation import positions_jour
+from commun import afficher_resultats, catalogue_courant
+
+CATALOGUE = catalogue_courant()
+df = CATALOGUE.df
+INDEX_DATES = CATALOGUE.index_dates
+
+aujourdhui = datetime.now()
+mois_francais = ["Janvier", "Février", "Mars", "Avril", "Mai", "Juin", "Juillet", "Août", "Septembre", "Octobre", "Novembre", "Décembre"]
+date_texte = f"{aujourdhui.day} {mois_francais[aujourdhui.month - 1]}"
+st.header(f"📅 Ça s'est joué un {date_texte}")
+df_ephem = df.iloc[positions_jour(INDEX_DATES, aujourdhui.month, aujourdhui.day)]
+afficher_resultats(df_ephem)
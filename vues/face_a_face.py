@@ -0,0 +1,22 @@
+# ==========================================
+# PAGE : FACE-À-FACE
+# ==========================================
+import streamlit as st
+from indexation import positions_face_a_face
+from mesures import mesure
+from commun import afficher_resultats, catalogue_courant
+
+CATALOGUE = catalogue_courant()
+df = CATALOGUE.df
+INDEX_CONFRONTATIONS = CATALOGUE.index_confrontations
+VOCABULAIRE = CATALOGUE.vocabulaire
+
+st.header("⚔️ Face-à-Face")
+toutes_les_equipes = VOCABULAIRE.equipes
+colA, colB = st.columns(2)
+with colA: eq1 = st.selectbox("Équipe A", toutes_les_equipes, index=0)
+with colB: eq2 = st.selectbox("Équipe B", toutes_les_equipes, index=1 if len(toutes_les_equipes)>1 else 0)
+with mesure("filtre") as m:
+    df_face = df.iloc[positions_face_a_face(INDEX_CONFRONTATIONS, eq1, eq2)]
+    m.resultats = len(df_face)
+afficher_resultats(df_face)
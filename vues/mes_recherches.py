@@ -0,0 +1,43 @@
+# ==========================================
+# PAGE : MES RECHERCHES (WANTED)
+# ==========================================
+import streamlit as st
+
+st.header("🔎 Mes Recherches Actuelles")
+st.markdown("<p style='color: gray; font-size:16px;'>Vous avez ces trésors dans vos disques durs ou vos cartons ? Contactez-moi pour un échange !</p>", unsafe_allow_html=True)
+st.divider()
+
+col_milan, col_france = st.columns(2)
+
+with col_milan:
+    st.markdown("""
+    <div style='background-color: #2b1111; padding: 25px; border-radius: 15px; border: 2px solid #e32221; box-shadow: 2px 2px 10px rgba(0,0,0,0.5);'>
+        <div style='text-align: center;'>
+            <h2 style='color: #ffffff; margin-bottom: 5px; font-weight: 800;'>🔴⚫ AC Milan</h2>
+        </div>
+        <hr style='border-color: #e32221; margin-top: 15px; margin-bottom: 20px;'>
+        <div style='color: white; line-height: 1.8; font-size: 15px;'>
+            <p><b>🔴⚫ Tifoso du Milan</b> (plus de 600 matchs dans ma collection)</p>
+            <p>Je cherche en continu de nouvelles vidéos pour étoffer ma collection : matchs complets toutes compétitions confondues (versions française ou italienne uniquement).</p>
+            <p>🎥 Si vous possédez des enregistrements du Milan, je suis preneur.</p>
+            <p>📩 Contactez-moi en DM pour proposer un échange ou une vente.</p>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+with col_france:
+    st.markdown("""
+    <div style='background-color: #0b2340; padding: 25px; border-radius: 15px; border: 2px solid #1a5fb4; box-shadow: 2px 2px 10px rgba(0,0,0,0.5);'>
+        <div style='text-align: center;'>
+            <h2 style='color: #ffffff; margin-bottom: 5px; font-weight: 800;'>Mondial 1998 (France 98)</h2>
+        </div>
+        <hr style='border-color: #1a5fb4; margin-top: 15px; margin-bottom: 20px;'>
+        <div style='color: white; line-height: 1.8; font-size: 15px;'>
+            <p><b>✨ Projet France 98 :</b> construire l’archive idéale.</p>
+            <p>Mon but : je cherche à réunir les 64 matchs du tournoi en meilleure qualité possible, avec toutes les versions TV françaises (TF1, France TV, Canal+, Eurosport...). Il m'en manque encore !!!</p>
+            <p>🎞️ Matchs complets, résumés, magazines : tout m’intéresse.</p>
+            <p>🗂️ Je recherche aussi les avant/après-match et émissions spéciales.</p>
+            <p>📩 Contactez-moi en DM pour proposer un échange ou une vente.</p>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
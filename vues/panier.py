@@ -0,0 +1,128 @@
+# ==========================================
+# PAGE : LE PANIER MAGIQUE (PRIX & CHOIX)
+# ==========================================
+import streamlit as st
+import urllib.parse
+from panier import retirer_du_panier
+from tarifs import ARTICLES_PAR_OFFERT, PRIX_FORMATS, devis_panier, prix_article
+from commun import aller_a, rafraichir_panier
+
+CONTENU_PANIER = "contenu_panier"
+
+def retirer_ligne(cle):
+    retirer_du_panier(st.session_state.panier, cle)
+    rafraichir_panier(CONTENU_PANIER)
+
+def vider_panier():
+    st.session_state.panier = {}
+    rafraichir_panier(CONTENU_PANIER)
+
+# Lignes, récapitulatif et commande forment un seul fragment : changer un format ou retirer un match
+# ne redessine que lui (et la pastille du panier), pas la barre latérale ni le reste de l'application
+@st.fragment(key=CONTENU_PANIER)
+def contenu_panier():
+    if len(st.session_state.panier) == 0:
+        st.info("Votre panier est vide pour le moment. Naviguez dans le catalogue pour ajouter des matchs !")
+        if st.button("Retourner à l'accueil"):
+            aller_a('accueil')
+    else:
+        st.markdown(f"**Vous avez sélectionné {len(st.session_state.panier)} match(s).**")
+        st.write("---")
+
+        for cle, match in st.session_state.panier.items():
+            col_info, col_fmt, col_btn = st.columns([5, 2, 1])
+
+            date_m = match.get('Date', '?')
+            comp_m = match.get('Compétition', '?')
+            dom_m = match.get('Domicile', '')
+            ext_m = match.get('Extérieur', '')
+
+            has_dvd = match['has_dvd']
+            has_num = match['has_num']
+            a_defaut = match['a_defaut']
+            commentaire = str(match.get('Commentaires sur fichier', '')).strip()
+
+            with col_info:
+                st.markdown(f"🗓️ **{date_m}** | 🏆 {comp_m}<br>⚔️ **{dom_m} - {ext_m}**", unsafe_allow_html=True)
+                if a_defaut:
+                    st.markdown(f"<span style='color: #d97706; font-size: 13px;'>🩹 <i>Archive imparfaite : {commentaire}</i></span>", unsafe_allow_html=True)
+
+            with col_fmt:
+                p_dvd = prix_article('DVD', a_defaut)
+                p_num = prix_article('Numérique', a_defaut)
+                lbl_dvd = f"💿 DVD ({p_dvd}€ au lieu de {PRIX_FORMATS['DVD']}€)" if a_defaut else f"💿 DVD ({p_dvd}€)"
+                lbl_num = f"💻 Numérique ({p_num}€ au lieu de {PRIX_FORMATS['Numérique']}€)" if a_defaut else f"💻 Numérique ({p_num}€)"
+
+                if has_dvd and has_num:
+                    idx_actuel = 0 if match.get('format_choisi') == 'DVD' else 1
+                    choix_fmt = st.selectbox("Format :", [lbl_dvd, lbl_num], key=f"fmt_sel_{cle}", index=idx_actuel)
+                    match['format_choisi'] = 'DVD' if 'DVD' in choix_fmt else 'Numérique'
+                elif has_dvd and not has_num:
+                    st.markdown(f"<div style='margin-top: 30px; font-weight: 500; font-size: 15px;'>{lbl_dvd}</div>", unsafe_allow_html=True)
+                    match['format_choisi'] = 'DVD'
+                else:
+                    st.markdown(f"<div style='margin-top: 30px; font-weight: 500; font-size: 15px;'>{lbl_num}</div>", unsafe_allow_html=True)
+                    match['format_choisi'] = 'Numérique'
+
+            with col_btn:
+                st.markdown("<div style='margin-top: 25px;'></div>", unsafe_allow_html=True)
+                st.button("❌ Retirer", key=f"del_cart_{cle}", on_click=retirer_ligne, args=(cle,))
+
+            st.divider()
+
+        # Devis calculé une fois les formats choisis (cf. tarifs.devis_panier)
+        devis = devis_panier(st.session_state.panier)
+
+        st.subheader("💳 Récapitulatif")
+        st.markdown(f"**Sous-total brut :** {devis.sous_total} €")
+
+        if devis.remise_defauts > 0:
+            st.info(f"🩹 **Archive Imparfaite :** Une remise a été appliquée pour compenser l'usure du temps (qualité altérée, fichier incomplet...) sur vos bandes. (-{devis.remise_defauts} €)")
+
+        if devis.reduction_gratuits > 0:
+            st.success(f"🎁 **Offre Spéciale :** La valeur de vos {devis.nb_gratuits} match(s) offert(s) a été déduite ! (-{devis.reduction_gratuits} €)")
+
+        st.markdown(f"### **Total à payer : {devis.total} €**")
+        st.write("---")
+
+        st.write("---")
+        st.subheader("📩 Valider ma commande")
+        st.markdown("Choisissez votre méthode préférée pour m'envoyer votre sélection :")
+
+        texte_recap = "Bonjour, je souhaite commander ces matchs vus dans Le Grenier :\n\n"
+        for match in st.session_state.panier.values():
+            fmt_r = match.get('format_choisi', 'Numérique')
+            txt_defaut = " [Archive Imparfaite]" if match['a_defaut'] else ""
+            texte_recap += f"- [{fmt_r}]{txt_defaut} {match.get('Date', '?')} | {match.get('Domicile', '')} vs {match.get('Extérieur', '')} ({match.get('Compétition', '?')})\n"
+
+        texte_recap += f"\nTotal d'articles : {devis.nb_articles}"
+        if devis.remise_defauts > 0:
+            texte_recap += f"\nRemise Archive Imparfaite : -{devis.remise_defauts}€"
+        if devis.reduction_gratuits > 0:
+            texte_recap += f"\nRéduction appliquée ({ARTICLES_PAR_OFFERT}ème offert) : -{devis.reduction_gratuits}€"
+        texte_recap += f"\nMontant Total : {devis.total}€"
+        texte_recap += "\n\nMerci de me donner les détails pour le paiement !"
+
+        col_mail, col_copy = st.columns(2)
+
+        with col_mail:
+            with st.container(border=True):
+                st.markdown("<h4 style='text-align: center;'>📧 Option 1 : Par E-mail</h4>", unsafe_allow_html=True)
+                st.markdown("<p style='text-align: center; color: gray; font-size: 14px;'>Votre application d'e-mail va s'ouvrir automatiquement avec le récapitulatif.</p>", unsafe_allow_html=True)
+
+                sujet_mail = "Nouvelle commande - Le Grenier du Football"
+                lien_mailto = f"mailto:legrenierdufootball@hotmail.com?subject={urllib.parse.quote(sujet_mail)}&body={urllib.parse.quote(texte_recap)}"
+
+                st.link_button("🚀 Envoyer ma commande par E-mail", lien_mailto, use_container_width=True)
+
+        with col_copy:
+            with st.container(border=True):
+                st.markdown("<h4 style='text-align: center;'>💬 Option 2 : Par Message Privé</h4>", unsafe_allow_html=True)
+                st.markdown("<p style='text-align: center; color: gray; font-size: 14px;'>Copiez le texte ci-dessous et envoyez-le moi sur les réseaux sociaux.</p>", unsafe_allow_html=True)
+                st.code(texte_recap, language="text")
+
+        st.write("")
+        st.button("🗑️ Vider tout le panier", type="secondary", on_click=vider_panier)
+
+st.header("🛒 Mon Panier")
+contenu_panier()
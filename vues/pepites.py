@@ -0,0 +1,19 @@
+# ==========================================
+# PAGE : ARCHIVES DÉPOUSSIÉRÉES
+# ==========================================
+import streamlit as st
+from commun import afficher_resultats, catalogue_courant
+
+CATALOGUE = catalogue_courant()
+df = CATALOGUE.df
+
+st.header("✨ Les Archives Dépoussiérées")
+st.markdown("<p style='color: gray; font-size:16px;'>Voici les 200 derniers matchs fraîchement exhumés des cartons et ajoutés au catalogue !</p>", unsafe_allow_html=True)
+st.write("---")
+
+if 'Match' in df.columns:
+    df_pepites = df.sort_values(by='Match', ascending=False).head(200)
+else:
+    df_pepites = df.tail(200).iloc[::-1]
+
+afficher_resultats(df_pepites)
@@ -0,0 +1,52 @@
+# ==========================================
+# PAGE : PROGRESSION DE LA COLLECTION
+# ==========================================
+import streamlit as st
+from commun import catalogue_courant
+
+CATALOGUE = catalogue_courant()
+df = CATALOGUE.df
+INDEX_ARBO = CATALOGUE.index_arbo
+
+st.header("🎯 Progression de la Collection")
+st.divider()
+
+if 'Phase' in df.columns:
+    feuille_cdm = INDEX_ARBO.feuilles["FILTER_CDM_FINALE"]
+    feuille_euro = INDEX_ARBO.feuilles["FILTER_EURO_FINALE"]
+    feuille_c1 = INDEX_ARBO.feuilles["FILTER_C1"]
+
+    cdm_possedees = len(feuille_cdm.editions_finales)
+    total_cdm = 22
+    pct_cdm = min(100, int((cdm_possedees / total_cdm) * 100))
+
+    euro_possedees = len(feuille_euro.editions_finales)
+    total_euro = 17
+    pct_euro = min(100, int((euro_possedees / total_euro) * 100))
+
+    c1_possedees = feuille_c1.saisons_finales
+    total_c1 = 69
+    pct_c1 = min(100, int((c1_possedees / total_c1) * 100))
+
+    col_prog1, col_prog2, col_prog3 = st.columns(3)
+    with col_prog1:
+        st.markdown(f"**Coupe du Monde** ({cdm_possedees}/{total_cdm})")
+        st.progress(pct_cdm / 100.0, text=f"{pct_cdm}% des Finales")
+    with col_prog2:
+        st.markdown(f"**Euro** ({euro_possedees}/{total_euro})")
+        st.progress(pct_euro / 100.0, text=f"{pct_euro}% des Finales")
+    with col_prog3:
+        st.markdown(f"**Ligue des Champions** ({c1_possedees}/{total_c1})")
+        st.progress(pct_c1 / 100.0, text=f"{pct_c1}% des Finales")
+
+    st.write("---")
+    eds_cdm = len(feuille_cdm.editions)
+    eds_euro = len(feuille_euro.editions)
+
+    st.markdown(f"**Éditions de Coupe du Monde :** {eds_cdm}/{total_cdm}")
+    st.progress(min(1.0, eds_cdm/total_cdm))
+    st.write("")
+    st.markdown(f"**Éditions d'Euro :** {eds_euro}/{total_euro}")
+    st.progress(min(1.0, eds_euro/total_euro))
+else:
+    st.warning("La colonne 'Phase' n'est pas présente dans votre fichier pour calculer les finales.")
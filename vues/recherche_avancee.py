@@ -0,0 +1,51 @@
+# ==========================================
+# PAGE : RECHERCHE AVANCÉE (AVEC FILTRE QUALITÉ)
+# ==========================================
+import streamlit as st
+from mesures import mesure
+from requetes import filtre_recherche
+from commun import afficher_resultats, catalogue_courant, moteur_recherche
+
+CATALOGUE = catalogue_courant()
+df = CATALOGUE.df
+VOCABULAIRE = CATALOGUE.vocabulaire
+
+st.header("🕵️ Recherche Avancée")
+
+toutes_les_equipes = VOCABULAIRE.equipes
+competitions = VOCABULAIRE.options.get('Compétition', [])
+phases = VOCABULAIRE.options.get('Phase', [])
+stades = VOCABULAIRE.options.get('Stade', [])
+saisons = VOCABULAIRE.options.get('Saison', [])
+
+def_comp = []
+cible_comp = st.session_state.get('recherche_comp_cible')
+if cible_comp and cible_comp in VOCABULAIRE.rangs.get('Compétition', {}):
+    def_comp = [cible_comp]
+
+col1, col2 = st.columns(2)
+with col1:
+    f_equipes = st.multiselect("🛡️ Équipes impliquées :", toutes_les_equipes)
+with col2:
+    f_comps = st.multiselect("🏆 Compétitions :", competitions, default=def_comp)
+
+col3, col4, col5, col6 = st.columns(4)
+with col3:
+    f_phases = st.multiselect("⏱️ Phase :", phases) if phases else []
+with col4:
+    f_stades = st.multiselect("🏟️ Stade :", stades) if stades else []
+with col5:
+    f_saisons = st.multiselect("🗓️ Saisons :", saisons) if saisons else []
+with col6:
+    qualites_dispo = ["Toutes", "DVD/VOB", "Numérique (MP4, AVI...)"]
+    choix_qualite = st.selectbox("💾 Qualité vidéo :", qualites_dispo)
+
+formats = {"DVD/VOB": 'dvd', "Numérique (MP4, AVI...)": 'numerique'}
+filtre = filtre_recherche(f_equipes, f_comps, f_phases, f_stades, f_saisons, formats.get(choix_qualite))
+with mesure("filtre") as m:
+    positions_filtre = moteur_recherche(CATALOGUE.version, CATALOGUE).positions(filtre)
+    df_filtre = df if positions_filtre is None else df.iloc[positions_filtre]
+    m.resultats = len(df_filtre)
+
+st.write("---")
+afficher_resultats(df_filtre)
@@ -0,0 +1,39 @@
+# ==========================================
+# PAGE : RECHERCHE PAR DATE
+# ==========================================
+import streamlit as st
+import pandas as pd
+from indexation import positions_jour, positions_periode
+from mesures import mesure
+from commun import afficher_resultats, catalogue_courant
+
+CATALOGUE = catalogue_courant()
+df = CATALOGUE.df
+INDEX_DATES = CATALOGUE.index_dates
+
+st.header("🔎 Recherche par Date")
+mode_date = st.radio("Type de recherche :", ["📅 Jour anniversaire", "🗓️ Période"], horizontal=True, label_visibility="collapsed")
+mois_francais = ["Janvier", "Février", "Mars", "Avril", "Mai", "Juin", "Juillet", "Août", "Septembre", "Octobre", "Novembre", "Décembre"]
+jours_semaine = ["Lundi", "Mardi", "Mercredi", "Jeudi", "Vendredi", "Samedi", "Dimanche"]
+
+if mode_date == "📅 Jour anniversaire":
+    c1, c2 = st.columns(2)
+    jours_possibles = [str(i) for i in range(1, 32)]
+    with c1: jour_choisi = st.selectbox("Jour", jours_possibles)
+    with c2: mois_choisi = st.selectbox("Mois", mois_francais)
+    mois_num = mois_francais.index(mois_choisi) + 1
+    positions_date = positions_jour(INDEX_DATES, mois_num, int(jour_choisi))
+else:
+    premiere_date = pd.Timestamp(INDEX_DATES.dates_triees[0]).date() if len(INDEX_DATES.ordre) else None
+    derniere_date = pd.Timestamp(INDEX_DATES.dates_triees[-1]).date() if len(INDEX_DATES.ordre) else None
+    c1, c2, c3 = st.columns(3)
+    with c1: debut = st.date_input("Du", value=premiere_date, min_value=premiere_date, max_value=derniere_date, format="DD/MM/YYYY")
+    with c2: fin = st.date_input("Au", value=derniere_date, min_value=premiere_date, max_value=derniere_date, format="DD/MM/YYYY")
+    with c3: jours_choisis = st.multiselect("Jours de la semaine", jours_semaine, placeholder="Tous les jours")
+    with mesure("filtre") as m:
+        positions_date = positions_periode(INDEX_DATES, debut, fin, [jours_semaine.index(j) for j in jours_choisis])
+        m.resultats = len(positions_date)
+
+df_date = df.iloc[positions_date]
+st.write("---")
+afficher_resultats(df_date)
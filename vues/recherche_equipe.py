@@ -0,0 +1,28 @@
+# ==========================================
+# PAGE : RECHERCHE PAR ÉQUIPE
+# ==========================================
+import streamlit as st
+from indexation import positions_equipe
+from mesures import mesure
+from commun import afficher_resultats, catalogue_courant
+
+CATALOGUE = catalogue_courant()
+df = CATALOGUE.df
+INDEX_EQUIPES = CATALOGUE.index_equipes
+VOCABULAIRE = CATALOGUE.vocabulaire
+
+st.header("🛡️ Recherche par Équipe")
+toutes_les_equipes = VOCABULAIRE.equipes
+
+idx_defaut = 0
+cible = st.session_state.get('recherche_equipe_cible')
+if cible and cible in VOCABULAIRE.rang_equipe:
+    idx_defaut = VOCABULAIRE.rang_equipe[cible]
+
+choix = st.selectbox("Sélectionne une équipe :", toutes_les_equipes, index=idx_defaut)
+st.session_state.recherche_equipe_cible = choix 
+
+with mesure("filtre") as m:
+    df_filtre = df.iloc[positions_equipe(INDEX_EQUIPES, choix)]
+    m.resultats = len(df_filtre)
+afficher_resultats(df_filtre)
@@ -0,0 +1,63 @@
+# ==========================================
+# PAGE : STATISTIQUES
+# ==========================================
+import streamlit as st
+from mesures import mesure
+from statistiques import statistiques_catalogue  # Plotly n'est chargé qu'à la première visite de cette page
+from commun import catalogue_courant
+
+@st.cache_resource(max_entries=2)
+def charger_statistiques(version, _df):
+    # Comptages et figures ne sont recalculés que si matchs.csv change
+    return statistiques_catalogue(_df)
+
+CATALOGUE = catalogue_courant()
+df = CATALOGUE.df
+
+st.header("📊 Le Bilan de l'Inventaire")
+st.markdown("<p style='color: gray; font-size:16px;'>Plongez dans les archives du Grenier à travers ces infographies.</p>", unsafe_allow_html=True)
+st.write("---")
+
+with mesure("agregation"):
+    _, figures = charger_statistiques(CATALOGUE.version, df)
+
+c1, c2 = st.columns(2)
+
+with c1:
+    st.markdown("### ⏳ Les Époques Traversées")
+    st.caption("L'évolution chronologique du catalogue, saison par saison.")
+    st.plotly_chart(figures['saisons'], use_container_width=True)
+
+with c2:
+    st.markdown("### 🌍 Le Profil des Compétitions")
+    st.caption("La répartition entre clubs, nations et tournois.")
+    if 'types' in figures:
+        st.plotly_chart(figures['types'], use_container_width=True)
+
+st.write("---")
+
+c3, c4 = st.columns(2)
+
+with c3:
+    st.markdown("### 🛡️ Les Locataires du Grenier")
+    st.caption("Les 10 équipes les plus archivées.")
+    st.plotly_chart(figures['equipes'], use_container_width=True)
+
+with c4:
+    st.markdown("### ⚔️ Les Classiques du Grenier")
+    st.caption("Les 10 affiches les plus répertoriées.")
+    st.plotly_chart(figures['affiches'], use_container_width=True)
+
+st.write("---")
+
+c5, c6 = st.columns(2)
+
+with c5:
+    st.markdown("### 📻 L'Audimat d'Époque")
+    st.caption("Les chaînes de télévision d'origine les plus représentées.")
+    st.plotly_chart(figures['diffuseurs'], use_container_width=True)
+
+with c6:
+    st.markdown("### 📼 L'Inventaire Technique")
+    st.caption("La répartition des supports et formats de conservation.")
+    st.plotly_chart(figures['formats'], use_container_width=True)